@@ -0,0 +1,84 @@
+import sys
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from stockstats import wrap
+from tradingagents.dataflows.indicator_engine import INDICATOR_FUNCTIONS, compute_indicator
+
+# Roughly 15 years of daily bars, matching the price store default
+N_BARS = 15 * 252
+LOOK_BACK_DAYS = 30
+REPEATS = 5
+
+
+def make_prices(n_bars: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_bars)))
+    spread = np.abs(rng.normal(0, 0.01, n_bars)) * close
+    return pd.DataFrame(
+        {
+            "Date": pd.bdate_range("2010-01-01", periods=n_bars),
+            "Open": close + rng.normal(0, 0.005, n_bars) * close,
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, n_bars),
+        }
+    )
+
+
+def stockstats_path(prices: pd.DataFrame, indicator: str) -> dict:
+    """The previous _get_stock_stats_bulk: stockstats + iterrows + str()."""
+    df = wrap(prices.copy())
+    df["Date"] = pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d")
+    df[indicator]
+    result_dict = {}
+    for _, row in df.iterrows():
+        value = row[indicator]
+        result_dict[row["Date"]] = "N/A" if pd.isna(value) else str(value)
+    return result_dict
+
+
+def native_path(prices: pd.DataFrame, indicator: str) -> dict:
+    """The vectorized engine, rendering only the look-back window."""
+    values = compute_indicator(prices, indicator)
+    window = values.iloc[-LOOK_BACK_DAYS:]
+    return {
+        date: "N/A" if pd.isna(value) else str(value)
+        for date, value in zip(window.index.strftime("%Y-%m-%d"), window.tolist())
+    }
+
+
+def best_of(func, *args) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmark():
+    prices = make_prices(N_BARS)
+    print(f"Benchmarking {len(INDICATOR_FUNCTIONS)} indicators on {N_BARS} bars (best of {REPEATS})\n")
+    print(f"{'indicator':<14}{'stockstats ms':>15}{'native ms':>12}{'speedup':>10}{'max abs diff':>15}")
+
+    for indicator in INDICATOR_FUNCTIONS:
+        old_ms = best_of(stockstats_path, prices, indicator) * 1000
+        new_ms = best_of(native_path, prices, indicator) * 1000
+
+        expected = wrap(prices.copy())[indicator].to_numpy(dtype=float)
+        actual = compute_indicator(prices, indicator).to_numpy()
+        max_diff = np.nanmax(np.abs(expected - actual))
+
+        print(f"{indicator:<14}{old_ms:>15.2f}{new_ms:>12.2f}{old_ms / new_ms:>9.1f}x{max_diff:>15.2e}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
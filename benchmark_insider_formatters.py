@@ -0,0 +1,96 @@
+import sys
+import os
+import json
+import random
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from tradingagents.dataflows import local
+from tradingagents.dataflows.config import set_config
+
+TICKER = "SYNTH"
+CURR_DATE = "2024-06-30"
+DAYS = 16  # the formatters look back 15 days
+REPEATS = 3
+
+
+def make_transactions(per_day: int, duplicate_ratio: float) -> dict:
+    """Busy insider days; a share of the filings is repeated on later days."""
+    rng = random.Random(42)
+    data, filed = {}, []
+    for day in range(DAYS):
+        date = f"2024-06-{15 + day:02d}"
+        entries = []
+        for i in range(per_day):
+            if filed and rng.random() < duplicate_ratio:
+                entries.append(dict(rng.choice(filed)))
+                continue
+            entry = {
+                "name": f"Insider {rng.randrange(200)}",
+                "share": rng.randrange(1, 1_000_000),
+                "change": rng.randrange(-50_000, 50_000),
+                "filingDate": date,
+                "transactionDate": date,
+                "transactionCode": rng.choice("SPMAF"),
+                "transactionPrice": round(rng.uniform(10, 500), 2),
+                "id": f"{date}-{i}",
+                "isDerivative": False,
+                "currency": "USD",
+                "symbol": TICKER,
+                "source": "sec",
+            }
+            filed.append(entry)
+            entries.append(entry)
+        data[date] = entries
+    return data
+
+
+def baseline_transactions(data: dict) -> str:
+    """The previous formatter body: list membership dedup and += rendering."""
+    result_str = ""
+    seen_dicts = []
+    for date, senti_list in data.items():
+        for entry in senti_list:
+            if entry not in seen_dicts:
+                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
+                seen_dicts.append(entry)
+    return result_str
+
+
+def best_of(func, *args) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmark():
+    data_dir = tempfile.mkdtemp()
+    set_config({"data_cache_dir": os.path.join(data_dir, "cache")})
+    local.DATA_DIR = data_dir
+    trans_dir = os.path.join(data_dir, "finnhub_data", "insider_trans")
+    os.makedirs(trans_dir)
+    path = os.path.join(trans_dir, f"{TICKER}_data_formatted.json")
+
+    print(f"{'entries/day':>12} {'entries':>8} {'baseline s':>11} {'pipeline s':>11} {'speedup':>8}")
+    for per_day in (100, 500, 1000):
+        data = make_transactions(per_day, duplicate_ratio=0.3)
+        with open(path, "w") as f:
+            json.dump(data, f)
+        # Warm the Finnhub store so only formatting is timed
+        report = local.get_finnhub_company_insider_transactions(TICKER, CURR_DATE)
+
+        loaded = local.get_data_in_range(TICKER, "2024-06-15", CURR_DATE, "insider_trans", data_dir)
+        old = best_of(baseline_transactions, loaded)
+        new = best_of(local.get_finnhub_company_insider_transactions, TICKER, CURR_DATE)
+        assert report.count("### Filing Date") == baseline_transactions(loaded).count("### Filing Date")
+        print(f"{per_day:>12} {per_day * DAYS:>8} {old:>11.4f} {new:>11.4f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,127 @@
+import sys
+import os
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import StructuredTool
+from langgraph.prebuilt import ToolNode
+
+from tradingagents.graph.conditional_logic import ConditionalLogic
+from tradingagents.graph.propagation import Propagator
+from tradingagents.graph.setup import ANALYST_REPORT_KEYS, GraphSetup
+
+TICKER = "SYNTH"
+TRADE_DATE = "2024-06-28"
+LLM_LATENCY = 0.5  # seconds per simulated LLM call
+TOOL_LATENCY = 0.3  # seconds per simulated tool call
+ANALYST_TOOLS = {
+    "market": ["get_stock_data", "get_indicators"],
+    "social": ["get_news"],
+    "news": ["get_news", "get_global_news", "get_insider_sentiment", "get_insider_transactions"],
+    "fundamentals": ["get_fundamentals", "get_balance_sheet", "get_cashflow", "get_income_statement"],
+}
+
+
+class SlowChatModel(BaseChatModel):
+    """Deterministic chat model with a fixed latency per call.
+
+    Bound to tools, it calls each tool once and then answers with a report
+    built from the tool results; otherwise it echoes the size of the prompt.
+    """
+
+    latency: float = LLM_LATENCY
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(tool_names=[tool.name for tool in tools], **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, tool_names=None, **kwargs):
+        time.sleep(self.latency)
+        results = [m.content for m in messages if isinstance(m, ToolMessage)]
+        if tool_names and len(results) < len(tool_names):
+            name = tool_names[len(results)]
+            message = AIMessage(
+                content="",
+                tool_calls=[{"name": name, "args": {}, "id": f"call_{name}"}],
+            )
+        elif tool_names:
+            message = AIMessage(content="Report:\n" + "\n".join(results))
+        else:
+            prompt = "".join(str(m.content) for m in messages)
+            message = AIMessage(content=f"Argument over {len(prompt)} characters of context")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class NoMemory:
+    def get_memories(self, current_situation, n_matches=1):
+        return []
+
+
+def slow_tool(name: str) -> StructuredTool:
+    def run() -> str:
+        time.sleep(TOOL_LATENCY)
+        return f"{name} data for {TICKER}"
+
+    return StructuredTool.from_function(run, name=name, description=f"Simulated {name}")
+
+
+def build_graph(parallel_analysts: bool, parallel_debate_openings: bool = False):
+    llm = SlowChatModel()
+    tool_nodes = {
+        analyst: ToolNode([slow_tool(name) for name in names])
+        for analyst, names in ANALYST_TOOLS.items()
+    }
+    setup = GraphSetup(
+        llm, llm, tool_nodes,
+        NoMemory(), NoMemory(), NoMemory(), NoMemory(), NoMemory(),
+        ConditionalLogic(),
+    )
+    return setup.setup_graph(
+        list(ANALYST_TOOLS),
+        parallel_analysts=parallel_analysts,
+        parallel_debate_openings=parallel_debate_openings,
+    )
+
+
+def run_once(parallel_analysts: bool, parallel_debate_openings: bool = False):
+    graph = build_graph(parallel_analysts, parallel_debate_openings)
+    propagator = Propagator()
+    state = propagator.create_initial_state(TICKER, TRADE_DATE)
+    start = time.perf_counter()
+    final_state = graph.invoke(state, config={"recursion_limit": propagator.max_recur_limit})
+    return time.perf_counter() - start, final_state
+
+
+def run_benchmark():
+    sequential_s, sequential = run_once(parallel_analysts=False)
+    parallel_s, parallel = run_once(parallel_analysts=True)
+    openings_s, openings = run_once(parallel_analysts=True, parallel_debate_openings=True)
+
+    for report_key in ANALYST_REPORT_KEYS.values():
+        assert sequential[report_key] == parallel[report_key], f"{report_key} differs between modes"
+    assert sequential["final_trade_decision"] == parallel["final_trade_decision"]
+    # Concurrent openings change what the bear opens against, not the debate shape
+    sequential_debate, openings_debate = sequential["investment_debate_state"], openings["investment_debate_state"]
+    assert set(sequential_debate) == set(openings_debate)
+    assert sequential_debate["count"] == openings_debate["count"]
+    assert openings_debate["current_response"].startswith("Bear")
+
+    print(f"Simulated latency: {LLM_LATENCY}s per LLM call, {TOOL_LATENCY}s per tool call")
+    print(f"{'mode':>12} {'end-to-end s':>13}")
+    print(f"{'sequential':>12} {sequential_s:>13.2f}")
+    print(f"{'parallel':>12} {parallel_s:>13.2f}")
+    print(f"{'+ openings':>12} {openings_s:>13.2f}")
+    print(f"Parallel analysts: {sequential_s / parallel_s:.1f}x, reports identical")
+    print(f"Parallel analysts and debate openings: {sequential_s / openings_s:.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark()
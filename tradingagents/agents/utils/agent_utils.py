@@ -19,6 +19,22 @@ from tradingagents.agents.utils.news_data_tools import (
     get_insider_transactions,
     get_global_news
 )
+from tradingagents.agents.utils.tool_memo import memoize_tool
+
+# Identical tool calls within one propagate() are served from the run memo
+for _tool in (
+    get_stock_data,
+    get_indicators,
+    get_fundamentals,
+    get_balance_sheet,
+    get_cashflow,
+    get_income_statement,
+    get_news,
+    get_insider_sentiment,
+    get_insider_transactions,
+    get_global_news,
+):
+    memoize_tool(_tool)
 
 def create_msg_delete():
     def delete_messages(state):
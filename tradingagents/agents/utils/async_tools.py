@@ -0,0 +1,12 @@
+def async_implementation(sync_tool):
+    """Register the decorated coroutine as the async implementation of ``sync_tool``.
+
+    ``ToolNode`` (and ``tool.ainvoke``) then await the coroutine instead of
+    running the sync function in a thread; ``tool.invoke`` is unchanged. The
+    coroutine must take the same arguments as the tool.
+    """
+    def decorator(coroutine):
+        sync_tool.coroutine = coroutine
+        return coroutine
+
+    return decorator
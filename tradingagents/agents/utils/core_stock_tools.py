@@ -1,6 +1,8 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import aroute_to_vendor, route_to_vendor
+from tradingagents.dataflows.tool_output import render_tool_output
+from tradingagents.agents.utils.async_tools import async_implementation
 
 
 @tool
@@ -19,4 +21,9 @@ def get_stock_data(
     Returns:
         str: A formatted dataframe containing the stock price data for the specified ticker symbol in the specified date range.
     """
-    return route_to_vendor("get_stock_data", symbol, start_date, end_date)
+    return render_tool_output("get_stock_data", route_to_vendor("get_stock_data", symbol, start_date, end_date))
+
+
+@async_implementation(get_stock_data)
+async def aget_stock_data(symbol: str, start_date: str, end_date: str) -> str:
+    return render_tool_output("get_stock_data", await aroute_to_vendor("get_stock_data", symbol, start_date, end_date))
@@ -1,6 +1,8 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import aroute_to_vendor, route_to_vendor
+from tradingagents.dataflows.tool_output import render_tool_output
+from tradingagents.agents.utils.async_tools import async_implementation
 
 
 @tool
@@ -17,7 +19,12 @@ def get_fundamentals(
     Returns:
         str: A formatted report containing comprehensive fundamental data
     """
-    return route_to_vendor("get_fundamentals", ticker, curr_date)
+    return render_tool_output("get_fundamentals", route_to_vendor("get_fundamentals", ticker, curr_date))
+
+
+@async_implementation(get_fundamentals)
+async def aget_fundamentals(ticker: str, curr_date: str) -> str:
+    return render_tool_output("get_fundamentals", await aroute_to_vendor("get_fundamentals", ticker, curr_date))
 
 
 @tool
@@ -36,7 +43,12 @@ def get_balance_sheet(
     Returns:
         str: A formatted report containing balance sheet data
     """
-    return route_to_vendor("get_balance_sheet", ticker, freq, curr_date)
+    return render_tool_output("get_balance_sheet", route_to_vendor("get_balance_sheet", ticker, freq, curr_date))
+
+
+@async_implementation(get_balance_sheet)
+async def aget_balance_sheet(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    return render_tool_output("get_balance_sheet", await aroute_to_vendor("get_balance_sheet", ticker, freq, curr_date))
 
 
 @tool
@@ -55,7 +67,12 @@ def get_cashflow(
     Returns:
         str: A formatted report containing cash flow statement data
     """
-    return route_to_vendor("get_cashflow", ticker, freq, curr_date)
+    return render_tool_output("get_cashflow", route_to_vendor("get_cashflow", ticker, freq, curr_date))
+
+
+@async_implementation(get_cashflow)
+async def aget_cashflow(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    return render_tool_output("get_cashflow", await aroute_to_vendor("get_cashflow", ticker, freq, curr_date))
 
 
 @tool
@@ -74,4 +91,9 @@ def get_income_statement(
     Returns:
         str: A formatted report containing income statement data
     """
-    return route_to_vendor("get_income_statement", ticker, freq, curr_date)
\ No newline at end of file
+    return render_tool_output("get_income_statement", route_to_vendor("get_income_statement", ticker, freq, curr_date))
+
+
+@async_implementation(get_income_statement)
+async def aget_income_statement(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    return render_tool_output("get_income_statement", await aroute_to_vendor("get_income_statement", ticker, freq, curr_date))
@@ -1,6 +1,8 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import aroute_to_vendor, route_to_vendor
+from tradingagents.dataflows.tool_output import render_tool_output
+from tradingagents.agents.utils.async_tools import async_implementation
 
 @tool
 def get_news(
@@ -18,7 +20,12 @@ def get_news(
     Returns:
         str: A formatted string containing news data
     """
-    return route_to_vendor("get_news", ticker, start_date, end_date)
+    return render_tool_output("get_news", route_to_vendor("get_news", ticker, start_date, end_date))
+
+
+@async_implementation(get_news)
+async def aget_news(ticker: str, start_date: str, end_date: str) -> str:
+    return render_tool_output("get_news", await aroute_to_vendor("get_news", ticker, start_date, end_date))
 
 @tool
 def get_global_news(
@@ -36,7 +43,12 @@ def get_global_news(
     Returns:
         str: A formatted string containing global news data
     """
-    return route_to_vendor("get_global_news", curr_date, look_back_days, limit)
+    return render_tool_output("get_global_news", route_to_vendor("get_global_news", curr_date, look_back_days, limit))
+
+
+@async_implementation(get_global_news)
+async def aget_global_news(curr_date: str, look_back_days: int = 7, limit: int = 5) -> str:
+    return render_tool_output("get_global_news", await aroute_to_vendor("get_global_news", curr_date, look_back_days, limit))
 
 @tool
 def get_insider_sentiment(
@@ -52,7 +64,12 @@ def get_insider_sentiment(
     Returns:
         str: A report of insider sentiment data
     """
-    return route_to_vendor("get_insider_sentiment", ticker, curr_date)
+    return render_tool_output("get_insider_sentiment", route_to_vendor("get_insider_sentiment", ticker, curr_date))
+
+
+@async_implementation(get_insider_sentiment)
+async def aget_insider_sentiment(ticker: str, curr_date: str) -> str:
+    return render_tool_output("get_insider_sentiment", await aroute_to_vendor("get_insider_sentiment", ticker, curr_date))
 
 @tool
 def get_insider_transactions(
@@ -68,4 +85,9 @@ def get_insider_transactions(
     Returns:
         str: A report of insider transaction data
     """
-    return route_to_vendor("get_insider_transactions", ticker, curr_date)
+    return render_tool_output("get_insider_transactions", route_to_vendor("get_insider_transactions", ticker, curr_date))
+
+
+@async_implementation(get_insider_transactions)
+async def aget_insider_transactions(ticker: str, curr_date: str) -> str:
+    return render_tool_output("get_insider_transactions", await aroute_to_vendor("get_insider_transactions", ticker, curr_date))
@@ -1,6 +1,8 @@
 from langchain_core.tools import tool
 from typing import Annotated
-from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.interface import aroute_to_vendor, route_to_vendor
+from tradingagents.dataflows.tool_output import render_tool_output
+from tradingagents.agents.utils.async_tools import async_implementation
 
 @tool
 def get_indicators(
@@ -20,4 +22,9 @@ def get_indicators(
     Returns:
         str: A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator.
     """
-    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
\ No newline at end of file
+    return render_tool_output("get_indicators", route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days))
+
+
+@async_implementation(get_indicators)
+async def aget_indicators(symbol: str, indicator: str, curr_date: str, look_back_days: int = 30) -> str:
+    return render_tool_output("get_indicators", await aroute_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days))
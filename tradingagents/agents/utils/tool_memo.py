@@ -0,0 +1,172 @@
+"""
+Run-scoped memoization of the agent tools.
+
+Within one ``propagate`` several analysts often issue the same tool call (e.g.
+``get_news`` for the same ticker and window), and an analyst may repeat a call
+after a tool round-trip. While a ``tool_memo_run`` is active, identical calls,
+keyed on the tool name and its canonicalized arguments, are answered from
+memory. Identical calls running at the same time share one execution. Memoized
+results are dropped when the run ends.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from tradingagents.dataflows.config import get_config
+from tradingagents.dataflows.telemetry import record_tool_memo
+
+# Arguments naming a ticker are matched case-insensitively
+_TICKER_ARGS = ("symbol", "ticker")
+
+_active_memo: ContextVar[Optional["ToolCallMemo"]] = ContextVar("tool_call_memo", default=None)
+
+
+class ToolCallMemo:
+    """Results of the tool calls made during one run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> Future of the result
+        self._durations = {}  # key -> seconds the first call took
+        self.calls = 0
+        self.saved_calls = 0
+        self.saved_seconds = 0.0
+        self.saved_by_tool = {}
+
+    def _claim(self, key: str):
+        """Return (future, owner); the owner must run the call and resolve the future."""
+        with self._lock:
+            self.calls += 1
+            future = self._entries.get(key)
+            if future is not None:
+                return future, False
+            future = self._entries[key] = Future()
+            return future, True
+
+    def _record_hit(self, key: str, tool_name: str) -> None:
+        with self._lock:
+            self.saved_calls += 1
+            self.saved_seconds += self._durations.get(key, 0.0)
+            self.saved_by_tool[tool_name] = self.saved_by_tool.get(tool_name, 0) + 1
+
+    def _resolve(self, key: str, future: Future, result=None, error: BaseException = None, duration: float = 0.0) -> None:
+        with self._lock:
+            if error is None:
+                self._durations[key] = duration
+            else:
+                # Failed calls are not memoized; the next caller retries
+                self._entries.pop(key, None)
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def call(self, tool_name: str, key: str, func, args, kwargs):
+        future, owner = self._claim(key)
+        if not owner:
+            result = future.result()
+            self._record_hit(key, tool_name)
+            return result
+
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            self._resolve(key, future, error=e)
+            raise
+        self._resolve(key, future, result, duration=time.perf_counter() - start)
+        return result
+
+    async def acall(self, tool_name: str, key: str, coroutine, args, kwargs):
+        future, owner = self._claim(key)
+        if not owner:
+            result = await asyncio.wrap_future(future)
+            self._record_hit(key, tool_name)
+            return result
+
+        start = time.perf_counter()
+        try:
+            result = await coroutine(*args, **kwargs)
+        except BaseException as e:
+            self._resolve(key, future, error=e)
+            raise
+        self._resolve(key, future, result, duration=time.perf_counter() - start)
+        return result
+
+    def stats(self) -> dict:
+        """Tool calls made, calls served from memory and the tool time they saved."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "saved_calls": self.saved_calls,
+                "saved_seconds": round(self.saved_seconds, 3),
+                "saved_by_tool": dict(self.saved_by_tool),
+            }
+
+
+def _canonical_key(tool_name: str, signature: inspect.Signature, args, kwargs) -> str:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = {}
+    for name, value in bound.arguments.items():
+        if isinstance(value, str):
+            value = value.strip()
+            if name in _TICKER_ARGS:
+                value = value.upper()
+        arguments[name] = value
+    return json.dumps([tool_name, arguments], sort_keys=True, default=str)
+
+
+def memoize_tool(tool):
+    """Route ``tool`` (sync and async implementation) through the active run's memo."""
+    if getattr(tool.func, "_memoized", False):
+        return tool
+    func, coroutine = tool.func, tool.coroutine
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def memoized(*args, **kwargs):
+        memo = _active_memo.get()
+        if memo is None:
+            return func(*args, **kwargs)
+        return memo.call(tool.name, _canonical_key(tool.name, signature, args, kwargs), func, args, kwargs)
+
+    @functools.wraps(coroutine or func)
+    async def amemoized(*args, **kwargs):
+        memo = _active_memo.get()
+        if memo is None:
+            return await coroutine(*args, **kwargs)
+        return await memo.acall(tool.name, _canonical_key(tool.name, signature, args, kwargs), coroutine, args, kwargs)
+
+    memoized._memoized = True
+    tool.func = memoized
+    if coroutine is not None:
+        tool.coroutine = amemoized
+    return tool
+
+
+@contextmanager
+def tool_memo_run():
+    """Memoize tool calls made inside the block (and the threads/tasks it starts).
+
+    Yields the run's ToolCallMemo, or None when ``tool_memo_enabled`` is off.
+    Its stats are reported as a "tool_memo" telemetry event when the block ends.
+    """
+    if not get_config().get("tool_memo_enabled", True):
+        yield None
+        return
+    memo = ToolCallMemo()
+    token = _active_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _active_memo.reset(token)
+        record_tool_memo(memo.stats())
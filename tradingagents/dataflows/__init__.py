@@ -0,0 +1,10 @@
+from .price_store import prefetch_prices
+from .telemetry import dump_latency_histograms, get_latency_histograms
+from .tool_output import get_tool_output_stats
+
+__all__ = [
+    "prefetch_prices",
+    "dump_latency_histograms",
+    "get_latency_histograms",
+    "get_tool_output_stats",
+]
@@ -1,12 +1,47 @@
+import asyncio
 import os
-import requests
 import pandas as pd
 import json
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime, timedelta
 from io import StringIO
+from zoneinfo import ZoneInfo
+
+from .config import get_config
+from .disk_cache import DiskCache
+from .http_session import ahttp_get, http_get
+from .telemetry import record_queue_wait
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+# Response cache TTLs in seconds; "next_close" keeps the entry until the next
+# US market close. Functions not listed here are never cached.
+FUNDAMENTALS_TTL = 7 * 24 * 3600
+NEWS_TTL = 15 * 60
+CACHE_TTLS = {
+    "OVERVIEW": FUNDAMENTALS_TTL,
+    "BALANCE_SHEET": FUNDAMENTALS_TTL,
+    "CASH_FLOW": FUNDAMENTALS_TTL,
+    "INCOME_STATEMENT": FUNDAMENTALS_TTL,
+    "INSIDER_TRANSACTIONS": 24 * 3600,
+    "NEWS_SENTIMENT": NEWS_TTL,
+    "TIME_SERIES_DAILY_ADJUSTED": "next_close",
+    "SMA": "next_close",
+    "EMA": "next_close",
+    "MACD": "next_close",
+    "RSI": "next_close",
+    "BBANDS": "next_close",
+    "ATR": "next_close",
+}
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_CLOSE_HOUR = 16
+
+_response_cache = DiskCache("alpha_vantage", max_bytes_key="alpha_vantage_cache_max_bytes")
+
 def get_api_key() -> str:
     """Retrieve the API key for Alpha Vantage from environment variables."""
     api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -39,12 +74,309 @@ class AlphaVantageRateLimitError(Exception):
     """Exception raised when Alpha Vantage API rate limit is exceeded."""
     pass
 
-def _make_api_request(function_name: str, params: dict) -> dict | str:
+class _RateLimiter:
+    """Thread-safe token bucket for per-minute calls plus a rolling 24h quota.
+
+    Callers block until a slot frees up instead of hitting the API limit.
+    Limits come from the ``alpha_vantage_calls_per_*`` config values; None
+    (the default) disables that limit. Free-tier keys should set 5 per minute
+    and 25 per day.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._tokens = None
+        self._updated = time.monotonic()
+        self._day_calls = deque()
+        self.calls = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.shared = 0
+
+    def _refill(self, per_minute: int, now: float) -> None:
+        if self._tokens is None:
+            self._tokens = float(per_minute)
+        self._tokens = min(per_minute, self._tokens + (now - self._updated) * per_minute / 60.0)
+        self._updated = now
+
+    def _try_take(self, start: float) -> float | None:
+        """Take a slot (returns None) or return the seconds to wait first.
+
+        Caller holds ``self._cond``.
+        """
+        config = get_config()
+        per_minute = config.get("alpha_vantage_calls_per_minute")
+        per_day = config.get("alpha_vantage_calls_per_day")
+        max_queue_wait = config.get("alpha_vantage_max_queue_wait", 60)
+
+        now = time.monotonic()
+        while self._day_calls and now - self._day_calls[0] >= 24 * 3600:
+            self._day_calls.popleft()
+        if per_day is not None and len(self._day_calls) >= per_day:
+            raise AlphaVantageRateLimitError(
+                f"Alpha Vantage daily quota of {per_day} calls used up"
+            )
+
+        if per_minute is None:
+            self._day_calls.append(now)
+            self.calls += 1
+            return None
+
+        self._refill(per_minute, now)
+        if self._tokens < 1:
+            delay = (1 - self._tokens) * 60.0 / per_minute
+            if now - start + delay > max_queue_wait:
+                raise AlphaVantageRateLimitError(
+                    f"Alpha Vantage request queue wait exceeded {max_queue_wait}s"
+                )
+            return delay
+
+        self._tokens -= 1
+        self._day_calls.append(now)
+        self.calls += 1
+        return None
+
+    def _record_wait(self, waited: float) -> None:
+        """Caller holds ``self._cond``."""
+        self.waits += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def acquire(self, function_name: str = None) -> float:
+        """Take one call slot, waiting for it if needed; return the seconds waited.
+
+        Waits are reported through ``telemetry.record_queue_wait``.
+
+        Raises:
+            AlphaVantageRateLimitError: When the daily quota is used up or the
+                wait would exceed ``alpha_vantage_max_queue_wait``
+        """
+        start = time.monotonic()
+        queued = False
+        with self._cond:
+            while True:
+                delay = self._try_take(start)
+                if delay is None:
+                    break
+                queued = True
+                self._cond.wait(delay)
+            waited = time.monotonic() - start if queued else 0.0
+            if queued:
+                self._record_wait(waited)
+        if queued:
+            record_queue_wait("alpha_vantage", function_name, waited)
+        return waited
+
+    async def aacquire(self, function_name: str = None) -> float:
+        """Async ``acquire``: waits with ``asyncio.sleep`` instead of blocking."""
+        start = time.monotonic()
+        queued = False
+        while True:
+            with self._cond:
+                delay = self._try_take(start)
+                if delay is None:
+                    waited = time.monotonic() - start if queued else 0.0
+                    if queued:
+                        self._record_wait(waited)
+                    break
+            queued = True
+            await asyncio.sleep(delay)
+        if queued:
+            record_queue_wait("alpha_vantage", function_name, waited)
+        return waited
+
+    def record_shared(self) -> None:
+        with self._cond:
+            self.shared += 1
+
+    def drain(self) -> None:
+        """Empty the bucket after the API itself reported the rate limit."""
+        with self._cond:
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "calls": self.calls,
+                "calls_last_24h": len(self._day_calls),
+                "waits": self.waits,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+                "avg_wait": self.total_wait / self.waits if self.waits else 0.0,
+                "shared_in_flight": self.shared,
+            }
+
+
+_rate_limiter = _RateLimiter()
+
+# Cache key hash -> Future of the HTTP call currently serving that request
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+# (event loop, cache key hash) -> asyncio.Task running the same, for async callers
+_async_in_flight = {}
+
+def get_rate_limiter_stats() -> dict:
+    """Return call counts and queue wait times of the Alpha Vantage limiter."""
+    return _rate_limiter.stats()
+
+def _next_market_close(now: datetime | None = None) -> datetime:
+    """Return the next weekday 16:00 New York time after ``now``."""
+    now = now or datetime.now(MARKET_TZ)
+    close = now.replace(hour=MARKET_CLOSE_HOUR, minute=0, second=0, microsecond=0)
+    if close <= now:
+        close += timedelta(days=1)
+    while close.weekday() >= 5:
+        close += timedelta(days=1)
+    return close
+
+def _cache_expiry(function_name: str, params: dict) -> float | None:
+    """Return the epoch expiry of a response, or None if it should not be cached."""
+    ttl = get_config().get("alpha_vantage_cache_ttls", {}).get(function_name, CACHE_TTLS.get(function_name))
+    if ttl is None:
+        return None
+
+    # News windows that closed before today no longer change
+    if function_name == "NEWS_SENTIMENT" and params.get("time_to"):
+        try:
+            time_to = datetime.strptime(params["time_to"], "%Y%m%dT%H%M")
+            if time_to.date() < datetime.now().date():
+                ttl = FUNDAMENTALS_TTL
+        except ValueError:
+            pass
+
+    if ttl == "next_close":
+        return _next_market_close().timestamp()
+    return time.time() + ttl
+
+def _cache_key(function_name: str, params: dict) -> dict:
+    """Normalize request params into a cache key, without the API key."""
+    key = {"function": function_name}
+    for name, value in params.items():
+        if name in ("apikey", "source", "function") or value is None or value == "":
+            continue
+        value = str(value).strip()
+        if name in ("symbol", "tickers"):
+            value = value.upper()
+        key[name] = value
+    return key
+
+def _is_cacheable(response_text: str) -> bool:
+    """Error and notice payloads are JSON objects with a single message field."""
+    try:
+        response_json = json.loads(response_text)
+    except json.JSONDecodeError:
+        return bool(response_text.strip())
+    if not isinstance(response_json, dict) or not response_json:
+        return False
+    return not any(field in response_json for field in ("Information", "Note", "Error Message"))
+
+def clear_response_cache() -> None:
+    """Remove every cached Alpha Vantage response."""
+    _response_cache.clear()
+
+def get_response_cache_stats() -> dict:
+    """Return hit/miss counters of the Alpha Vantage response cache."""
+    return _response_cache.stats()
+
+def _lookup_cache(function_name: str, api_params: dict, bypass_cache: bool):
+    """Return (cache key, expiry or None when not cacheable, cached response or None)."""
+    use_cache = get_config().get("alpha_vantage_cache_enabled", True)
+    cache_key = _cache_key(function_name, api_params)
+    expires_at = _cache_expiry(function_name, api_params) if use_cache else None
+    cached = None
+    if expires_at is not None and not bypass_cache:
+        cached = _response_cache.get(cache_key)
+    return cache_key, expires_at, cached
+
+def _make_api_request(function_name: str, params: dict, bypass_cache: bool = False) -> dict | str:
     """Helper function to make API requests and handle responses.
-    
+
+    Responses are served from the on-disk cache while their TTL lasts. Pass
+    ``bypass_cache=True`` (or set ``alpha_vantage_cache_enabled`` to False) to
+    always hit the API; a bypassed call still refreshes the cached entry.
+    Network calls go through the shared rate limiter, and identical requests
+    issued concurrently wait on the same in-flight call.
+
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    api_params = _prepare_params(function_name, params)
+
+    cache_key, expires_at, cached = _lookup_cache(function_name, api_params, bypass_cache)
+    if cached is not None:
+        return cached
+
+    # Identical concurrent requests share a single HTTP call
+    request_id = DiskCache.make_key(cache_key)
+    with _in_flight_lock:
+        future = _in_flight.get(request_id)
+        owner = future is None
+        if owner:
+            future = Future()
+            _in_flight[request_id] = future
+    if not owner:
+        _rate_limiter.record_shared()
+        return future.result()
+
+    try:
+        response_text = _fetch_response(api_params)
+        if expires_at is not None and _is_cacheable(response_text):
+            _response_cache.set(cache_key, response_text, expires_at)
+        future.set_result(response_text)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(request_id, None)
+
+    return response_text
+
+async def _amake_api_request(function_name: str, params: dict, bypass_cache: bool = False) -> dict | str:
+    """Async ``_make_api_request``: same cache, rate limiter and in-flight sharing.
+
     Raises:
         AlphaVantageRateLimitError: When API rate limit is exceeded
     """
+    api_params = _prepare_params(function_name, params)
+
+    cache_key, expires_at, cached = _lookup_cache(function_name, api_params, bypass_cache)
+    if cached is not None:
+        return cached
+
+    # Identical concurrent requests on this event loop share a single HTTP call.
+    # The call runs as its own task, so cancelling any one caller (e.g. the
+    # loser of a hedged race) leaves the others waiting on it unaffected.
+    loop = asyncio.get_running_loop()
+    request_id = (loop, DiskCache.make_key(cache_key))
+    task = _async_in_flight.get(request_id)
+    if task is not None:
+        _rate_limiter.record_shared()
+        return await asyncio.shield(task)
+
+    task = _async_in_flight[request_id] = loop.create_task(
+        _afetch_and_store(api_params, cache_key, expires_at)
+    )
+    task.add_done_callback(lambda done: _finish_in_flight(request_id, done))
+    return await asyncio.shield(task)
+
+async def _afetch_and_store(api_params: dict, cache_key: dict, expires_at) -> str:
+    response_text = await _afetch_response(api_params)
+    if expires_at is not None and _is_cacheable(response_text):
+        _response_cache.set(cache_key, response_text, expires_at)
+    return response_text
+
+def _finish_in_flight(request_id: tuple, task: asyncio.Task) -> None:
+    if _async_in_flight.get(request_id) is task:
+        del _async_in_flight[request_id]
+    if not task.cancelled():
+        # Mark the exception as retrieved when every caller was cancelled
+        task.exception()
+
+def _prepare_params(function_name: str, params: dict) -> dict:
+    """Add function, API key and entitlement to a copy of ``params``."""
     # Create a copy of params to avoid modifying the original
     api_params = params.copy()
     api_params.update({
@@ -62,12 +394,25 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     elif "entitlement" in api_params:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
-    
-    response = requests.get(API_BASE_URL, params=api_params)
+
+    return api_params
+
+def _fetch_response(api_params: dict) -> str:
+    """Send one rate-limited request and check the payload for limit notices."""
+    _rate_limiter.acquire(api_params.get("function"))
+    response = http_get(API_BASE_URL, params=api_params)
     response.raise_for_status()
+    return _check_response(response.text)
 
-    response_text = response.text
-    
+async def _afetch_response(api_params: dict) -> str:
+    """Async ``_fetch_response``."""
+    await _rate_limiter.aacquire(api_params.get("function"))
+    response = await ahttp_get(API_BASE_URL, params=api_params)
+    response.raise_for_status()
+    return _check_response(response.text)
+
+def _check_response(response_text: str) -> str:
+    """Raise AlphaVantageRateLimitError for rate limit notices; return the text."""
     # Check if response is JSON (error responses are typically JSON)
     try:
         response_json = json.loads(response_text)
@@ -75,6 +420,7 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
         if "Information" in response_json:
             info_message = response_json["Information"]
             if "rate limit" in info_message.lower() or "api key" in info_message.lower():
+                _rate_limiter.drain()
                 raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
     except json.JSONDecodeError:
         # Response is not JSON (likely CSV data), which is normal
@@ -1,4 +1,254 @@
-from .alpha_vantage_common import _make_api_request
+import asyncio
+from datetime import datetime
+from dateutil.relativedelta import relativedelta
+from .alpha_vantage_common import _amake_api_request, _make_api_request
+
+SUPPORTED_INDICATORS = {
+    "close_50_sma": ("50 SMA", "close"),
+    "close_200_sma": ("200 SMA", "close"),
+    "close_10_ema": ("10 EMA", "close"),
+    "macd": ("MACD", "close"),
+    "macds": ("MACD Signal", "close"),
+    "macdh": ("MACD Histogram", "close"),
+    "rsi": ("RSI", "close"),
+    "boll": ("Bollinger Middle", "close"),
+    "boll_ub": ("Bollinger Upper Band", "close"),
+    "boll_lb": ("Bollinger Lower Band", "close"),
+    "atr": ("ATR", None),
+    "vwma": ("VWMA", "close")
+}
+
+INDICATOR_DESCRIPTIONS = {
+    "close_50_sma": "50 SMA: A medium-term trend indicator. Usage: Identify trend direction and serve as dynamic support/resistance. Tips: It lags price; combine with faster indicators for timely signals.",
+    "close_200_sma": "200 SMA: A long-term trend benchmark. Usage: Confirm overall market trend and identify golden/death cross setups. Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries.",
+    "close_10_ema": "10 EMA: A responsive short-term average. Usage: Capture quick shifts in momentum and potential entry points. Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals.",
+    "macd": "MACD: Computes momentum via differences of EMAs. Usage: Look for crossovers and divergence as signals of trend changes. Tips: Confirm with other indicators in low-volatility or sideways markets.",
+    "macds": "MACD Signal: An EMA smoothing of the MACD line. Usage: Use crossovers with the MACD line to trigger trades. Tips: Should be part of a broader strategy to avoid false positives.",
+    "macdh": "MACD Histogram: Shows the gap between the MACD line and its signal. Usage: Visualize momentum strength and spot divergence early. Tips: Can be volatile; complement with additional filters in fast-moving markets.",
+    "rsi": "RSI: Measures momentum to flag overbought/oversold conditions. Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis.",
+    "boll": "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. Usage: Acts as a dynamic benchmark for price movement. Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals.",
+    "boll_ub": "Bollinger Upper Band: Typically 2 standard deviations above the middle line. Usage: Signals potential overbought conditions and breakout zones. Tips: Confirm signals with other tools; prices may ride the band in strong trends.",
+    "boll_lb": "Bollinger Lower Band: Typically 2 standard deviations below the middle line. Usage: Indicates potential oversold conditions. Tips: Use additional analysis to avoid false reversal signals.",
+    "atr": "ATR: Averages true range to measure volatility. Usage: Set stop-loss levels and adjust position sizes based on current market volatility. Tips: It's a reactive measure, so use it as part of a broader risk management strategy.",
+    "vwma": "VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+}
+
+# Map internal indicator names to expected CSV column names from Alpha Vantage
+COLUMN_NAMES = {
+    "macd": "MACD", "macds": "MACD_Signal", "macdh": "MACD_Hist",
+    "boll": "Real Middle Band", "boll_ub": "Real Upper Band", "boll_lb": "Real Lower Band",
+    "rsi": "RSI", "atr": "ATR", "close_10_ema": "EMA",
+    "close_50_sma": "SMA", "close_200_sma": "SMA"
+}
+
+
+def _indicator_request(
+    symbol: str,
+    indicator: str,
+    interval: str,
+    time_period: int,
+    series_type: str,
+):
+    """
+    Build the Alpha Vantage (function, params) pair serving an indicator.
+
+    Indicators of one family (macd/macds/macdh, boll/boll_ub/boll_lb) map to
+    the same request. Returns None for indicators Alpha Vantage cannot serve.
+    """
+    # Use the provided series_type or fall back to the required one
+    _, required_series_type = SUPPORTED_INDICATORS[indicator]
+    if required_series_type:
+        series_type = required_series_type
+
+    if indicator == "close_50_sma":
+        return "SMA", {
+            "symbol": symbol,
+            "interval": interval,
+            "time_period": "50",
+            "series_type": series_type,
+            "datatype": "csv"
+        }
+    if indicator == "close_200_sma":
+        return "SMA", {
+            "symbol": symbol,
+            "interval": interval,
+            "time_period": "200",
+            "series_type": series_type,
+            "datatype": "csv"
+        }
+    if indicator == "close_10_ema":
+        return "EMA", {
+            "symbol": symbol,
+            "interval": interval,
+            "time_period": "10",
+            "series_type": series_type,
+            "datatype": "csv"
+        }
+    if indicator in ["macd", "macds", "macdh"]:
+        return "MACD", {
+            "symbol": symbol,
+            "interval": interval,
+            "series_type": series_type,
+            "datatype": "csv"
+        }
+    if indicator == "rsi":
+        return "RSI", {
+            "symbol": symbol,
+            "interval": interval,
+            "time_period": str(time_period),
+            "series_type": series_type,
+            "datatype": "csv"
+        }
+    if indicator in ["boll", "boll_ub", "boll_lb"]:
+        return "BBANDS", {
+            "symbol": symbol,
+            "interval": interval,
+            "time_period": "20",
+            "series_type": series_type,
+            "datatype": "csv"
+        }
+    if indicator == "atr":
+        return "ATR", {
+            "symbol": symbol,
+            "interval": interval,
+            "time_period": str(time_period),
+            "datatype": "csv"
+        }
+    # Alpha Vantage doesn't have direct VWMA
+    return None
+
+
+def _request_key(function_name: str, params: dict) -> tuple:
+    return function_name, tuple(sorted(params.items()))
+
+
+def _parse_indicator_values(data: str, indicator: str, before: datetime, curr_date_dt: datetime) -> list:
+    """
+    Extract (date, value) pairs for one indicator column within [before, curr_date_dt].
+
+    Raises:
+        ValueError: When the response does not contain the expected columns
+    """
+    lines = data.strip().split('\n')
+    if len(lines) < 2:
+        raise ValueError(f"No data returned for {indicator}")
+
+    # Parse header and data
+    header = [col.strip() for col in lines[0].split(',')]
+    try:
+        date_col_idx = header.index('time')
+    except ValueError:
+        raise ValueError(f"'time' column not found in data for {indicator}. Available columns: {header}")
+
+    target_col_name = COLUMN_NAMES.get(indicator)
+
+    if not target_col_name:
+        # Default to the second column if no specific mapping exists
+        value_col_idx = 1
+    else:
+        try:
+            value_col_idx = header.index(target_col_name)
+        except ValueError:
+            raise ValueError(f"Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}")
+
+    result_data = []
+    for line in lines[1:]:
+        if not line.strip():
+            continue
+        values = line.split(',')
+        if len(values) > value_col_idx:
+            try:
+                date_str = values[date_col_idx].strip()
+                # Parse the date
+                date_dt = datetime.strptime(date_str, "%Y-%m-%d")
+
+                # Check if date is in our range
+                if before <= date_dt <= curr_date_dt:
+                    value = values[value_col_idx].strip()
+                    result_data.append((date_dt, value))
+            except (ValueError, IndexError):
+                continue
+
+    # Sort by date
+    result_data.sort(key=lambda x: x[0])
+    return result_data
+
+
+def _get_indicator_table(
+    symbol: str,
+    indicators: list,
+    curr_date: str,
+    look_back_days: int,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    request_fn=_make_api_request,
+) -> str:
+    """
+    Fetch several indicators with one API request per indicator family and
+    render them as a single window table (one row per date, one column per
+    indicator).
+    """
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+
+    columns = {}
+    errors = []
+    responses = {}
+    for indicator in dict.fromkeys(indicators):
+        if indicator not in SUPPORTED_INDICATORS:
+            errors.append(
+                f"Error for {indicator}: Indicator {indicator} is not supported. Please choose from: {list(SUPPORTED_INDICATORS.keys())}"
+            )
+            continue
+
+        request = _indicator_request(symbol, indicator, interval, time_period, series_type)
+        if request is None:
+            errors.append(
+                f"Error for {indicator}: {indicator.upper()} calculation requires OHLCV data and is not directly available from Alpha Vantage API."
+            )
+            continue
+
+        # Family members share one response (e.g. macd/macds/macdh -> MACD)
+        function_name, params = request
+        request_key = _request_key(function_name, params)
+        try:
+            if request_key not in responses:
+                try:
+                    responses[request_key] = request_fn(function_name, params)
+                except Exception as e:
+                    responses[request_key] = e
+            response = responses[request_key]
+            if isinstance(response, Exception):
+                raise response
+            columns[indicator] = dict(_parse_indicator_values(response, indicator, before, curr_date_dt))
+        except Exception as e:
+            print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
+            errors.append(f"Error for {indicator}: {e}")
+
+    if not columns:
+        return "\n\n".join(errors)
+
+    names = list(columns.keys())
+    dates = sorted(set().union(*(values.keys() for values in columns.values())))
+
+    rows = ["Date," + ",".join(names)]
+    for date_dt in dates:
+        rows.append(
+            date_dt.strftime('%Y-%m-%d') + ","
+            + ",".join(columns[name].get(date_dt, "N/A") for name in names)
+        )
+    if not dates:
+        rows.append("No data available for the specified date range.")
+
+    sections = [
+        f"## {', '.join(name.upper() for name in names)} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+        + "\n".join(rows)
+    ]
+    sections.extend(INDICATOR_DESCRIPTIONS.get(name, "No description available.") for name in names)
+    sections.extend(errors)
+    return "\n\n".join(sections)
+
 
 def get_indicator(
     symbol: str,
@@ -15,6 +265,7 @@ def get_indicator(
     Args:
         symbol: ticker symbol of the company
         indicator: technical indicator to get the analysis and report of
+            (comma-separated names return one combined table)
         curr_date: The current trading date you are trading on, YYYY-mm-dd
         look_back_days: how many days to look back
         interval: Time interval (daily, weekly, monthly)
@@ -24,194 +275,85 @@ def get_indicator(
     Returns:
         String containing indicator values and description
     """
-    from datetime import datetime
-    from dateutil.relativedelta import relativedelta
-
-    supported_indicators = {
-        "close_50_sma": ("50 SMA", "close"),
-        "close_200_sma": ("200 SMA", "close"),
-        "close_10_ema": ("10 EMA", "close"),
-        "macd": ("MACD", "close"),
-        "macds": ("MACD Signal", "close"),
-        "macdh": ("MACD Histogram", "close"),
-        "rsi": ("RSI", "close"),
-        "boll": ("Bollinger Middle", "close"),
-        "boll_ub": ("Bollinger Upper Band", "close"),
-        "boll_lb": ("Bollinger Lower Band", "close"),
-        "atr": ("ATR", None),
-        "vwma": ("VWMA", "close")
-    }
-
-    indicator_descriptions = {
-        "close_50_sma": "50 SMA: A medium-term trend indicator. Usage: Identify trend direction and serve as dynamic support/resistance. Tips: It lags price; combine with faster indicators for timely signals.",
-        "close_200_sma": "200 SMA: A long-term trend benchmark. Usage: Confirm overall market trend and identify golden/death cross setups. Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries.",
-        "close_10_ema": "10 EMA: A responsive short-term average. Usage: Capture quick shifts in momentum and potential entry points. Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals.",
-        "macd": "MACD: Computes momentum via differences of EMAs. Usage: Look for crossovers and divergence as signals of trend changes. Tips: Confirm with other indicators in low-volatility or sideways markets.",
-        "macds": "MACD Signal: An EMA smoothing of the MACD line. Usage: Use crossovers with the MACD line to trigger trades. Tips: Should be part of a broader strategy to avoid false positives.",
-        "macdh": "MACD Histogram: Shows the gap between the MACD line and its signal. Usage: Visualize momentum strength and spot divergence early. Tips: Can be volatile; complement with additional filters in fast-moving markets.",
-        "rsi": "RSI: Measures momentum to flag overbought/oversold conditions. Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis.",
-        "boll": "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. Usage: Acts as a dynamic benchmark for price movement. Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals.",
-        "boll_ub": "Bollinger Upper Band: Typically 2 standard deviations above the middle line. Usage: Signals potential overbought conditions and breakout zones. Tips: Confirm signals with other tools; prices may ride the band in strong trends.",
-        "boll_lb": "Bollinger Lower Band: Typically 2 standard deviations below the middle line. Usage: Indicates potential oversold conditions. Tips: Use additional analysis to avoid false reversal signals.",
-        "atr": "ATR: Averages true range to measure volatility. Usage: Set stop-loss levels and adjust position sizes based on current market volatility. Tips: It's a reactive measure, so use it as part of a broader risk management strategy.",
-        "vwma": "VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-    }
-
-    # Handle multiple indicators (comma-separated)
+    return _get_indicator(
+        symbol, indicator, curr_date, look_back_days, interval, time_period, series_type, _make_api_request
+    )
+
+
+async def aget_indicator(
+    symbol: str,
+    indicator: str,
+    curr_date: str,
+    look_back_days: int,
+    interval: str = "daily",
+    time_period: int = 14,
+    series_type: str = "close"
+) -> str:
+    """Async ``get_indicator``: the needed requests are fetched concurrently first."""
+    names = [ind.strip() for ind in indicator.split(",") if ind.strip()]
+    requests = {}
+    for name in names:
+        if name in SUPPORTED_INDICATORS:
+            request = _indicator_request(symbol, name, interval, time_period, series_type)
+            if request is not None:
+                requests[_request_key(*request)] = request
+
+    responses = await asyncio.gather(
+        *(_amake_api_request(*request) for request in requests.values()), return_exceptions=True
+    )
+    prefetched = dict(zip(requests, responses))
+
+    def request_fn(function_name: str, params: dict) -> str:
+        response = prefetched[_request_key(function_name, params)]
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    return _get_indicator(
+        symbol, indicator, curr_date, look_back_days, interval, time_period, series_type, request_fn
+    )
+
+
+def _get_indicator(
+    symbol: str,
+    indicator: str,
+    curr_date: str,
+    look_back_days: int,
+    interval: str,
+    time_period: int,
+    series_type: str,
+    request_fn,
+) -> str:
+    """Body of ``get_indicator``; ``request_fn(function_name, params)`` serves the responses."""
+    # Handle multiple indicators (comma-separated) with one request per family
     if "," in indicator:
         indicators = [ind.strip() for ind in indicator.split(",") if ind.strip()]
-        results = []
-        for ind in indicators:
-            try:
-                # Recursively call for each indicator
-                results.append(get_indicator(symbol, ind, curr_date, look_back_days, interval, time_period, series_type))
-            except Exception as e:
-                results.append(f"Error for {ind}: {e}")
-        return "\n\n".join(results)
+        return _get_indicator_table(
+            symbol, indicators, curr_date, look_back_days, interval, time_period, series_type, request_fn
+        )
 
-    if indicator not in supported_indicators:
+    if indicator not in SUPPORTED_INDICATORS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(supported_indicators.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(SUPPORTED_INDICATORS.keys())}"
         )
 
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
-    # Get the full data for the period instead of making individual calls
-    _, required_series_type = supported_indicators[indicator]
-
-    # Use the provided series_type or fall back to the required one
-    if required_series_type:
-        series_type = required_series_type
-
     try:
-        # Get indicator data for the period
-        if indicator == "close_50_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "50",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_200_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "200",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_10_ema":
-            data = _make_api_request("EMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "10",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macd":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macds":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macdh":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "rsi":
-            data = _make_api_request("RSI", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator in ["boll", "boll_ub", "boll_lb"]:
-            data = _make_api_request("BBANDS", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "20",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "atr":
-            data = _make_api_request("ATR", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "datatype": "csv"
-            })
-        elif indicator == "vwma":
-            # Alpha Vantage doesn't have direct VWMA, so we'll return an informative message
-            # In a real implementation, this would need to be calculated from OHLCV data
-            return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{indicator_descriptions.get('vwma', 'No description available.')}"
-        else:
-            return f"Error: Indicator {indicator} not implemented yet."
+        # Get the full data for the period instead of making individual calls
+        request = _indicator_request(symbol, indicator, interval, time_period, series_type)
+        if request is None:
+            # In a real implementation, VWMA would need to be calculated from OHLCV data
+            return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{INDICATOR_DESCRIPTIONS.get('vwma', 'No description available.')}"
 
-        # Parse CSV data and extract values for the date range
-        lines = data.strip().split('\n')
-        if len(lines) < 2:
-            return f"Error: No data returned for {indicator}"
+        data = request_fn(*request)
 
-        # Parse header and data
-        header = [col.strip() for col in lines[0].split(',')]
+        # Parse CSV data and extract values for the date range
         try:
-            date_col_idx = header.index('time')
-        except ValueError:
-            return f"Error: 'time' column not found in data for {indicator}. Available columns: {header}"
-
-        # Map internal indicator names to expected CSV column names from Alpha Vantage
-        col_name_map = {
-            "macd": "MACD", "macds": "MACD_Signal", "macdh": "MACD_Hist",
-            "boll": "Real Middle Band", "boll_ub": "Real Upper Band", "boll_lb": "Real Lower Band",
-            "rsi": "RSI", "atr": "ATR", "close_10_ema": "EMA",
-            "close_50_sma": "SMA", "close_200_sma": "SMA"
-        }
-
-        target_col_name = col_name_map.get(indicator)
-
-        if not target_col_name:
-            # Default to the second column if no specific mapping exists
-            value_col_idx = 1
-        else:
-            try:
-                value_col_idx = header.index(target_col_name)
-            except ValueError:
-                return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
-
-        result_data = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            values = line.split(',')
-            if len(values) > value_col_idx:
-                try:
-                    date_str = values[date_col_idx].strip()
-                    # Parse the date
-                    date_dt = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    # Check if date is in our range
-                    if before <= date_dt <= curr_date_dt:
-                        value = values[value_col_idx].strip()
-                        result_data.append((date_dt, value))
-                except (ValueError, IndexError):
-                    continue
-
-        # Sort by date and format output
-        result_data.sort(key=lambda x: x[0])
+            result_data = _parse_indicator_values(data, indicator, before, curr_date_dt)
+        except ValueError as e:
+            return f"Error: {e}"
 
         ind_string = ""
         for date_dt, value in result_data:
@@ -224,7 +366,7 @@ def get_indicator(
             f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
             + ind_string
             + "\n\n"
-            + indicator_descriptions.get(indicator, "No description available.")
+            + INDICATOR_DESCRIPTIONS.get(indicator, "No description available.")
         )
 
         return result_str
@@ -1,4 +1,6 @@
-from .alpha_vantage_common import _make_api_request, format_datetime_for_api
+from datetime import datetime, timedelta
+
+from .alpha_vantage_common import _amake_api_request, _make_api_request, format_datetime_for_api
 
 def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
     """Returns live and historical market news & sentiment data from premier news outlets worldwide.
@@ -14,15 +16,20 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         Dictionary containing news sentiment data or JSON string.
     """
 
-    params = {
+    return _make_api_request("NEWS_SENTIMENT", _news_params(ticker, start_date, end_date))
+
+async def aget_news(ticker, start_date, end_date) -> dict[str, str] | str:
+    """Async ``get_news``."""
+    return await _amake_api_request("NEWS_SENTIMENT", _news_params(ticker, start_date, end_date))
+
+def _news_params(ticker, start_date, end_date) -> dict:
+    return {
         "tickers": ticker,
         "time_from": format_datetime_for_api(start_date),
         "time_to": format_datetime_for_api(end_date),
         "sort": "LATEST",
         "limit": "50",
     }
-    
-    return _make_api_request("NEWS_SENTIMENT", params)
 
 def get_global_news(curr_date, look_back_days=7, limit=5) -> dict[str, str] | str:
     """Returns global market news via Alpha Vantage.
@@ -30,8 +37,13 @@ def get_global_news(curr_date, look_back_days=7, limit=5) -> dict[str, str] | st
     Uses 'EARNINGS,IPO,MERGERS_AND_ACQUISITIONS,TECHNOLOGY,FINANCIAL_MARKETS' topics 
     to approximate global market news since no specific global endpoint exists.
     """
-    from datetime import datetime, timedelta
-    
+    return _make_api_request("NEWS_SENTIMENT", _global_news_params(curr_date, look_back_days, limit))
+
+async def aget_global_news(curr_date, look_back_days=7, limit=5) -> dict[str, str] | str:
+    """Async ``get_global_news``."""
+    return await _amake_api_request("NEWS_SENTIMENT", _global_news_params(curr_date, look_back_days, limit))
+
+def _global_news_params(curr_date, look_back_days, limit) -> dict:
     # Calculate start date based on lookback
     if isinstance(curr_date, str):
         end_dt = datetime.strptime(curr_date, "%Y-%m-%d")
@@ -40,15 +52,13 @@ def get_global_news(curr_date, look_back_days=7, limit=5) -> dict[str, str] | st
         
     start_dt = end_dt - timedelta(days=look_back_days)
     
-    params = {
+    return {
         "topics": "financial_markets,economy_macro,earnings,ipo,mergers_and_acquisitions,technology",
         "time_from": format_datetime_for_api(start_dt.strftime("%Y-%m-%d")),
         "time_to": format_datetime_for_api(end_dt.strftime("%Y-%m-%d")),
         "sort": "LATEST",
         "limit": str(limit),
     }
-    
-    return _make_api_request("NEWS_SENTIMENT", params)
 
 def get_insider_transactions(symbol: str) -> dict[str, str] | str:
     """Returns latest and historical insider transactions by key stakeholders.
@@ -66,4 +76,8 @@ def get_insider_transactions(symbol: str) -> dict[str, str] | str:
         "symbol": symbol,
     }
 
-    return _make_api_request("INSIDER_TRANSACTIONS", params)
\ No newline at end of file
+    return _make_api_request("INSIDER_TRANSACTIONS", params)
+
+async def aget_insider_transactions(symbol: str) -> dict[str, str] | str:
+    """Async ``get_insider_transactions``."""
+    return await _amake_api_request("INSIDER_TRANSACTIONS", {"symbol": symbol})
@@ -0,0 +1,186 @@
+"""
+Small persistent key/value cache with per-entry expiry and size-based eviction.
+
+Entries live as one JSON file per key under ``data_cache_dir/<namespace>/``.
+Keys are arbitrary JSON-serializable objects (canonicalized and hashed), values
+are strings. The namespace's byte total is tracked as entries are written and
+removed; when it grows past the byte budget, the least recently used entries
+are evicted down to ``EVICT_TO`` of the budget, so the directory is only
+scanned once in a while rather than on every write.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from .config import get_config
+
+# Eviction frees space down to this fraction of the byte budget
+EVICT_TO = 0.9
+
+
+class DiskCache:
+    """Persistent string cache for one namespace of responses."""
+
+    def __init__(self, namespace: str, max_bytes_key: Optional[str] = None, default_max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            namespace: Sub-directory of ``data_cache_dir`` holding the entries
+            max_bytes_key: Config key overriding the byte budget
+            default_max_bytes: Byte budget when the config key is not set
+        """
+        self.namespace = namespace
+        self.max_bytes_key = max_bytes_key
+        self.default_max_bytes = default_max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Running byte total of the entries in ``_tracked_dir`` (None = not scanned yet)
+        self._total_bytes = None
+        self._tracked_dir = None
+
+    @property
+    def directory(self) -> str:
+        path = os.path.join(get_config()["data_cache_dir"], self.namespace)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @property
+    def max_bytes(self) -> int:
+        if self.max_bytes_key:
+            return get_config().get(self.max_bytes_key, self.default_max_bytes)
+        return self.default_max_bytes
+
+    @staticmethod
+    def make_key(key: Any) -> str:
+        """Hash a JSON-serializable key into a stable file name."""
+        canonical = json.dumps(key, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: Any) -> str:
+        return os.path.join(self.directory, f"{self.make_key(key)}.json")
+
+    def get(self, key: Any) -> Optional[str]:
+        """Return the cached value for ``key``, or None when missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            size = self._size(path)
+            self._remove(path)
+            with self._lock:
+                self.misses += 1
+            self._track(-size)
+            return None
+
+        # Touch the entry so eviction drops the least recently used first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return entry["value"]
+
+    def set(self, key: Any, value: str, expires_at: Optional[float] = None) -> None:
+        """Store ``value`` under ``key`` until ``expires_at`` (epoch seconds, None = forever)."""
+        path = self._path(key)
+        entry = {
+            "key": key,
+            "created_at": time.time(),
+            "expires_at": expires_at,
+            "value": value,
+        }
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, default=str)
+        replaced = self._size(path)
+        os.replace(tmp_path, path)
+        self._track(self._size(path) - replaced)
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _scan(self, directory: str):
+        """(mtime, size, path) of every entry in ``directory``, and their byte total."""
+        entries = []
+        total = 0
+        for item in os.scandir(directory):
+            if not item.name.endswith(".json"):
+                continue
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, item.path))
+            total += stat.st_size
+        return entries, total
+
+    def _track(self, delta: int) -> None:
+        """Add ``delta`` bytes to the running total and evict past the budget."""
+        directory = self.directory
+        with self._lock:
+            if self._tracked_dir != directory or self._total_bytes is None:
+                # First write to this directory (or data_cache_dir changed)
+                _, self._total_bytes = self._scan(directory)
+                self._tracked_dir = directory
+            else:
+                self._total_bytes += delta
+            if self._total_bytes > self.max_bytes:
+                self._evict(directory)
+
+    def _evict(self, directory: str) -> None:
+        # Rescan so entries written by other processes are accounted for
+        entries, total = self._scan(directory)
+        target = self.max_bytes * EVICT_TO
+        if total > self.max_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                self._remove(path)
+                total -= size
+                self.evictions += 1
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Remove every entry of this namespace."""
+        with self._lock:
+            directory = self.directory
+            for item in os.scandir(directory):
+                if item.name.endswith(".json"):
+                    self._remove(item.path)
+            self.hits = self.misses = self.evictions = 0
+            self._total_bytes = 0
+            self._tracked_dir = directory
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters of this process."""
+        with self._lock:
+            return {
+                "namespace": self.namespace,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
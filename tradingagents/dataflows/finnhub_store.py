@@ -0,0 +1,112 @@
+"""
+Date-sorted store of the local Finnhub data files.
+
+``finnhub_data/<data_type>/{ticker}[_{period}]_data_formatted.json`` maps dates
+to lists of records. Each file is ingested once into
+``data_cache_dir/finnhub_store.sqlite`` (one row per date, keyed by source file
+and date) and re-ingested only when the JSON file changes. Within a process the
+parsed rows of each file are kept as sorted arrays, so a date-range query is a
+binary search plus a slice.
+"""
+
+import bisect
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .config import get_config
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT NOT NULL,
+    date TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (path, date)
+) WITHOUT ROWID;
+"""
+
+_lock = threading.Lock()
+# source path -> (mtime, size, sorted dates, records per date)
+_stores = {}
+
+
+def get_store_path() -> str:
+    """Location of the SQLite store inside the data cache directory."""
+    cache_dir = get_config()["data_cache_dir"]
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "finnhub_store.sqlite")
+
+
+@contextmanager
+def _connect():
+    conn = sqlite3.connect(get_store_path(), timeout=30)
+    try:
+        conn.executescript(_SCHEMA)
+        yield conn
+    finally:
+        conn.close()
+
+
+def _ingest(conn, path: str, mtime: float, size: int) -> None:
+    """Replace the stored rows of ``path`` with the current JSON contents."""
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    conn.execute("DELETE FROM entries WHERE path = ?", (path,))
+    conn.executemany(
+        "INSERT INTO entries (path, date, payload) VALUES (?, ?, ?)",
+        [(path, date, json.dumps(records)) for date, records in data.items() if len(records) > 0],
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO sources (path, mtime, size) VALUES (?, ?, ?)",
+        (path, mtime, size),
+    )
+    conn.commit()
+
+
+def _load(path: str):
+    """Return (dates, records) of ``path``, ingesting or reloading as needed."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+
+    with _lock:
+        cached = _stores.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+            return cached[2], cached[3]
+
+        with _connect() as conn:
+            row = conn.execute("SELECT mtime, size FROM sources WHERE path = ?", (path,)).fetchone()
+            if row is None or tuple(row) != (stat.st_mtime, stat.st_size):
+                _ingest(conn, path, stat.st_mtime, stat.st_size)
+            rows = conn.execute(
+                "SELECT date, payload FROM entries WHERE path = ? ORDER BY date", (path,)
+            ).fetchall()
+
+        dates = [date for date, _ in rows]
+        records = [json.loads(payload) for _, payload in rows]
+        _stores[path] = (stat.st_mtime, stat.st_size, dates, records)
+        return dates, records
+
+
+def query_range(path: str, start_date: str, end_date: str) -> dict:
+    """Return {date: records} of the Finnhub file ``path`` for dates in [start_date, end_date].
+
+    Dates without records are left out.
+    """
+    dates, records = _load(path)
+    lo = bisect.bisect_left(dates, start_date)
+    hi = bisect.bisect_right(dates, end_date)
+    return dict(zip(dates[lo:hi], records[lo:hi]))
+
+
+def clear_finnhub_cache() -> None:
+    """Drop the parsed files kept in memory."""
+    with _lock:
+        _stores.clear()
@@ -1,22 +1,71 @@
 from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from .googlenews_utils import getNewsData
+from .config import get_config
+from .googlenews_utils import agetNewsData, getNewsData
 
 
 def get_google_news(
     query: Annotated[str, "Query to search with"],
     curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
+    limit: Annotated[int, "maximum number of articles to scrape, None for all"] = None,
 ) -> str:
+    query, before = _search_window(query, curr_date, look_back_days)
+    news_results = getNewsData(query, before, curr_date, limit)
+    return _format_news(query, before, curr_date, news_results)
+
+
+async def aget_google_news(
+    query: Annotated[str, "Query to search with"],
+    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+    limit: Annotated[int, "maximum number of articles to scrape, None for all"] = None,
+) -> str:
+    query, before = _search_window(query, curr_date, look_back_days)
+    news_results = await agetNewsData(query, before, curr_date, limit)
+    return _format_news(query, before, curr_date, news_results)
+
+
+def get_google_company_news(
+    query: Annotated[str, "Search query or ticker symbol"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    limit: Annotated[int, "maximum number of articles, default google_news_max_articles"] = None,
+) -> str:
+    """Google News for the routed ``get_news`` signature (query, start, end)."""
+    query, limit = _routed_query(query, limit)
+    news_results = getNewsData(query, start_date, end_date, limit)
+    return _format_news(query, start_date, end_date, news_results)
+
+
+async def aget_google_company_news(
+    query: Annotated[str, "Search query or ticker symbol"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+    limit: Annotated[int, "maximum number of articles, default google_news_max_articles"] = None,
+) -> str:
+    query, limit = _routed_query(query, limit)
+    news_results = await agetNewsData(query, start_date, end_date, limit)
+    return _format_news(query, start_date, end_date, news_results)
+
+
+def _routed_query(query, limit):
+    if limit is None:
+        limit = get_config().get("google_news_max_articles")
+    return query.replace(" ", "+"), limit
+
+
+def _search_window(query, curr_date, look_back_days):
     query = query.replace(" ", "+")
 
     start_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
+    return query, before
 
-    news_results = getNewsData(query, before, curr_date)
 
+def _format_news(query, before, curr_date, news_results):
     news_str = ""
 
     for news in news_results:
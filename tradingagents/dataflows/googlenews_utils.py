@@ -1,7 +1,12 @@
+import asyncio
 import json
-import requests
+import threading
+import weakref
 from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlparse
 import time
 import random
 from tenacity import (
@@ -12,6 +17,95 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+from .disk_cache import DiskCache
+from .http_session import ahttp_get, http_get
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+RESULTS_PER_PAGE = 10
+CLOSED_WINDOW_TTL = 7 * 24 * 3600
+
+_news_cache = DiskCache("google_news", max_bytes_key="google_news_cache_max_bytes", default_max_bytes=32 * 1024 * 1024)
+
+
+class _PolitenessBudget:
+    """Per-host concurrency cap plus a global sliding-window request budget."""
+
+    def __init__(self):
+        self._lock = threading.Condition()
+        self._host_slots = {}
+        # Event loop -> host -> asyncio.Semaphore, for async callers
+        self._async_host_slots = weakref.WeakKeyDictionary()
+        self._sent = deque()
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(
+                    get_config().get("google_news_max_concurrency", 3)
+                )
+            return self._host_slots[host]
+
+    def _async_host_slot(self, host: str) -> asyncio.Semaphore:
+        slots = self._async_host_slots.setdefault(asyncio.get_running_loop(), {})
+        if host not in slots:
+            slots[host] = asyncio.Semaphore(get_config().get("google_news_max_concurrency", 3))
+        return slots[host]
+
+    def _try_take(self) -> float:
+        """Take a request from the per-minute budget (returns 0) or return the seconds to wait.
+
+        Caller holds ``self._lock``.
+        """
+        budget = get_config().get("google_news_requests_per_minute", 30)
+        now = time.monotonic()
+        while self._sent and now - self._sent[0] >= 60:
+            self._sent.popleft()
+        if len(self._sent) < budget:
+            self._sent.append(now)
+            return 0.0
+        return 60 - (now - self._sent[0])
+
+    def _take_request(self) -> None:
+        """Block until the per-minute request budget allows another request."""
+        with self._lock:
+            while True:
+                wait = self._try_take()
+                if not wait:
+                    return
+                self._lock.wait(wait)
+
+    def request(self, url, headers):
+        slot = self._host_slot(urlparse(url).netloc)
+        with slot:
+            self._take_request()
+            # Random delay before each request to avoid detection
+            low, high = get_config().get("google_news_delay", (2, 6))
+            time.sleep(random.uniform(low, high))
+            return http_get(url, headers=headers)
+
+    async def arequest(self, url, headers):
+        """Async ``request``: waits on the event loop instead of blocking a thread."""
+        async with self._async_host_slot(urlparse(url).netloc):
+            while True:
+                with self._lock:
+                    wait = self._try_take()
+                if not wait:
+                    break
+                await asyncio.sleep(wait)
+            low, high = get_config().get("google_news_delay", (2, 6))
+            await asyncio.sleep(random.uniform(low, high))
+            return await ahttp_get(url, headers=headers)
+
+
+_budget = _PolitenessBudget()
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
@@ -25,84 +119,199 @@ def is_rate_limited(response):
 )
 def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
-    return response
+    # Per-host concurrency cap, global request budget and random delay
+    return _budget.request(url, headers)
 
 
-def getNewsData(query, start_date, end_date):
-    """
-    Scrape Google News search results for a given query and date range.
-    query: str - search query
-    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
-    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
-    """
+@retry(
+    retry=(retry_if_result(is_rate_limited)),
+    wait=wait_exponential(multiplier=1, min=4, max=60),
+    stop=stop_after_attempt(5),
+)
+async def amake_request(url, headers):
+    """Async ``make_request``"""
+    return await _budget.arequest(url, headers)
+
+
+def _parse_results(soup):
+    news_results = []
+    for el in soup.select("div.SoaBEf"):
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+    return news_results
+
+
+def _page_url(query, start_date, end_date, page):
+    base_url = get_config().get("google_news_base_url", "https://www.google.com/search")
+    return (
+        f"{base_url}?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={page * RESULTS_PER_PAGE}"
+    )
+
+
+def _parse_page(content):
+    soup = BeautifulSoup(content, "html.parser")
+    # Check for the "Next" link (pagination)
+    return _parse_results(soup), soup.find("a", id="pnnext") is not None
+
+
+def _fetch_page(query, start_date, end_date, page):
+    """Fetch one result page; return (results, has_next_page) or None on failure."""
+    try:
+        response = make_request(_page_url(query, start_date, end_date, page), HEADERS)
+        return _parse_page(response.content)
+    except Exception as e:
+        print(f"Failed after multiple retries: {e}")
+        return None
+
+
+async def _afetch_page(query, start_date, end_date, page):
+    """Async ``_fetch_page``."""
+    try:
+        response = await amake_request(_page_url(query, start_date, end_date, page), HEADERS)
+        return _parse_page(response.content)
+    except Exception as e:
+        print(f"Failed after multiple retries: {e}")
+        return None
+
+
+def _cache_expiry(end_date):
+    # Windows that closed before today no longer change
+    if datetime.strptime(end_date, "%m/%d/%Y").date() < datetime.now().date():
+        return time.time() + CLOSED_WINDOW_TTL
+    return time.time() + get_config().get("google_news_cache_ttl", 3600)
+
+
+def _normalize_dates(start_date, end_date):
     if "-" in start_date:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
         start_date = start_date.strftime("%m/%d/%Y")
     if "-" in end_date:
         end_date = datetime.strptime(end_date, "%Y-%m-%d")
         end_date = end_date.strftime("%m/%d/%Y")
+    return start_date, end_date
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
 
+def _cached_results(cache_key, limit):
+    cached = _news_cache.get(cache_key)
+    if cached is not None:
+        cached = json.loads(cached)
+        # A partial (early-stopped) scrape only serves smaller limits
+        if cached["complete"] or (limit is not None and len(cached["results"]) >= limit):
+            return cached["results"][:limit]
+    return None
+
+
+def _next_wave(page, concurrency, collected, limit):
+    """Pages to fetch next, or an empty list once ``limit`` results are in."""
+    # The first page alone tells whether there is more than one page
+    wave = 1 if page == 0 else concurrency
+    if limit is not None:
+        missing = limit - collected
+        if missing <= 0:
+            return []
+        wave = min(wave, -(-missing // RESULTS_PER_PAGE))
+    return list(range(page, page + wave))
+
+
+def _collect_wave(fetched_pages, news_results):
+    """Add a wave of pages in page order; return (complete, failed)."""
+    for fetched in fetched_pages:
+        if fetched is None:
+            return False, True
+        results_on_page, has_next = fetched
+        if not results_on_page:
+            return True, False  # No more results found
+        news_results.extend(results_on_page)
+        if not has_next:
+            return True, False
+    return False, False
+
+
+def _store_results(cache_key, end_date, news_results, complete):
+    _news_cache.set(
+        cache_key,
+        json.dumps({"complete": complete, "results": news_results}),
+        _cache_expiry(end_date),
+    )
+
+
+def getNewsData(query, start_date, end_date, limit=None):
+    """
+    Scrape Google News search results for a given query and date range.
+    query: str - search query
+    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
+    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    limit: int - stop once this many results are collected (default: all pages)
+
+    Results are cached on disk per (query, date window). Pages after the first
+    are fetched concurrently, within the per-host concurrency cap.
+    """
+    start_date, end_date = _normalize_dates(start_date, end_date)
+    cache_key = {"query": query, "start_date": start_date, "end_date": end_date}
+    cached = _cached_results(cache_key, limit)
+    if cached is not None:
+        return cached
+
+    concurrency = get_config().get("google_news_max_concurrency", 3)
     news_results = []
+    complete = failed = False
     page = 0
-    while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
-
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        while not (complete or failed):
+            pages = _next_wave(page, concurrency, len(news_results), limit)
+            if not pages:
                 break
+            complete, failed = _collect_wave(
+                pool.map(lambda p: _fetch_page(query, start_date, end_date, p), pages), news_results
+            )
+            page += len(pages)
 
-            page += 1
+    if not failed:
+        _store_results(cache_key, end_date, news_results, complete)
+    return news_results[:limit]
 
-        except Exception as e:
-            print(f"Failed after multiple retries: {e}")
+
+async def agetNewsData(query, start_date, end_date, limit=None):
+    """Async ``getNewsData``: the pages of a wave are awaited together."""
+    start_date, end_date = _normalize_dates(start_date, end_date)
+    cache_key = {"query": query, "start_date": start_date, "end_date": end_date}
+    cached = _cached_results(cache_key, limit)
+    if cached is not None:
+        return cached
+
+    concurrency = get_config().get("google_news_max_concurrency", 3)
+    news_results = []
+    complete = failed = False
+    page = 0
+    while not (complete or failed):
+        pages = _next_wave(page, concurrency, len(news_results), limit)
+        if not pages:
             break
+        complete, failed = _collect_wave(
+            await asyncio.gather(*(_afetch_page(query, start_date, end_date, p) for p in pages)),
+            news_results,
+        )
+        page += len(pages)
 
-    return news_results
+    if not failed:
+        _store_results(cache_key, end_date, news_results, complete)
+    return news_results[:limit]
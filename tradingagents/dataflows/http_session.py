@@ -0,0 +1,212 @@
+"""
+Shared pooled HTTP session for the dataflow vendors.
+
+Every vendor call used to go through the module-level ``requests.get``, paying
+a fresh TCP+TLS handshake each time. This module keeps one ``requests.Session``
+per process with per-host keep-alive connection pools, default timeouts and
+transport-level retries, and counts how many connections were opened versus
+reused per host.
+
+``ahttp_get`` is the asyncio counterpart: one pooled ``httpx.AsyncClient`` per
+event loop, with the same timeouts, retry policy and connection counters.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections import defaultdict
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from .config import get_config
+
+DEFAULT_TIMEOUT = (5, 30)  # connect, read seconds
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_POOL_MAXSIZE = 10
+RETRY_STATUSES = (500, 502, 503, 504)
+
+_stats_lock = threading.Lock()
+_stats = defaultdict(lambda: {"requests": 0, "opened": 0, "reused": 0})
+
+
+# Network streams of the async clients' connections seen so far
+_seen_streams = weakref.WeakSet()
+
+
+def _record_checkout(host: str, conn) -> None:
+    # A pooled connection still holding its socket is reused; otherwise the
+    # request will open a new one.
+    reused = getattr(conn, "sock", None) is not None
+    with _stats_lock:
+        host_stats = _stats[host]
+        host_stats["requests"] += 1
+        host_stats["reused" if reused else "opened"] += 1
+
+
+def _record_async_response(host: str, response: httpx.Response) -> None:
+    # httpx hands out the connection's network stream; one seen before is a
+    # kept-alive connection being reused
+    stream = response.extensions.get("network_stream")
+    if stream is None:
+        return
+    with _stats_lock:
+        reused = stream in _seen_streams
+        _seen_streams.add(stream)
+        _stats[host]["reused" if reused else "opened"] += 1
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        _record_checkout(self.host, conn)
+        return conn
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        _record_checkout(self.host, conn)
+        return conn
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose per-host pools report connection reuse."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    config = get_config()
+    retry = Retry(
+        total=config.get("http_retries", DEFAULT_RETRIES),
+        backoff_factor=config.get("http_backoff_factor", DEFAULT_BACKOFF),
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+    pool_maxsize = config.get("http_pool_maxsize", DEFAULT_POOL_MAXSIZE)
+    adapter = _PooledAdapter(
+        pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def http_get(url: str, params: Optional[dict] = None, headers: Optional[dict] = None, timeout=None, **kwargs) -> requests.Response:
+    """GET ``url`` through the shared session.
+
+    Args:
+        url: Request URL
+        params: Query parameters
+        headers: Extra request headers
+        timeout: Seconds (or (connect, read) tuple); defaults to ``http_timeout``
+
+    Returns:
+        The ``requests.Response``; callers decide how to treat HTTP errors
+    """
+    if timeout is None:
+        timeout = tuple(get_config().get("http_timeout", DEFAULT_TIMEOUT))
+    return get_session().get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+
+
+def get_http_stats() -> dict:
+    """Return per-host request counts with connections opened and reused."""
+    with _stats_lock:
+        return {host: dict(host_stats) for host, host_stats in _stats.items()}
+
+
+def reset_http_session() -> None:
+    """Close pooled connections and drop the counters (e.g. after config changes)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+    with _stats_lock:
+        _stats.clear()
+
+
+# Event loop -> its pooled async client (clients cannot be shared across loops)
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        pool_maxsize = get_config().get("http_pool_maxsize", DEFAULT_POOL_MAXSIZE)
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+            follow_redirects=True,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def ahttp_get(url: str, params: Optional[dict] = None, headers: Optional[dict] = None, timeout=None) -> httpx.Response:
+    """Async GET of ``url`` through the pooled client of the running event loop.
+
+    Connection errors and 5xx responses are retried with exponential backoff
+    (``http_retries``, ``http_backoff_factor``), like ``http_get``.
+
+    Returns:
+        The ``httpx.Response``; callers decide how to treat HTTP errors
+    """
+    config = get_config()
+    if timeout is None:
+        timeout = tuple(config.get("http_timeout", DEFAULT_TIMEOUT))
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        timeout = httpx.Timeout(read, connect=connect)
+    retries = config.get("http_retries", DEFAULT_RETRIES)
+    backoff = config.get("http_backoff_factor", DEFAULT_BACKOFF)
+    host = httpx.URL(url).host
+
+    for attempt in range(retries + 1):
+        with _stats_lock:
+            _stats[host]["requests"] += 1
+        try:
+            response = await _get_async_client().get(url, params=params, headers=headers, timeout=timeout)
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+        else:
+            _record_async_response(host, response)
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                return response
+        await asyncio.sleep(backoff * (2 ** attempt))
+
+
+async def aclose_http_session() -> None:
+    """Close the async client of the running event loop."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,198 @@
+"""
+Vectorized technical indicator engine built on pandas/NumPy primitives.
+
+Every indicator is computed over the whole price history in a handful of
+array operations and returned as a Date-indexed float Series. Formulas and
+warm-up conventions follow stockstats (the previous backend), so values are
+interchangeable with what the agents saw before.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Window parameters, matching the stockstats defaults
+MACD_WINDOWS = (12, 26, 9)  # short, long, signal
+RSI_WINDOW = 14
+BOLL_WINDOW = 20
+BOLL_STD_TIMES = 2
+ATR_WINDOW = 14
+VWMA_WINDOW = 14
+MFI_WINDOW = 14
+
+
+def _sma(series: pd.Series, window: int) -> pd.Series:
+    return series.rolling(window, min_periods=1).mean()
+
+
+def _ema(series: pd.Series, window: int) -> pd.Series:
+    return series.ewm(span=window, min_periods=1, adjust=True).mean()
+
+
+def _smma(values: np.ndarray, window: int) -> np.ndarray:
+    """Smoothed (Wilder) moving average."""
+    return (
+        pd.Series(values)
+        .ewm(alpha=1.0 / window, min_periods=0, adjust=True)
+        .mean()
+        .to_numpy()
+    )
+
+
+def _typical_price(prices: pd.DataFrame) -> np.ndarray:
+    return (
+        prices["Close"].to_numpy() + prices["High"].to_numpy() + prices["Low"].to_numpy()
+    ) / 3.0
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum over partial windows at the start of the series."""
+    cumsum = np.cumsum(values)
+    out = cumsum.copy()
+    out[window:] = cumsum[window:] - cumsum[:-window]
+    return out
+
+
+def _moving_average(prices: pd.DataFrame, indicator: str) -> dict:
+    # close_<N>_sma / close_<N>_ema
+    _, window, kind = indicator.split("_")
+    if kind == "sma":
+        return {indicator: _sma(prices["Close"], int(window))}
+    return {indicator: _ema(prices["Close"], int(window))}
+
+
+def _macd(prices: pd.DataFrame, indicator: str) -> dict:
+    short_w, long_w, signal_w = MACD_WINDOWS
+    close = prices["Close"]
+    macd = _ema(close, short_w) - _ema(close, long_w)
+    signal = _ema(macd, signal_w)
+    return {"macd": macd, "macds": signal, "macdh": macd - signal}
+
+
+def _rsi(prices: pd.DataFrame, indicator: str) -> dict:
+    diff = np.zeros(len(prices))
+    diff[1:] = np.diff(prices["Close"].to_numpy())
+    up = _smma(np.where(diff > 0, diff, 0.0), RSI_WINDOW)
+    down = _smma(np.where(diff < 0, -diff, 0.0), RSI_WINDOW)
+
+    total = up + down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(total != 0, 100 * (up / total), 50.0)
+    if len(rsi):
+        rsi[0] = 50.0
+    return {"rsi": pd.Series(rsi, index=prices.index)}
+
+
+def _bollinger(prices: pd.DataFrame, indicator: str) -> dict:
+    close = prices["Close"]
+    middle = _sma(close, BOLL_WINDOW)
+    width = BOLL_STD_TIMES * close.rolling(BOLL_WINDOW, min_periods=1).std()
+    return {"boll": middle, "boll_ub": middle + width, "boll_lb": middle - width}
+
+
+def _atr(prices: pd.DataFrame, indicator: str) -> dict:
+    close = prices["Close"].to_numpy()
+    high = prices["High"].to_numpy()
+    low = prices["Low"].to_numpy()
+
+    # The first bar has no previous close; use its own close
+    prev_close = np.empty_like(close)
+    if len(close):
+        prev_close[0] = close[0]
+    prev_close[1:] = close[:-1]
+
+    true_range = np.maximum(
+        high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+    np.nan_to_num(true_range, copy=False)
+    return {"atr": pd.Series(_smma(true_range, ATR_WINDOW), index=prices.index)}
+
+
+def _vwma(prices: pd.DataFrame, indicator: str) -> dict:
+    volume = prices["Volume"].to_numpy(dtype=float)
+    rolling_tpv = _rolling_sum(volume * _typical_price(prices), VWMA_WINDOW)
+    rolling_vol = _rolling_sum(volume, VWMA_WINDOW)
+    vwma = np.divide(
+        rolling_tpv,
+        rolling_vol,
+        out=np.zeros_like(rolling_tpv),
+        where=rolling_vol != 0,
+    )
+    return {"vwma": pd.Series(vwma, index=prices.index)}
+
+
+def _mfi(prices: pd.DataFrame, indicator: str) -> dict:
+    tp = _typical_price(prices)
+    raw_money_flow = tp * prices["Volume"].to_numpy(dtype=float)
+
+    tp_diff = np.zeros_like(tp)
+    tp_diff[1:] = np.diff(tp)
+    pos_sum = _rolling_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), MFI_WINDOW)
+    neg_sum = _rolling_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), MFI_WINDOW)
+
+    total = pos_sum + neg_sum
+    mfi = np.divide(pos_sum, total, out=np.full_like(pos_sum, 0.5), where=total > 0)
+    mfi[:MFI_WINDOW] = 0.5
+    return {"mfi": pd.Series(mfi, index=prices.index)}
+
+
+# Indicator name -> function computing its whole family of columns
+INDICATOR_FUNCTIONS = {
+    "close_50_sma": _moving_average,
+    "close_200_sma": _moving_average,
+    "close_10_ema": _moving_average,
+    "macd": _macd,
+    "macds": _macd,
+    "macdh": _macd,
+    "rsi": _rsi,
+    "boll": _bollinger,
+    "boll_ub": _bollinger,
+    "boll_lb": _bollinger,
+    "atr": _atr,
+    "vwma": _vwma,
+    "mfi": _mfi,
+}
+
+
+def compute_indicators(prices: pd.DataFrame, indicators: list) -> pd.DataFrame:
+    """Compute several indicators in a single pass over the price history.
+
+    Indicators of the same family (macd/macds/macdh, boll/boll_ub/boll_lb)
+    share one computation, so their intermediates (EMA12/EMA26, the 20-day
+    mean and std) are only calculated once.
+
+    Args:
+        prices: Date-sorted OHLCV frame as returned by the price store
+        indicators: Names from ``INDICATOR_FUNCTIONS``
+
+    Returns:
+        Float DataFrame indexed by the bar dates, one column per indicator
+    """
+    unsupported = [ind for ind in indicators if ind not in INDICATOR_FUNCTIONS]
+    if unsupported:
+        raise ValueError(
+            f"Indicator {', '.join(unsupported)} is not supported. Please choose from: {list(INDICATOR_FUNCTIONS.keys())}"
+        )
+
+    prices = prices.reset_index(drop=True)
+    computed = {}
+    for indicator in indicators:
+        if indicator not in computed:
+            computed.update(INDICATOR_FUNCTIONS[indicator](prices, indicator))
+
+    return pd.DataFrame(
+        {ind: np.asarray(computed[ind], dtype=float) for ind in indicators},
+        index=pd.DatetimeIndex(prices["Date"]),
+    )
+
+
+def compute_indicator(prices: pd.DataFrame, indicator: str) -> pd.Series:
+    """Compute ``indicator`` over the full price history.
+
+    Args:
+        prices: Date-sorted OHLCV frame as returned by the price store
+        indicator: One of ``INDICATOR_FUNCTIONS``
+
+    Returns:
+        Float Series indexed by the bar dates
+    """
+    return compute_indicators(prices, [indicator])[indicator]
@@ -1,11 +1,19 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Annotated
 
+import httpx
+import requests
+from tenacity import RetryError
+from yfinance.exceptions import YFRateLimitError
+
 # Import from vendor-specific modules
 from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
 from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions
-from .google import get_google_news
-from .google import get_google_news
-from .llm_utils import get_stock_news_llm, get_global_news_llm, get_fundamentals_llm
+from .google import get_google_company_news, aget_google_company_news
+from .llm_utils import LLMCacheMissError, get_stock_news_llm, get_global_news_llm, get_fundamentals_llm, aget_stock_news_llm, aget_global_news_llm, aget_fundamentals_llm
 from .alpha_vantage import (
     get_stock as get_alpha_vantage_stock,
     get_indicator as get_alpha_vantage_indicator,
@@ -15,12 +23,22 @@ from .alpha_vantage import (
     get_income_statement as get_alpha_vantage_income_statement,
     get_insider_transactions as get_alpha_vantage_insider_transactions,
     get_news as get_alpha_vantage_news,
-    get_global_news as get_alpha_vantage_global_news
+    get_global_news as get_alpha_vantage_global_news,
+    aget_stock as aget_alpha_vantage_stock,
+    aget_indicator as aget_alpha_vantage_indicator,
+    aget_fundamentals as aget_alpha_vantage_fundamentals,
+    aget_balance_sheet as aget_alpha_vantage_balance_sheet,
+    aget_cashflow as aget_alpha_vantage_cashflow,
+    aget_income_statement as aget_alpha_vantage_income_statement,
+    aget_insider_transactions as aget_alpha_vantage_insider_transactions,
+    aget_news as aget_alpha_vantage_news,
+    aget_global_news as aget_alpha_vantage_global_news,
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
 
 # Configuration and routing logic
 from .config import get_config
+from .telemetry import logger, record_attempt, record_call, result_size
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -101,8 +119,8 @@ VENDOR_METHODS = {
     "get_news": {
         "alpha_vantage": get_alpha_vantage_news,
         "openai": get_stock_news_llm,
-        "google": get_google_news,
-        "local": [get_finnhub_news, get_reddit_company_news, get_google_news],
+        "google": get_google_company_news,
+        "local": [get_finnhub_news, get_reddit_company_news, get_google_company_news],
     },
     "get_global_news": {
         "alpha_vantage": get_alpha_vantage_global_news,
@@ -119,6 +137,24 @@ VENDOR_METHODS = {
     },
 }
 
+# Async counterparts of the HTTP-bound vendor implementations, used by
+# aroute_to_vendor. Implementations without one run in a worker thread.
+ASYNC_IMPLEMENTATIONS = {
+    get_alpha_vantage_stock: aget_alpha_vantage_stock,
+    get_alpha_vantage_indicator: aget_alpha_vantage_indicator,
+    get_alpha_vantage_fundamentals: aget_alpha_vantage_fundamentals,
+    get_alpha_vantage_balance_sheet: aget_alpha_vantage_balance_sheet,
+    get_alpha_vantage_cashflow: aget_alpha_vantage_cashflow,
+    get_alpha_vantage_income_statement: aget_alpha_vantage_income_statement,
+    get_alpha_vantage_insider_transactions: aget_alpha_vantage_insider_transactions,
+    get_alpha_vantage_news: aget_alpha_vantage_news,
+    get_alpha_vantage_global_news: aget_alpha_vantage_global_news,
+    get_google_company_news: aget_google_company_news,
+    get_stock_news_llm: aget_stock_news_llm,
+    get_global_news_llm: aget_global_news_llm,
+    get_fundamentals_llm: aget_fundamentals_llm,
+}
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
     for category, info in TOOLS_CATEGORIES.items():
@@ -141,8 +177,357 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
-def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+# Marks a vendor call that raised: _FAILED when the vendor answered without
+# usable data, _UNAVAILABLE when it could not be reached, timed out or was
+# rate limited. Only the latter counts against the vendor's circuit breaker.
+# A cache-only LLM miss is returned as its LLMCacheMissError instead.
+_FAILED = object()
+_UNAVAILABLE = object()
+
+# Exceptions meaning the vendor is unreachable or overloaded
+_UNAVAILABLE_ERRORS = (
+    AlphaVantageRateLimitError,
+    YFRateLimitError,
+    RetryError,  # rate-limit retries exhausted
+    ConnectionError,
+    TimeoutError,
+    requests.ConnectionError,
+    requests.Timeout,
+    httpx.TransportError,
+)
+
+def _is_unavailable_error(error: Exception) -> bool:
+    """Return True if ``error`` is a transport or availability failure.
+
+    Connection errors, timeouts, rate limits and 408/429/5xx responses say
+    nothing about the data; errors such as "no data for symbol" do and must
+    not trip the breaker.
+    """
+    if isinstance(error, _UNAVAILABLE_ERRORS):
+        return True
+    # requests/httpx HTTP errors carry the response; LLM client errors the status
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if not isinstance(status, int):
+        status = getattr(error, "status_code", None)
+    return isinstance(status, int) and (status in (408, 429) or status >= 500)
+
+def _succeeded(outcome) -> bool:
+    return outcome is not _FAILED and outcome is not _UNAVAILABLE and not isinstance(outcome, LLMCacheMissError)
+
+def _raise_cache_miss(outcomes: list) -> None:
+    """Re-raise a cache-only miss among ``outcomes`` if none of them produced data.
+
+    A miss next to other vendors' results is already recorded as a
+    ``cache_miss`` attempt and only drops that vendor's share; with nothing to
+    return, the miss fails the call instead of falling back to live vendors.
+    """
+    if any(_succeeded(outcome) for outcome in outcomes):
+        return
+    for outcome in outcomes:
+        if isinstance(outcome, LLMCacheMissError):
+            raise outcome
+
+class CircuitBreaker:
+    """Availability tracker for one (vendor, method) pair.
+
+    Only transport and availability failures (connection errors, timeouts,
+    rate limits, 5xx responses) count; a vendor that answers without data is
+    healthy. closed: calls go through. After
+    ``circuit_breaker_failure_threshold`` consecutive failures (or one Alpha
+    Vantage rate-limit error) it opens and
+    the vendor is skipped. Once ``circuit_breaker_cooldown`` seconds have
+    passed it goes half-open and lets a single trial call through; success
+    closes it again, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, vendor: str, method: str):
+        self.vendor = vendor
+        self.method = method
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial_started = None
+        self.successes = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_error = None
+        self._lock = threading.Lock()
+
+    def _cooldown(self) -> float:
+        return get_config().get("circuit_breaker_cooldown", 60)
+
+    def allow(self) -> bool:
+        """Return True if a call may go to the vendor now."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self.opened_at >= self._cooldown():
+                self.state = self.HALF_OPEN
+                self.trial_started = None
+            if self.state == self.HALF_OPEN:
+                # One trial at a time; a trial that never reported back expires
+                if self.trial_started is None or now - self.trial_started >= self._cooldown():
+                    self.trial_started = now
+                    return True
+            if self.state == self.CLOSED:
+                return True
+            self.skipped += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self, error: str = None, trip: bool = False) -> None:
+        """Count a failed call; ``trip`` opens the breaker right away."""
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if error:
+                self.last_error = error
+            threshold = get_config().get("circuit_breaker_failure_threshold", 3)
+            if trip or self.state == self.HALF_OPEN or self.consecutive_failures >= threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self._cooldown() - (time.monotonic() - self.opened_at))
+            return {
+                "vendor": self.vendor,
+                "method": self.method,
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "successes": self.successes,
+                "failures": self.failures,
+                "skipped": self.skipped,
+                "retry_in": retry_in,
+                "last_error": self.last_error,
+            }
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def _get_breaker(vendor: str, method: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get((vendor, method))
+        if breaker is None:
+            breaker = _breakers[(vendor, method)] = CircuitBreaker(vendor, method)
+        return breaker
+
+def _breaker_allows(vendor: str, method: str) -> bool:
+    if not get_config().get("circuit_breaker_enabled", True):
+        return True
+    if _get_breaker(vendor, method).allow():
+        return True
+    record_attempt(method, vendor, "skipped")
+    return False
+
+def get_circuit_breaker_states() -> list:
+    """Return health statistics of every (vendor, method) breaker seen so far."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return [breaker.snapshot() for breaker in breakers]
+
+def get_skipped_vendors() -> list:
+    """Return (vendor, method) pairs currently skipped because their breaker is open."""
+    return [
+        (state["vendor"], state["method"])
+        for state in get_circuit_breaker_states()
+        if state["state"] == CircuitBreaker.OPEN
+    ]
+
+def reset_circuit_breakers() -> None:
+    """Close every breaker and drop its statistics."""
+    with _breakers_lock:
+        _breakers.clear()
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the bounded pool shared by all concurrent vendor calls."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_config().get("vendor_max_workers", 8),
+                    thread_name_prefix="vendor",
+                )
+    return _executor
+
+def _call_vendor(impl_func, vendor: str, method: str, depth: int, args, kwargs):
+    """Run one vendor implementation, returning _FAILED/_UNAVAILABLE instead of raising.
+
+    LLMCacheMissError is returned, not swallowed: the router re-raises it
+    (see ``_raise_cache_miss``) so that in cache-only mode a miss never falls
+    back to live vendors.
+    """
+    start = time.perf_counter()
+    try:
+        result = impl_func(*args, **kwargs)
+        record_attempt(method, vendor, "success", time.perf_counter() - start, impl_func.__name__, result_size(result), depth)
+        return result
+    except LLMCacheMissError as e:
+        record_attempt(method, vendor, "cache_miss", time.perf_counter() - start, impl_func.__name__, fallback_depth=depth, error=str(e))
+        return e
+    except AlphaVantageRateLimitError as e:
+        record_attempt(method, vendor, "rate_limited", time.perf_counter() - start, impl_func.__name__, fallback_depth=depth, error=str(e))
+        _get_breaker(vendor, method).record_failure(str(e), trip=True)
+        return _UNAVAILABLE
+    except Exception as e:
+        # Log error but continue with other implementations
+        record_attempt(method, vendor, "error", time.perf_counter() - start, impl_func.__name__, fallback_depth=depth, error=str(e))
+        return _UNAVAILABLE if _is_unavailable_error(e) else _FAILED
+
+def _vendor_calls(method: str, vendor: str) -> list:
+    """(impl_func, vendor) pairs of every implementation of ``vendor``."""
+    vendor_impl = VENDOR_METHODS[method][vendor]
+    impls = vendor_impl if isinstance(vendor_impl, list) else [vendor_impl]
+    return [(impl, vendor) for impl in impls]
+
+def _submit_vendor_calls(calls: list, method: str, depths: dict, args, kwargs) -> list:
+    """Start ``calls`` on the shared pool; return their futures in call order."""
+    executor = _get_executor()
+    return [
+        executor.submit(_call_vendor, impl_func, vendor, method, depths[vendor], args, kwargs)
+        for impl_func, vendor in calls
+    ]
+
+def _collect_vendor_calls(calls: list, futures: list, method: str, depths: dict) -> list:
+    """Outcomes of submitted ``calls``; unfinished ones are abandoned as timed out."""
+    timeout = get_config().get("vendor_call_timeout", 60)
+    outcomes = []
+    for (impl_func, vendor), future in zip(calls, futures):
+        if future.done() and not future.cancelled():
+            outcomes.append(future.result())
+        else:
+            future.cancel()
+            record_attempt(method, vendor, "timeout", timeout, impl_func.__name__, fallback_depth=depths[vendor])
+            outcomes.append(_UNAVAILABLE)
+    return outcomes
+
+def _run_vendor_calls(calls: list, method: str, depths: dict, args, kwargs) -> list:
+    """Run independent (impl_func, vendor) calls and return outcomes in call order.
+
+    A lone call runs inline. Several calls run concurrently on the shared pool;
+    calls that have not finished within ``vendor_call_timeout`` seconds are
+    abandoned and count as unavailable.
+    """
+    if len(calls) <= 1:
+        return [_call_vendor(impl_func, vendor, method, depths[vendor], args, kwargs) for impl_func, vendor in calls]
+
+    futures = _submit_vendor_calls(calls, method, depths, args, kwargs)
+    wait(futures, timeout=get_config().get("vendor_call_timeout", 60))
+    return _collect_vendor_calls(calls, futures, method, depths)
+
+def _record_vendor_outcome(vendor: str, method: str, outcomes: list) -> None:
+    """Feed the outcomes of one vendor's implementations to its breaker.
+
+    The vendor counts as failed only if none of them succeeded and at least
+    one could not reach it; a vendor that answered without data is healthy.
+    """
+    breaker = _get_breaker(vendor, method)
+    if any(_succeeded(outcome) for outcome in outcomes) or _UNAVAILABLE not in outcomes:
+        breaker.record_success()
+    elif breaker.state != CircuitBreaker.OPEN:
+        # Rate-limit errors have already tripped the breaker
+        breaker.record_failure()
+
+def _race_vendors(method: str, vendors: list, depths: dict, args, kwargs) -> tuple:
+    """Hedged call: start ``vendors`` one by one and keep the first good result.
+
+    The next vendor is launched when the ones in flight have not answered within
+    ``vendor_hedge_delay`` seconds, or as soon as one of them fails. Each leg
+    runs the vendor's implementations concurrently, like a routed batch. Slower
+    vendors still running once a result is in are ignored.
+
+    Returns:
+        (results of the winning vendor or [], number of vendors launched)
+    """
+    config = get_config()
+    hedge_delay = config.get("vendor_hedge_delay", 2.0)
+    deadline = time.monotonic() + config.get("vendor_call_timeout", 60)
+
+    legs = {}  # vendor -> (calls, futures)
+    owners = {}  # future -> vendor
+    pending = set()
+    remaining = list(vendors)
+    hedge_at = 0.0
+
+    def launch_next():
+        nonlocal hedge_at
+        # Vendors whose circuit breaker is open are passed over
+        vendor = remaining.pop(0)
+        while not _breaker_allows(vendor, method):
+            if not remaining:
+                return
+            vendor = remaining.pop(0)
+        logger.debug("%s: racing vendor %s (attempt #%d)", method, vendor, len(legs) + 1)
+        calls = _vendor_calls(method, vendor)
+        futures = _submit_vendor_calls(calls, method, depths, args, kwargs)
+        legs[vendor] = (calls, futures)
+        owners.update((future, vendor) for future in futures)
+        pending.update(futures)
+        hedge_at = time.monotonic() + hedge_delay
+
+    def abandon_pending():
+        for future in pending:
+            future.cancel()
+
+    launch_next()
+    while pending:
+        now = time.monotonic()
+        timeout = max(0.0, deadline - now)
+        if remaining:
+            timeout = min(timeout, max(0.0, hedge_at - now))
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        pending -= done
+
+        leg_failed = False
+        for vendor in dict.fromkeys(owners[future] for future in done):
+            calls, futures = legs[vendor]
+            if any(future in pending for future in futures):
+                continue
+            outcomes = _collect_vendor_calls(calls, futures, method, depths)
+            try:
+                _raise_cache_miss(outcomes)
+            except LLMCacheMissError:
+                abandon_pending()
+                raise
+            _record_vendor_outcome(vendor, method, outcomes)
+            vendor_results = [outcome for outcome in outcomes if _succeeded(outcome)]
+            if vendor_results:
+                abandon_pending()
+                logger.debug("%s: vendor %s won the race", method, vendor)
+                return vendor_results, len(legs)
+            leg_failed = True
+
+        now = time.monotonic()
+        if pending and now >= deadline:
+            for vendor, (calls, futures) in legs.items():
+                if not any(future in pending for future in futures):
+                    continue
+                _record_vendor_outcome(vendor, method, [_UNAVAILABLE])
+                for (impl_func, _), future in zip(calls, futures):
+                    if future in pending:
+                        future.cancel()
+                        record_attempt(method, vendor, "timeout", config.get("vendor_call_timeout", 60), impl_func.__name__, fallback_depth=depths[vendor])
+            break
+        if remaining and (leg_failed or not pending or now >= hedge_at):
+            launch_next()
+    return [], len(legs)
+
+def _plan_vendors(method: str):
+    """Return (primary vendors, vendors to attempt in fallback order, fallback depth per vendor)."""
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
 
@@ -161,87 +546,216 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
-    # Debug: Print fallback ordering
-    primary_str = " -> ".join(primary_vendors)
-    fallback_str = " -> ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
+    logger.debug("%s: primary [%s], fallback order [%s]", method, " -> ".join(primary_vendors), " -> ".join(fallback_vendors))
+
+    attempted_vendors = []
+    for vendor in fallback_vendors:
+        if vendor not in VENDOR_METHODS[method]:
+            if vendor in primary_vendors:
+                logger.info("Vendor '%s' not supported for method '%s', falling back to next vendor", vendor, method)
+            continue
+        attempted_vendors.append(vendor)
+    # Fallback depth of each vendor (0 = first configured vendor)
+    depths = {vendor: fallback_vendors.index(vendor) for vendor in attempted_vendors}
+    return primary_vendors, attempted_vendors, depths
+
+def _vendor_batches(method: str, primary_vendors: list, attempted_vendors: list):
+    """Return (race?, batches of vendors tried together)."""
+    # Single-vendor configs stop at the first vendor that succeeds, so vendors
+    # are tried one at a time. Multi-vendor configs collect from every vendor
+    # anyway, so they are all queried together.
+    if len(primary_vendors) == 1 and len(attempted_vendors) > 1 and method in get_config().get("vendor_race_methods", []):
+        return True, []
+    if len(primary_vendors) == 1:
+        return False, [[vendor] for vendor in attempted_vendors]
+    return False, [attempted_vendors] if attempted_vendors else []
+
+def _finish_route(method: str, call_start: float, results: list, vendor_attempt_count: int):
+    """Record the routed call and merge the vendor results."""
+    call_duration = time.perf_counter() - call_start
+    if not results:
+        record_call(method, call_duration, "failure", vendor_attempt_count)
+        raise RuntimeError(f"All vendor implementations failed for method '{method}'")
+    record_call(method, call_duration, "success", vendor_attempt_count, sum(result_size(result) for result in results))
+
+    # Return single result if only one, otherwise concatenate as string
+    if len(results) == 1:
+        return results[0]
+    else:
+        # Convert all results to strings and concatenate
+        return '\n'.join(str(result) for result in results)
+
+def route_to_vendor(method: str, *args, **kwargs):
+    """Route method calls to appropriate vendor implementation with fallback support.
+
+    Raises:
+        LLMCacheMissError: An LLM-backed vendor missed its cache in cache-only
+            mode and no vendor queried alongside it returned data; no other
+            vendor is tried, so backtests stay deterministic
+    """
+    primary_vendors, attempted_vendors, depths = _plan_vendors(method)
 
     # Track results and execution state
+    call_start = time.perf_counter()
     results = []
     vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
 
-    for vendor in fallback_vendors:
-        if vendor not in VENDOR_METHODS[method]:
-            if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
+    race, vendor_batches = _vendor_batches(method, primary_vendors, attempted_vendors)
+    if race:
+        results, vendor_attempt_count = _race_vendors(method, attempted_vendors, depths, args, kwargs)
+
+    for batch in vendor_batches:
+        batch = [vendor for vendor in batch if _breaker_allows(vendor, method)]
+        if not batch:
             continue
 
-        vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
+        calls = []
+        for vendor in batch:
+            vendor_attempt_count += 1
+            # Handle list of methods for a vendor
+            calls.extend(_vendor_calls(method, vendor))
+
+        outcomes = _run_vendor_calls(calls, method, depths, args, kwargs)
+        _raise_cache_miss(outcomes)
 
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
+        # Add results vendor by vendor, in configuration order
+        for vendor in batch:
+            vendor_outcomes = [outcome for (_, call_vendor), outcome in zip(calls, outcomes) if call_vendor == vendor]
+            _record_vendor_outcome(vendor, method, vendor_outcomes)
+            results.extend(outcome for outcome in vendor_outcomes if _succeeded(outcome))
 
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+        # Stopping logic: Stop after first successful vendor for single-vendor configs
+        if results and len(primary_vendors) == 1:
+            break
 
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
+    return _finish_route(method, call_start, results, vendor_attempt_count)
+
+async def _acall_vendor(impl_func, vendor: str, method: str, depth: int, args, kwargs):
+    """Async ``_call_vendor``: awaits the async implementation, or runs the sync one in a thread."""
+    timeout = get_config().get("vendor_call_timeout", 60)
+    async_impl = ASYNC_IMPLEMENTATIONS.get(impl_func)
+    start = time.perf_counter()
+    try:
+        if async_impl is not None:
+            result = await asyncio.wait_for(async_impl(*args, **kwargs), timeout)
         else:
-            vendor_methods = [(vendor_impl, vendor)]
+            result = await asyncio.wait_for(asyncio.to_thread(impl_func, *args, **kwargs), timeout)
+        record_attempt(method, vendor, "success", time.perf_counter() - start, impl_func.__name__, result_size(result), depth)
+        return result
+    except LLMCacheMissError as e:
+        record_attempt(method, vendor, "cache_miss", time.perf_counter() - start, impl_func.__name__, fallback_depth=depth, error=str(e))
+        return e
+    except AlphaVantageRateLimitError as e:
+        record_attempt(method, vendor, "rate_limited", time.perf_counter() - start, impl_func.__name__, fallback_depth=depth, error=str(e))
+        _get_breaker(vendor, method).record_failure(str(e), trip=True)
+        return _UNAVAILABLE
+    except asyncio.TimeoutError:
+        record_attempt(method, vendor, "timeout", timeout, impl_func.__name__, fallback_depth=depth)
+        return _UNAVAILABLE
+    except Exception as e:
+        record_attempt(method, vendor, "error", time.perf_counter() - start, impl_func.__name__, fallback_depth=depth, error=str(e))
+        return _UNAVAILABLE if _is_unavailable_error(e) else _FAILED
+
+async def _acall_vendor_group(method: str, vendor: str, depth: int, args, kwargs) -> list:
+    """Run every implementation of ``vendor`` concurrently; return their outcomes."""
+    return await asyncio.gather(
+        *(_acall_vendor(impl, vendor, method, depth, args, kwargs) for impl, _ in _vendor_calls(method, vendor))
+    )
+
+async def _arace_vendors(method: str, vendors: list, depths: dict, args, kwargs) -> tuple:
+    """Async ``_race_vendors``: hedged vendor calls as tasks on the running loop.
 
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
+    Returns:
+        (results of the winning vendor or [], number of vendors launched)
+    """
+    config = get_config()
+    hedge_delay = config.get("vendor_hedge_delay", 2.0)
+    deadline = time.monotonic() + config.get("vendor_call_timeout", 60)
+
+    launched = {}  # task -> vendor
+    pending = set()
+    remaining = list(vendors)
+
+    def launch_next():
+        # Vendors whose circuit breaker is open are passed over
+        vendor = remaining.pop(0)
+        while not _breaker_allows(vendor, method):
+            if not remaining:
+                return
+            vendor = remaining.pop(0)
+        logger.debug("%s: racing vendor %s (attempt #%d)", method, vendor, len(launched) + 1)
+        task = asyncio.ensure_future(_acall_vendor_group(method, vendor, depths[vendor], args, kwargs))
+        launched[task] = vendor
+        pending.add(task)
+
+    launch_next()
+    while pending:
+        timeout = max(0.0, deadline - time.monotonic())
+        if remaining:
+            timeout = min(timeout, hedge_delay)
+        done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        pending -= done
+
+        for task in done:
+            outcomes = task.result()
             try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
+                _raise_cache_miss(outcomes)
+            except LLMCacheMissError:
+                for other in pending:
+                    other.cancel()
+                raise
+            _record_vendor_outcome(launched[task], method, outcomes)
+            vendor_results = [outcome for outcome in outcomes if _succeeded(outcome)]
+            if vendor_results:
+                for other in pending:
+                    other.cancel()
+                logger.debug("%s: vendor %s won the race", method, launched[task])
+                return vendor_results, len(launched)
 
-        # Add this vendor's results
-        if vendor_results:
-            results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
-            # Stopping logic: Stop after first successful vendor for single-vendor configs
-            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
-            if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
-                break
-        else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
+        if remaining and (done or not pending or time.monotonic() < deadline):
+            launch_next()
+        elif not done and time.monotonic() >= deadline:
+            for task in pending:
+                task.cancel()
+                _record_vendor_outcome(launched[task], method, [_UNAVAILABLE])
+                record_attempt(method, launched[task], "timeout", config.get("vendor_call_timeout", 60), fallback_depth=depths[launched[task]])
+            break
+    return [], len(launched)
 
-    # Final result summary
-    if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
-        raise RuntimeError(f"All vendor implementations failed for method '{method}'")
-    else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+async def aroute_to_vendor(method: str, *args, **kwargs):
+    """Async ``route_to_vendor`` with the same fallback, racing and circuit breaker semantics.
 
-    # Return single result if only one, otherwise concatenate as string
-    if len(results) == 1:
-        return results[0]
-    else:
-        # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+    HTTP-bound vendors (Alpha Vantage, Google News, the LiteLLM search vendors)
+    are awaited on the running event loop; the others run in a worker thread.
+    """
+    primary_vendors, attempted_vendors, depths = _plan_vendors(method)
+
+    call_start = time.perf_counter()
+    results = []
+    vendor_attempt_count = 0
+
+    race, vendor_batches = _vendor_batches(method, primary_vendors, attempted_vendors)
+    if race:
+        results, vendor_attempt_count = await _arace_vendors(method, attempted_vendors, depths, args, kwargs)
+
+    for batch in vendor_batches:
+        batch = [vendor for vendor in batch if _breaker_allows(vendor, method)]
+        if not batch:
+            continue
+        vendor_attempt_count += len(batch)
+
+        outcomes = await asyncio.gather(
+            *(_acall_vendor_group(method, vendor, depths[vendor], args, kwargs) for vendor in batch)
+        )
+        _raise_cache_miss([outcome for vendor_outcomes in outcomes for outcome in vendor_outcomes])
+
+        # Add results vendor by vendor, in configuration order
+        for vendor, vendor_outcomes in zip(batch, outcomes):
+            _record_vendor_outcome(vendor, method, vendor_outcomes)
+            results.extend(outcome for outcome in vendor_outcomes if _succeeded(outcome))
+
+        # Stopping logic: Stop after first successful vendor for single-vendor configs
+        if results and len(primary_vendors) == 1:
+            break
+
+    return _finish_route(method, call_start, results, vendor_attempt_count)
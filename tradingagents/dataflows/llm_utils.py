@@ -1,5 +1,101 @@
-from litellm import completion
+import time
+from datetime import datetime
+
+from litellm import acompletion, completion
 from .config import get_config
+from .disk_cache import DiskCache
+
+# Search-grounded answers for historical windows are kept forever
+_llm_cache = DiskCache("llm_vendors", max_bytes_key="llm_vendor_cache_max_bytes", default_max_bytes=64 * 1024 * 1024)
+
+
+class LLMCacheMissError(Exception):
+    """Raised in cache-only mode when a response is not cached."""
+
+
+def _normalize_date(value) -> str:
+    value = str(value).strip()
+    for fmt in ("%Y-%m-%d", "%Y%m%d", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return value
+
+
+def _cache_expiry(window_end: str):
+    """Epoch expiry for a window ending on ``window_end``; None for closed windows."""
+    try:
+        if datetime.strptime(window_end, "%Y-%m-%d").date() < datetime.now().date():
+            return None
+    except ValueError:
+        pass
+    return time.time() + get_config().get("llm_vendor_cache_ttl", 900)
+
+
+def _cache_lookup(function_name: str, key_args: dict):
+    """Return (cache key or None when caching is off, cached response or None).
+
+    ``llm_vendor_cache_mode`` is "read_write" (default), "cache_only" (never call
+    the model; raise LLMCacheMissError on a miss) or "off".
+    """
+    config = get_config()
+    mode = config.get("llm_vendor_cache_mode", "read_write")
+    if mode == "off":
+        return None, None
+    cache_key = {"function": function_name, "model": config["quick_think_llm"], **key_args}
+    cached = _llm_cache.get(cache_key)
+    if cached is None and mode == "cache_only":
+        raise LLMCacheMissError(f"{function_name} not cached for {key_args} (cache-only mode)")
+    return cache_key, cached
+
+
+def _completion_kwargs(content: str) -> dict:
+    config = get_config()
+    model = config["quick_think_llm"]
+    return dict(
+        model=model,
+        messages=[{"role": "user", "content": content}],
+        base_url=config.get("backend_url"),
+        temperature=1,
+        max_tokens=4096,
+        top_p=1,
+        tools=get_search_tool_for_model(model), # Pass the provider-specific tool
+    )
+
+
+def _store(cache_key, window_end: str, response) -> str:
+    # Handle response format differences if necessary, but usually content is in message.content
+    result = response.choices[0].message.content
+    if cache_key is not None and result:
+        _llm_cache.set(cache_key, result, _cache_expiry(window_end))
+    return result
+
+
+def _cached_completion(function_name: str, key_args: dict, window_end: str, content: str) -> str:
+    """Run a search-grounded completion through the on-disk response cache."""
+    cache_key, cached = _cache_lookup(function_name, key_args)
+    if cached is not None:
+        return cached
+    return _store(cache_key, window_end, completion(**_completion_kwargs(content)))
+
+
+async def _acached_completion(function_name: str, key_args: dict, window_end: str, content: str) -> str:
+    """Async ``_cached_completion`` (``litellm.acompletion``)."""
+    cache_key, cached = _cache_lookup(function_name, key_args)
+    if cached is not None:
+        return cached
+    return _store(cache_key, window_end, await acompletion(**_completion_kwargs(content)))
+
+
+def clear_llm_cache() -> None:
+    """Remove every cached LLM vendor response."""
+    _llm_cache.clear()
+
+
+def get_llm_cache_stats() -> dict:
+    """Return hit/miss/eviction counters of the LLM vendor cache."""
+    return _llm_cache.stats()
 
 def get_search_tool_for_model(model_name):
     """
@@ -28,80 +124,55 @@ def get_search_tool_for_model(model_name):
             }
         ]
 
-def get_stock_news_llm(query, start_date, end_date):
-    config = get_config()
-    model = config["quick_think_llm"]
-    
-    messages = [
-        {
-            "role": "user",
-            "content": f"Can you search Social Media for {query} from {start_date} to {end_date}? Make sure you only get the data posted during that period."
-        }
-    ]
+def _stock_news_request(query, start_date, end_date) -> tuple:
+    start_date, end_date = _normalize_date(start_date), _normalize_date(end_date)
+    return (
+        "get_stock_news_llm",
+        {"query": str(query).strip().upper(), "start_date": start_date, "end_date": end_date},
+        end_date,
+        f"Can you search Social Media for {query} from {start_date} to {end_date}? Make sure you only get the data posted during that period.",
+    )
 
-    tools = get_search_tool_for_model(model)
 
-    response = completion(
-        model=model,
-        messages=messages,
-        base_url=config.get("backend_url"),
-        temperature=1,
-        max_tokens=4096,
-        top_p=1,
-        tools=tools # Pass the provider-specific tool
+def _global_news_request(curr_date, look_back_days, limit) -> tuple:
+    curr_date = _normalize_date(curr_date)
+    return (
+        "get_global_news_llm",
+        {"curr_date": curr_date, "look_back_days": int(look_back_days), "limit": int(limit)},
+        curr_date,
+        f"Can you search global or macroeconomics news from {look_back_days} days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period. Limit the results to {limit} articles.",
     )
 
-    # Handle response format differences if necessary, but usually content is in message.content
-    return response.choices[0].message.content
 
+def _fundamentals_request(ticker, curr_date) -> tuple:
+    curr_date = _normalize_date(curr_date)
+    return (
+        "get_fundamentals_llm",
+        {"ticker": str(ticker).strip().upper(), "curr_date": curr_date},
+        curr_date,
+        f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
+    )
 
-def get_global_news_llm(curr_date, look_back_days=7, limit=5):
-    config = get_config()
-    model = config["quick_think_llm"]
-    
-    messages = [
-        {
-            "role": "user",
-            "content": f"Can you search global or macroeconomics news from {look_back_days} days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period. Limit the results to {limit} articles."
-        }
-    ]
 
-    tools = get_search_tool_for_model(model)
+def get_stock_news_llm(query, start_date, end_date):
+    return _cached_completion(*_stock_news_request(query, start_date, end_date))
 
-    response = completion(
-        model=model,
-        messages=messages,
-        base_url=config.get("backend_url"),
-        temperature=1,
-        max_tokens=4096,
-        top_p=1,
-        tools=tools
-    )
 
-    return response.choices[0].message.content
+def get_global_news_llm(curr_date, look_back_days=7, limit=5):
+    return _cached_completion(*_global_news_request(curr_date, look_back_days, limit))
 
 
 def get_fundamentals_llm(ticker, curr_date):
-    config = get_config()
-    model = config["quick_think_llm"]
-    
-    messages = [
-        {
-            "role": "user",
-            "content": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc"
-        }
-    ]
+    return _cached_completion(*_fundamentals_request(ticker, curr_date))
 
-    tools = get_search_tool_for_model(model)
 
-    response = completion(
-        model=model,
-        messages=messages,
-        base_url=config.get("backend_url"),
-        temperature=1,
-        max_tokens=4096,
-        top_p=1,
-        tools=tools
-    )
+async def aget_stock_news_llm(query, start_date, end_date):
+    return await _acached_completion(*_stock_news_request(query, start_date, end_date))
+
+
+async def aget_global_news_llm(curr_date, look_back_days=7, limit=5):
+    return await _acached_completion(*_global_news_request(curr_date, look_back_days, limit))
+
 
-    return response.choices[0].message.content
+async def aget_fundamentals_llm(ticker, curr_date):
+    return await _acached_completion(*_fundamentals_request(ticker, curr_date))
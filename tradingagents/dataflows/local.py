@@ -5,8 +5,11 @@ from .config import DATA_DIR
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import json
-from .reddit_utils import fetch_top_from_category
-from tqdm import tqdm
+from .reddit_utils import fetch_top_in_range
+from .price_store import get_local_coverage, get_prices, slice_prices
+from .finnhub_store import query_range
+from .simfin_store import get_latest_report
+from .records import collect_records, render_records, unique_records
 
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -18,24 +21,12 @@ def get_YFin_data_window(
     before = date_obj - relativedelta(days=look_back_days)
     start_date = before.strftime("%Y-%m-%d")
 
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
+    # read in data from the shared price store
+    data = get_prices(symbol, "local")
 
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= curr_date)
-    ]
-
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # Slice data between the start and end dates (inclusive)
+    filtered_data = slice_prices(data, start_date, curr_date).copy()
+    filtered_data["Date"] = filtered_data["Date"].dt.strftime("%Y-%m-%d")
 
     # Set pandas display options to show the full DataFrame
     with pd.option_context(
@@ -53,29 +44,18 @@ def get_YFin_data(
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
-    # read in data
-    data = pd.read_csv(
-        os.path.join(
-            DATA_DIR,
-            f"market_data/price_data/{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-        )
-    )
-
-    if end_date > "2025-03-25":
+    coverage_start, coverage_end = get_local_coverage(symbol)
+    if end_date > coverage_end:
         raise Exception(
-            f"Get_YFin_Data: {end_date} is outside of the data range of 2015-01-01 to 2025-03-25"
+            f"Get_YFin_Data: {end_date} is outside of the data range of {coverage_start} to {coverage_end}"
         )
 
-    # Extract just the date part for comparison
-    data["DateOnly"] = data["Date"].str[:10]
-
-    # Filter data between the start and end dates (inclusive)
-    filtered_data = data[
-        (data["DateOnly"] >= start_date) & (data["DateOnly"] <= end_date)
-    ]
+    # read in data from the shared price store
+    data = get_prices(symbol, "local")
 
-    # Drop the temporary column we created
-    filtered_data = filtered_data.drop("DateOnly", axis=1)
+    # Slice data between the start and end dates (inclusive)
+    filtered_data = slice_prices(data, start_date, end_date).copy()
+    filtered_data["Date"] = filtered_data["Date"].dt.strftime("%Y-%m-%d")
 
     # remove the index from the dataframe
     filtered_data = filtered_data.reset_index(drop=True)
@@ -104,15 +84,11 @@ def get_finnhub_news(
     if len(result) == 0:
         return ""
 
-    combined_result = ""
-    for day, data in result.items():
-        if len(data) == 0:
-            continue
-        for entry in data:
-            current_news = (
-                "### " + entry["headline"] + f" ({day})" + "\n" + entry["summary"]
-            )
-            combined_result += current_news + "\n\n"
+    # the same story is often filed under several days; keep its first day
+    combined_result = render_records(
+        collect_records(result, key=lambda entry: (entry["headline"], entry["summary"])),
+        lambda day, entry: f"### {entry['headline']} ({day})\n{entry['summary']}\n\n",
+    )
 
     return f"## {query} News, from {start_date} to {end_date}:\n" + str(combined_result)
 
@@ -139,13 +115,10 @@ def get_finnhub_company_insider_sentiment(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
-                seen_dicts.append(entry)
+    result_str = render_records(
+        collect_records(data, sort_key=lambda entry: (entry["year"], entry["month"])),
+        lambda date, entry: f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n",
+    )
 
     return (
         f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n"
@@ -176,14 +149,10 @@ def get_finnhub_company_insider_transactions(
     if len(data) == 0:
         return ""
 
-    result_str = ""
-
-    seen_dicts = []
-    for date, senti_list in data.items():
-        for entry in senti_list:
-            if entry not in seen_dicts:
-                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
-                seen_dicts.append(entry)
+    result_str = render_records(
+        collect_records(data, sort_key=lambda entry: entry["filingDate"] or ""),
+        lambda date, entry: f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n",
+    )
 
     return (
         f"## {ticker} insider transactions from {before} to {curr_date}:\n"
@@ -214,15 +183,8 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
             data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
         )
 
-    data = open(data_path, "r")
-    data = json.load(data)
-
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    # date-sorted store of the file, parsed once per process
+    return query_range(data_path, start_date, end_date)
 
 def get_simfin_balance_sheet(
     ticker: Annotated[str, "ticker symbol"],
@@ -241,26 +203,14 @@ def get_simfin_balance_sheet(
         "us",
         f"us-balance-{freq}.csv",
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Latest report published on or before the current date, from the per-ticker store
+    latest_balance_sheet = get_latest_report(data_path, ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_balance_sheet is None:
         print("No balance sheet available before the given current date.")
         return ""
 
-    # Get the most recent balance sheet by selecting the row with the latest Publish Date
-    latest_balance_sheet = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_balance_sheet = latest_balance_sheet.drop("SimFinId")
 
@@ -288,26 +238,14 @@ def get_simfin_cashflow(
         "us",
         f"us-cashflow-{freq}.csv",
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Latest report published on or before the current date, from the per-ticker store
+    latest_cash_flow = get_latest_report(data_path, ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_cash_flow is None:
         print("No cash flow statement available before the given current date.")
         return ""
 
-    # Get the most recent cash flow statement by selecting the row with the latest Publish Date
-    latest_cash_flow = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_cash_flow = latest_cash_flow.drop("SimFinId")
 
@@ -335,26 +273,14 @@ def get_simfin_income_statements(
         "us",
         f"us-income-{freq}.csv",
     )
-    df = pd.read_csv(data_path, sep=";")
-
-    # Convert date strings to datetime objects and remove any time components
-    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
-    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
-
-    # Convert the current date to datetime and normalize
-    curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
-
-    # Filter the DataFrame for the given ticker and for reports that were published on or before the current date
-    filtered_df = df[(df["Ticker"] == ticker) & (df["Publish Date"] <= curr_date_dt)]
+    # Latest report published on or before the current date, from the per-ticker store
+    latest_income = get_latest_report(data_path, ticker, curr_date)
 
     # Check if there are any available reports; if not, return a notification
-    if filtered_df.empty:
+    if latest_income is None:
         print("No income statement available before the given current date.")
         return ""
 
-    # Get the most recent income statement by selecting the row with the latest Publish Date
-    latest_income = filtered_df.loc[filtered_df["Publish Date"].idxmax()]
-
     # drop the SimFinID column
     latest_income = latest_income.drop("SimFinId")
 
@@ -365,6 +291,12 @@ def get_simfin_income_statements(
     )
 
 
+def _render_reddit_post(post: dict) -> str:
+    if post["content"] == "":
+        return f"### {post['title']}\n\n"
+    return f"### {post['title']}\n\n{post['content']}\n\n"
+
+
 def get_reddit_global_news(
     curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "Number of days to look back"] = 7,
@@ -384,36 +316,22 @@ def get_reddit_global_news(
     before = curr_date_dt - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
 
-    posts = []
-    # iterate from before to curr_date
-    curr_iter_date = datetime.strptime(before, "%Y-%m-%d")
-
-    total_iterations = (curr_date_dt - curr_iter_date).days + 1
-    pbar = tqdm(desc=f"Getting Global News on {curr_date}", total=total_iterations)
-
-    while curr_iter_date <= curr_date_dt:
-        curr_date_str = curr_iter_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "global_news",
-            curr_date_str,
-            limit,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_iter_date += relativedelta(days=1)
-        pbar.update(1)
-
-    pbar.close()
+    # one indexed query over the whole window, top posts per day
+    posts = fetch_top_in_range(
+        "global_news",
+        before,
+        curr_date,
+        limit,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
+    )
 
     if len(posts) == 0:
         return ""
 
-    news_str = ""
-    for post in posts:
-        if post["content"] == "":
-            news_str += f"### {post['title']}\n\n"
-        else:
-            news_str += f"### {post['title']}\n\n{post['content']}\n\n"
+    news_str = render_records(
+        unique_records(posts, key=lambda post: (post["title"], post["content"])),
+        _render_reddit_post,
+    )
 
     return f"## Global News Reddit, from {before} to {curr_date}:\n{news_str}"
 
@@ -433,43 +351,22 @@ def get_reddit_company_news(
         str: A formatted string containing news articles posts on reddit
     """
 
-    start_date_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    end_date_dt = datetime.strptime(end_date, "%Y-%m-%d")
-
-    posts = []
-    # iterate from start_date to end_date
-    curr_date = start_date_dt
-
-    total_iterations = (end_date_dt - curr_date).days + 1
-    pbar = tqdm(
-        desc=f"Getting Company News for {query} from {start_date} to {end_date}",
-        total=total_iterations,
+    # one indexed query over the whole window, top posts per day
+    posts = fetch_top_in_range(
+        "company_news",
+        start_date,
+        end_date,
+        10,  # max limit per day
+        query,
+        data_path=os.path.join(DATA_DIR, "reddit_data"),
     )
 
-    while curr_date <= end_date_dt:
-        curr_date_str = curr_date.strftime("%Y-%m-%d")
-        fetch_result = fetch_top_from_category(
-            "company_news",
-            curr_date_str,
-            10,  # max limit per day
-            query,
-            data_path=os.path.join(DATA_DIR, "reddit_data"),
-        )
-        posts.extend(fetch_result)
-        curr_date += relativedelta(days=1)
-
-        pbar.update(1)
-
-    pbar.close()
-
     if len(posts) == 0:
         return ""
 
-    news_str = ""
-    for post in posts:
-        if post["content"] == "":
-            news_str += f"### {post['title']}\n\n"
-        else:
-            news_str += f"### {post['title']}\n\n{post['content']}\n\n"
+    news_str = render_records(
+        unique_records(posts, key=lambda post: (post["title"], post["content"])),
+        _render_reddit_post,
+    )
 
     return f"##{query} News Reddit, from {start_date} to {end_date}:\n\n{news_str}"
\ No newline at end of file
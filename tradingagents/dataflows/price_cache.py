@@ -0,0 +1,122 @@
+"""
+Process-wide LRU cache of prepared price DataFrames.
+
+Within one graph run the same symbol is loaded by get_stock_data and by every
+get_indicators call. The price store keeps those frames on disk; this cache
+keeps the cleaned, typed frames in memory, keyed by symbol, vendor and the
+version of the backing data (see ``price_store.get_prices``), bounded by entry
+count and by total bytes.
+
+Cached frames are shared between callers and must be treated as read-only.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import pandas as pd
+
+from .config import get_config
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class PriceFrameCache:
+    """Thread-safe, size-bounded LRU of price DataFrames with hit/miss counters."""
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """Limits default to the ``price_cache_max_*`` config values when not given."""
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._frames = OrderedDict()  # key -> (frame, nbytes)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return get_config().get("price_cache_max_entries", DEFAULT_MAX_ENTRIES)
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return get_config().get("price_cache_max_bytes", DEFAULT_MAX_BYTES)
+
+    def get(self, key) -> Optional[pd.DataFrame]:
+        """Return the cached frame for ``key`` (refreshing its recency) or None."""
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, frame: pd.DataFrame) -> None:
+        """Insert ``frame`` and evict least recently used entries over the limits."""
+        nbytes = int(frame.memory_usage(deep=True).sum())
+        with self._lock:
+            old = self._frames.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            max_entries, max_bytes = self.max_entries, self.max_bytes
+            if max_entries <= 0 or nbytes > max_bytes:
+                # Caching disabled, or the frame alone would blow the budget
+                return
+
+            self._frames[key] = (frame, nbytes)
+            self._bytes += nbytes
+            while len(self._frames) > max_entries or self._bytes > max_bytes:
+                _, (_, evicted_bytes) = self._frames.popitem(last=False)
+                self._bytes -= evicted_bytes
+                self.evictions += 1
+
+    def invalidate(self, symbol: str) -> None:
+        """Drop every cached frame of ``symbol`` (all vendors and dates)."""
+        with self._lock:
+            for key in [key for key in self._frames if key[0] == symbol]:
+                self._bytes -= self._frames.pop(key)[1]
+
+    def clear(self) -> None:
+        """Drop all cached frames and reset the counters."""
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return a snapshot of the cache counters and memory use."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._frames),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Shared by y_finance, stockstats_utils and local through price_store.get_prices
+price_cache = PriceFrameCache()
+
+
+def get_price_cache_stats() -> dict:
+    """Return hit/miss counters and memory use of the shared price cache."""
+    return price_cache.stats()
+
+
+def clear_price_cache() -> None:
+    """Empty the shared price cache."""
+    price_cache.clear()
@@ -0,0 +1,513 @@
+"""
+Per-symbol columnar OHLCV store shared by every price consumer in dataflows.
+
+Daily bars are kept as one Parquet file per symbol under
+``data_cache_dir/price_store/<source>/`` with typed columns, next to a small
+JSON sidecar recording the covered date range. Online symbols are topped up
+incrementally: only the bars after the last stored date are downloaded, and a
+full refresh happens only when Yahoo re-adjusts the history (split/dividend).
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Annotated, Optional
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .price_cache import price_cache
+
+PRICE_COLUMNS = [
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "Adj Close",
+    "Volume",
+    "Dividends",
+    "Stock Splits",
+]
+
+# Default depth of history kept for online symbols
+HISTORY_YEARS = 15
+
+# Location and file naming of the local (Tauric TradingDB) price CSVs under data_dir
+LOCAL_PRICE_DIR = os.path.join("market_data", "price_data")
+_LOCAL_PRICE_FILE_RE = re.compile(
+    r"^(?P<symbol>.+)-YFin-data-(?P<start>\d{4}-\d{2}-\d{2})-(?P<end>\d{4}-\d{2}-\d{2})\.csv$"
+)
+
+# (price dir, dir mtime) the local manifest was built from, and the manifest
+_local_manifest = (None, {})
+_local_manifest_lock = threading.Lock()
+
+# Relative tolerance used to detect that Yahoo re-adjusted already stored bars
+_ADJUSTMENT_TOLERANCE = 1e-6
+
+_symbol_locks = {}
+_symbol_locks_guard = threading.Lock()
+
+
+def _symbol_lock(source: str, symbol: str) -> threading.Lock:
+    with _symbol_locks_guard:
+        return _symbol_locks.setdefault((source, symbol), threading.Lock())
+
+
+def get_store_dir(source: str = "yfinance") -> str:
+    """Return (and create) the store directory for a price source."""
+    config = get_config()
+    store_dir = os.path.join(config["data_cache_dir"], "price_store", source)
+    os.makedirs(store_dir, exist_ok=True)
+    return store_dir
+
+
+def _store_paths(source: str, symbol: str):
+    store_dir = get_store_dir(source)
+    return (
+        os.path.join(store_dir, f"{symbol}.parquet"),
+        os.path.join(store_dir, f"{symbol}.json"),
+    )
+
+
+def _read_store(source: str, symbol: str):
+    data_path, meta_path = _store_paths(source, symbol)
+    if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+        return None, {}
+    try:
+        data = pd.read_parquet(data_path)
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+    except Exception as e:
+        print(f"Warning: discarding unreadable price store entry for {symbol}: {e}")
+        return None, {}
+    return data, meta
+
+
+def _write_store(source: str, symbol: str, data: pd.DataFrame, meta: dict) -> None:
+    data_path, meta_path = _store_paths(source, symbol)
+
+    # Write to temporary files first so readers never see a half-written entry
+    data.to_parquet(data_path + ".tmp", index=False)
+    with open(meta_path + ".tmp", "w") as f:
+        json.dump(meta, f)
+    os.replace(data_path + ".tmp", data_path)
+    os.replace(meta_path + ".tmp", meta_path)
+    # Frames of the previous store contents must not be served any more
+    price_cache.invalidate(symbol)
+
+
+def normalize_prices(data: pd.DataFrame) -> pd.DataFrame:
+    """Return raw price data as a Date-sorted frame with typed OHLCV columns.
+
+    Accepts yfinance output (DatetimeIndex, possibly tz-aware or with
+    MultiIndex columns) as well as CSV reads with a string ``Date`` column.
+    """
+    data = data.copy()
+
+    # Flatten MultiIndex columns produced by yf.download
+    if isinstance(data.columns, pd.MultiIndex):
+        data.columns = data.columns.get_level_values(0)
+
+    if "Date" not in data.columns:
+        data = data.reset_index()
+        data = data.rename(columns={data.columns[0]: "Date"})
+
+    dates = data["Date"]
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        dates = dates.dt.normalize()
+    else:
+        # Local CSVs carry "YYYY-MM-DD HH:MM:SS-05:00" style strings
+        dates = pd.to_datetime(dates.astype(str).str[:10], errors="coerce")
+
+    columns = [col for col in PRICE_COLUMNS if col in data.columns]
+    result = pd.DataFrame({"Date": dates})
+    for col in columns:
+        # Coerce once at ingest so consumers never need a numeric repair pass
+        result[col] = pd.to_numeric(data[col], errors="coerce").astype("float64")
+
+    result = result.dropna(subset=["Date"])
+    if "Close" in result.columns:
+        result = result.dropna(subset=["Close"])
+    if "Volume" in result.columns:
+        result["Volume"] = result["Volume"].fillna(0).astype("int64")
+
+    result = result.drop_duplicates(subset="Date", keep="last")
+    return result.sort_values("Date").reset_index(drop=True)
+
+
+def _empty_prices() -> pd.DataFrame:
+    return normalize_prices(pd.DataFrame({"Date": pd.Series(dtype="datetime64[ns]")}))
+
+
+def _download(symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Download daily bars in [start, end) from Yahoo Finance."""
+    if start >= end:
+        return _empty_prices()
+    data = yf.Ticker(symbol).history(
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        auto_adjust=True,
+    )
+    if data is None or data.empty:
+        return _empty_prices()
+    return normalize_prices(data)
+
+
+def _with_coverage(meta: dict, data: pd.DataFrame) -> dict:
+    """Record the row count and first/last stored dates in the sidecar."""
+    meta["rows"] = len(data)
+    if not data.empty:
+        meta["first_date"] = data["Date"].iloc[0].strftime("%Y-%m-%d")
+        meta["last_date"] = data["Date"].iloc[-1].strftime("%Y-%m-%d")
+    return meta
+
+
+def _needs_full_refresh(stored: pd.DataFrame, tail: pd.DataFrame) -> bool:
+    """Check whether a tail fetch shows that stored bars were re-adjusted."""
+    last_date = stored["Date"].iloc[-1]
+    overlap = tail[tail["Date"] == last_date]
+    if not overlap.empty:
+        stored_close = stored["Close"].iloc[-1]
+        fetched_close = overlap["Close"].iloc[0]
+        if abs(fetched_close - stored_close) > _ADJUSTMENT_TOLERANCE * max(abs(stored_close), 1.0):
+            return True
+
+    # A new split or dividend back-adjusts every earlier bar
+    new_bars = tail[tail["Date"] > last_date]
+    for col in ("Dividends", "Stock Splits"):
+        if col in new_bars.columns and (new_bars[col] != 0).any():
+            return True
+    return False
+
+
+def get_price_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[Optional[str], "earliest date required, yyyy-mm-dd"] = None,
+) -> pd.DataFrame:
+    """Return stored daily bars for ``symbol`` from Yahoo Finance.
+
+    The store is checked against the network at most once per day; only the
+    bars after the last stored date are downloaded. History before the stored
+    coverage is fetched on demand when ``start_date`` asks for it.
+    """
+    symbol = symbol.upper()
+    today = pd.Timestamp.today().normalize()
+    start = today - pd.DateOffset(years=HISTORY_YEARS)
+    if start_date:
+        start = min(start, pd.Timestamp(start_date).normalize())
+
+    with _symbol_lock("yfinance", symbol):
+        data, meta = _read_store("yfinance", symbol)
+        today_str = today.strftime("%Y-%m-%d")
+        changed = False
+
+        if data is None:
+            data = _download(symbol, start, today)
+            meta = {"coverage_start": start.strftime("%Y-%m-%d")}
+            changed = True
+        else:
+            coverage_start = pd.Timestamp(meta["coverage_start"])
+            if start < coverage_start:
+                head = _download(symbol, start, coverage_start)
+                data = normalize_prices(pd.concat([head, data], ignore_index=True))
+                meta["coverage_start"] = start.strftime("%Y-%m-%d")
+                changed = True
+
+            if meta.get("last_checked") != today_str:
+                if data.empty:
+                    data = _download(symbol, pd.Timestamp(meta["coverage_start"]), today)
+                else:
+                    # Re-fetch the last stored bar too, to detect re-adjustments
+                    tail = _download(symbol, data["Date"].iloc[-1], today)
+                    if _needs_full_refresh(data, tail):
+                        data = _download(
+                            symbol, pd.Timestamp(meta["coverage_start"]), today
+                        )
+                    elif not tail.empty:
+                        data = normalize_prices(pd.concat([data, tail], ignore_index=True))
+                changed = True
+
+        if changed:
+            meta["last_checked"] = today_str
+            _write_store("yfinance", symbol, data, _with_coverage(meta, data))
+
+    data.attrs["coverage_start"] = meta["coverage_start"]
+
+    return data
+
+
+def _download_batch(symbols: list, start: pd.Timestamp, end: pd.Timestamp):
+    """Download daily bars in [start, end) for many symbols in one request.
+
+    Returns:
+        (frames, failures): normalized frames and error messages by symbol
+    """
+    if not symbols or start >= end:
+        return {symbol: _empty_prices() for symbol in symbols}, {}
+
+    try:
+        data = yf.download(
+            symbols,
+            start=start.strftime("%Y-%m-%d"),
+            end=end.strftime("%Y-%m-%d"),
+            group_by="ticker",
+            auto_adjust=True,
+            actions=True,
+            progress=False,
+            threads=True,
+        )
+    except Exception as e:
+        return {}, {symbol: f"batch download failed: {e}" for symbol in symbols}
+
+    frames, failures = {}, {}
+    for symbol in symbols:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                failures[symbol] = "no data returned"
+                continue
+            raw = data[symbol]
+        else:
+            raw = data
+        frames[symbol] = normalize_prices(raw) if not raw.empty else _empty_prices()
+    return frames, failures
+
+
+def prefetch_prices(
+    symbols: Annotated[list, "ticker symbols to load into the price store"],
+    start_date: Annotated[Optional[str], "earliest date required, yyyy-mm-dd"] = None,
+    end_date: Annotated[Optional[str], "end date (exclusive), yyyy-mm-dd"] = None,
+) -> dict:
+    """Load many symbols into the price store with batched yfinance downloads.
+
+    Symbols missing from the store are fetched in one request, symbols that
+    only need their recent bars in another, instead of one download per
+    symbol on first use. Later get_prices calls are then served locally.
+
+    Returns:
+        dict with "fetched" (symbols written to the store), "up_to_date"
+        (symbols the store already covered) and "failed" (symbol -> reason)
+    """
+    today = pd.Timestamp.today().normalize()
+    today_str = today.strftime("%Y-%m-%d")
+    end = min(pd.Timestamp(end_date).normalize(), today) if end_date else today
+    start = today - pd.DateOffset(years=HISTORY_YEARS)
+    if start_date:
+        start = min(start, pd.Timestamp(start_date).normalize())
+
+    report = {"fetched": [], "up_to_date": [], "failed": {}}
+
+    # Work out what each symbol is missing from the store
+    full_symbols, tail_starts, stored = [], {}, {}
+    for symbol in dict.fromkeys(symbol.upper() for symbol in symbols):
+        data, meta = _read_store("yfinance", symbol)
+        if data is None or data.empty or start < pd.Timestamp(meta["coverage_start"]):
+            full_symbols.append(symbol)
+        elif meta.get("last_checked") != today_str and data["Date"].iloc[-1] + pd.Timedelta(days=1) < end:
+            # Re-fetch the last stored bar too, to detect re-adjustments
+            tail_starts[symbol] = data["Date"].iloc[-1]
+            stored[symbol] = (data, meta)
+        else:
+            report["up_to_date"].append(symbol)
+
+    # symbol -> (new frame, start of the fetched range, replaces stored data)
+    fetched = {}
+
+    frames, failures = _download_batch(full_symbols, start, end)
+    report["failed"].update(failures)
+    for symbol, frame in frames.items():
+        fetched[symbol] = (frame, start, True)
+
+    if tail_starts:
+        frames, failures = _download_batch(list(tail_starts), min(tail_starts.values()), end)
+        report["failed"].update(failures)
+
+        refresh = []
+        for symbol, frame in frames.items():
+            tail = frame[frame["Date"] >= tail_starts[symbol]]
+            if _needs_full_refresh(stored[symbol][0], tail):
+                refresh.append(symbol)
+            else:
+                fetched[symbol] = (tail, None, False)
+
+        if refresh:
+            refresh_start = min(
+                [start] + [pd.Timestamp(stored[symbol][1]["coverage_start"]) for symbol in refresh]
+            )
+            frames, failures = _download_batch(refresh, refresh_start, end)
+            report["failed"].update(failures)
+            for symbol, frame in frames.items():
+                fetched[symbol] = (frame, refresh_start, True)
+
+    for symbol, (frame, fetch_start, replace) in fetched.items():
+        if replace and frame.empty:
+            report["failed"][symbol] = "no data returned"
+            continue
+
+        with _symbol_lock("yfinance", symbol):
+            data, meta = _read_store("yfinance", symbol)
+            if replace:
+                data = frame
+                meta = {"coverage_start": fetch_start.strftime("%Y-%m-%d")}
+            elif data is None:
+                report["failed"][symbol] = "store entry removed during prefetch"
+                continue
+            else:
+                data = normalize_prices(pd.concat([data, frame], ignore_index=True))
+            if end == today:
+                meta["last_checked"] = today_str
+            _write_store("yfinance", symbol, data, _with_coverage(meta, data))
+
+        report["fetched"].append(symbol)
+
+    return report
+
+
+def get_local_price_manifest() -> dict:
+    """Return {SYMBOL: {"path", "start", "end"}} for the local price CSVs.
+
+    Coverage is parsed from the ``{symbol}-YFin-data-{start}-{end}.csv`` file
+    names; the directory is rescanned only when its contents change. When
+    several files exist for one symbol, the one reaching furthest is used.
+    """
+    global _local_manifest
+    price_dir = os.path.join(get_config()["data_dir"], LOCAL_PRICE_DIR)
+    try:
+        dir_mtime = os.path.getmtime(price_dir)
+    except OSError:
+        return {}
+
+    with _local_manifest_lock:
+        if _local_manifest[0] == (price_dir, dir_mtime):
+            return _local_manifest[1]
+
+        manifest = {}
+        for file_name in os.listdir(price_dir):
+            match = _LOCAL_PRICE_FILE_RE.match(file_name)
+            if match is None:
+                continue
+            symbol = match["symbol"].upper()
+            entry = {
+                "path": os.path.join(price_dir, file_name),
+                "start": match["start"],
+                "end": match["end"],
+            }
+            current = manifest.get(symbol)
+            if current is None or (entry["end"], entry["start"]) > (current["end"], current["start"]):
+                manifest[symbol] = entry
+        _local_manifest = ((price_dir, dir_mtime), manifest)
+        return manifest
+
+
+def _local_price_entry(symbol: str) -> dict:
+    entry = get_local_price_manifest().get(symbol.upper())
+    if entry is None:
+        raise FileNotFoundError(
+            f"No local price data for {symbol} in {os.path.join(get_config()['data_dir'], LOCAL_PRICE_DIR)}"
+        )
+    return entry
+
+
+def get_local_coverage(symbol: str) -> tuple:
+    """Return the (start, end) dates covered by the local CSV of ``symbol``.
+
+    Raises:
+        FileNotFoundError: When no local price file exists for the symbol
+    """
+    entry = _local_price_entry(symbol)
+    return entry["start"], entry["end"]
+
+
+def slice_prices(data: pd.DataFrame, start_date: Optional[str] = None, end_date: Optional[str] = None, inclusive_end: bool = True) -> pd.DataFrame:
+    """Rows of a Date-sorted price frame within [start_date, end_date].
+
+    Uses binary search on the Date column instead of boolean masks. With
+    ``inclusive_end=False`` the end date itself is excluded.
+    """
+    dates = data["Date"]
+    lo = 0 if start_date is None else dates.searchsorted(pd.Timestamp(start_date), side="left")
+    if end_date is None:
+        hi = len(data)
+    else:
+        hi = dates.searchsorted(pd.Timestamp(end_date), side="right" if inclusive_end else "left")
+    return data.iloc[lo:hi]
+
+
+def get_local_price_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+) -> pd.DataFrame:
+    """Return daily bars for ``symbol`` from the local price CSVs.
+
+    The CSV is converted into the columnar store on first use and re-imported
+    only when the source file changes.
+
+    Raises:
+        FileNotFoundError: When no local price file exists for the symbol
+    """
+    csv_path = _local_price_entry(symbol)["path"]
+    stat = os.stat(csv_path)
+    source_mtime, source_size = stat.st_mtime, stat.st_size
+
+    with _symbol_lock("local", symbol):
+        data, meta = _read_store("local", symbol)
+        if data is None or (meta.get("source_mtime"), meta.get("source_size")) != (source_mtime, source_size):
+            data = normalize_prices(pd.read_csv(csv_path))
+            meta = {"source": csv_path, "source_mtime": source_mtime, "source_size": source_size}
+            _write_store("local", symbol, data, _with_coverage(meta, data))
+
+    return data
+
+
+def get_prices(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    vendor: Annotated[str, "price source: 'yfinance' or 'local'"] = "yfinance",
+    start_date: Annotated[Optional[str], "earliest date required, yyyy-mm-dd"] = None,
+) -> pd.DataFrame:
+    """Return the full price history of ``symbol`` for a vendor.
+
+    Frames are served from the in-memory price cache and loaded from the store
+    on a miss. Cache keys include the version (mtime and size) of the backing
+    file, so a local CSV or store entry that changes is picked up right away;
+    online symbols are also keyed by the as-of date of the daily store check.
+    The returned frame is shared and must not be modified in place.
+    """
+    key = _cache_key(symbol, vendor)
+    data = price_cache.get(key)
+
+    if data is not None and start_date and vendor != "local":
+        # Extend the coverage when the caller asks for older history
+        coverage_start = data.attrs.get("coverage_start")
+        if coverage_start and pd.Timestamp(start_date) < pd.Timestamp(coverage_start):
+            data = None
+
+    if data is None:
+        if vendor == "local":
+            data = get_local_price_history(symbol)
+        else:
+            data = get_price_history(symbol, start_date)
+        # Loading may have rewritten the store entry
+        price_cache.put(_cache_key(symbol, vendor), data)
+    return data
+
+
+def _file_version(path: str) -> Optional[tuple]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cache_key(symbol: str, vendor: str) -> tuple:
+    """Price cache key: symbol, vendor and the version of the data behind them."""
+    symbol = symbol.upper()
+    if vendor == "local":
+        csv_path = _local_price_entry(symbol)["path"]
+        return (symbol, vendor, csv_path, _file_version(csv_path))
+    data_path, _ = _store_paths("yfinance", symbol)
+    as_of = pd.Timestamp.today().strftime("%Y-%m-%d")
+    return (symbol, vendor, as_of, _file_version(data_path))
@@ -0,0 +1,72 @@
+"""
+Shared record pipeline for the local data formatters.
+
+Finnhub and Reddit formatters all turn lists of JSON records into a markdown
+report: flatten the records, drop duplicates, order them and render one
+section per record. Duplicates are detected with hashable keys (a set lookup
+per record) and the report is built with a single ``str.join``.
+"""
+
+from typing import Callable, Hashable, Iterable, Optional
+
+
+def record_key(record) -> Hashable:
+    """Hashable, order-independent key of a JSON record.
+
+    Two records get the same key exactly when they compare equal.
+    """
+    if isinstance(record, dict):
+        try:
+            # Fast path for flat records
+            return frozenset(record.items())
+        except TypeError:
+            pass
+        return tuple(sorted((key, record_key(value)) for key, value in record.items()))
+    if isinstance(record, (list, tuple)):
+        return tuple(record_key(value) for value in record)
+    if isinstance(record, Hashable):
+        return record
+    return repr(record)
+
+
+def unique_records(records: Iterable, key: Callable = record_key) -> list:
+    """Records in input order, keeping the first of each ``key``."""
+    seen = set()
+    unique = []
+    for record in records:
+        record_id = key(record)
+        if record_id not in seen:
+            seen.add(record_id)
+            unique.append(record)
+    return unique
+
+
+def collect_records(
+    data_by_date: dict,
+    key: Callable = record_key,
+    sort_key: Optional[Callable] = None,
+) -> list:
+    """Flatten ``{date: [records]}`` into unique (date, record) pairs.
+
+    Pairs come in date order, then input order, unless ``sort_key`` (applied to
+    the record) is given; the sort is stable.
+    """
+    pairs = unique_records(
+        (
+            (date, record)
+            for date in sorted(data_by_date)
+            for record in data_by_date[date]
+        ),
+        key=lambda pair: key(pair[1]),
+    )
+    if sort_key is not None:
+        pairs.sort(key=lambda pair: sort_key(pair[1]))
+    return pairs
+
+
+def render_records(records: Iterable, render: Callable[..., str]) -> str:
+    """Render every record (or ``(date, record)`` pair) and join the sections."""
+    return "".join(
+        render(*record) if isinstance(record, tuple) else render(record)
+        for record in records
+    )
@@ -0,0 +1,351 @@
+"""
+SQLite index of the local Reddit JSONL corpus.
+
+The corpus is laid out as ``reddit_data/<category>/<subreddit>.jsonl``. Each post
+is ingested once into ``data_cache_dir/reddit_index.sqlite`` bucketed by its UTC
+date, so a date-range query only reads the matching rows instead of parsing
+every line of every file. Files are tracked by byte offset: lines appended to a
+JSONL file are picked up incrementally on the next query. A file that was
+rewritten or replaced (new inode, shrunk, changed without growing, or whose
+ingested bytes no longer match their fingerprint) is re-ingested from scratch.
+Malformed lines are skipped and counted per file instead of failing queries.
+
+Company-news posts are also matched against ``ticker_to_company`` at ingest,
+so looking up a company's posts is a key fetch on ``post_tickers``.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from .config import get_config
+from .telemetry import logger
+
+# Bytes at the start of a file and just before its offset that are fingerprinted
+FINGERPRINT_BYTES = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    root TEXT NOT NULL,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL DEFAULT 0,
+    mtime REAL NOT NULL DEFAULT 0,
+    inode INTEGER NOT NULL DEFAULT 0,
+    fingerprint TEXT NOT NULL DEFAULT '',
+    malformed INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (root, category, name)
+);
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    created_utc REAL NOT NULL,
+    title TEXT NOT NULL,
+    selftext TEXT NOT NULL,
+    url TEXT,
+    ups INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_file_date ON posts (file_id, date);
+CREATE TABLE IF NOT EXISTS post_tickers (
+    ticker TEXT NOT NULL,
+    post_id INTEGER NOT NULL,
+    PRIMARY KEY (ticker, post_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Columns added to ``files`` after the first release of the index
+_FILES_MIGRATIONS = {
+    "inode": "INTEGER NOT NULL DEFAULT 0",
+    "fingerprint": "TEXT NOT NULL DEFAULT ''",
+    "malformed": "INTEGER NOT NULL DEFAULT 0",
+}
+
+_write_lock = threading.Lock()
+
+
+def get_index_path() -> str:
+    """Location of the SQLite index inside the data cache directory."""
+    cache_dir = get_config()["data_cache_dir"]
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "reddit_index.sqlite")
+
+
+@contextmanager
+def _connect():
+    conn = sqlite3.connect(get_index_path(), timeout=30)
+    try:
+        conn.executescript(_SCHEMA)
+        _migrate(conn)
+        yield conn
+    finally:
+        conn.close()
+
+
+def _migrate(conn) -> None:
+    """Add missing ``files`` columns to an index built by an older version.
+
+    Their defaults never match a live file, so those files are re-ingested.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+    for column, definition in _FILES_MIGRATIONS.items():
+        if column not in columns:
+            conn.execute(f"ALTER TABLE files ADD COLUMN {column} {definition}")
+
+
+def _fingerprint(path: str, offset: int) -> str:
+    """Hash of the first bytes of ``path`` and of the bytes just before ``offset``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+        tail_start = max(0, offset - FINGERPRINT_BYTES)
+        f.seek(tail_start)
+        digest.update(f.read(offset - tail_start))
+    return digest.hexdigest()
+
+
+def _post_date(created_utc: float) -> str:
+    return datetime.fromtimestamp(created_utc, timezone.utc).strftime("%Y-%m-%d")
+
+
+def _read_new_lines(path: str, offset: int):
+    """Parse the complete JSON lines after ``offset``.
+
+    Returns:
+        (posts, new offset, number of malformed lines skipped)
+    """
+    posts = []
+    malformed = 0
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                # A trailing line without newline may still be being written
+                try:
+                    parsed = json.loads(line)
+                except ValueError:
+                    break
+            elif not line.strip():
+                offset += len(line)
+                continue
+            else:
+                try:
+                    parsed = json.loads(line)
+                except ValueError:
+                    offset += len(line)
+                    malformed += 1
+                    continue
+            offset += len(line)
+            posts.append(parsed)
+    return posts, offset, malformed
+
+
+def _post_row(file_id: int, post) -> tuple:
+    return (
+        file_id,
+        _post_date(post["created_utc"]),
+        post["created_utc"],
+        post["title"],
+        post["selftext"],
+        post["url"],
+        post["ups"],
+    )
+
+
+def _ingest_file(conn, root: str, category: str, name: str) -> int:
+    """Bring one JSONL file up to date in the index; return the posts added."""
+    path = os.path.join(root, category, name)
+    stat = os.stat(path)
+
+    row = conn.execute(
+        "SELECT id, size, mtime, inode, fingerprint, malformed FROM files "
+        "WHERE root = ? AND category = ? AND name = ?",
+        (root, category, name),
+    ).fetchone()
+    if row is None:
+        file_id = conn.execute(
+            "INSERT INTO files (root, category, name) VALUES (?, ?, ?)",
+            (root, category, name),
+        ).lastrowid
+        offset = malformed = 0
+    else:
+        file_id, offset, mtime, inode, fingerprint, malformed = row
+        if stat.st_size == offset and stat.st_mtime == mtime and stat.st_ino == inode:
+            return 0
+        # Anything but an append to the bytes already ingested is a rewrite
+        rewritten = (
+            stat.st_ino != inode
+            or stat.st_size < offset
+            or (stat.st_size == offset and stat.st_mtime != mtime)
+            or _fingerprint(path, offset) != fingerprint
+        )
+        if rewritten:
+            # Drop what we had and start over
+            _delete_file_posts(conn, file_id)
+            offset = malformed = 0
+
+    posts, offset, new_malformed = _read_new_lines(path, offset)
+    rows = []
+    for post in posts:
+        try:
+            rows.append(_post_row(file_id, post))
+        except (KeyError, TypeError, ValueError, OverflowError, OSError):
+            new_malformed += 1
+    if new_malformed:
+        logger.warning("Reddit index: skipped %d malformed lines in %s", new_malformed, path)
+    for row in rows:
+        post_id = conn.execute(
+            "INSERT INTO posts (file_id, date, created_utc, title, selftext, url, ups) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            row,
+        ).lastrowid
+        if "company" in category:
+            _associate_tickers(conn, post_id, row[3], row[4])
+    conn.execute(
+        "UPDATE files SET size = ?, mtime = ?, inode = ?, fingerprint = ?, malformed = ? WHERE id = ?",
+        (
+            offset,
+            stat.st_mtime,
+            stat.st_ino,
+            _fingerprint(path, offset),
+            malformed + new_malformed,
+            file_id,
+        ),
+    )
+    return len(rows)
+
+
+def _delete_file_posts(conn, file_id: int) -> None:
+    conn.execute(
+        "DELETE FROM post_tickers WHERE post_id IN (SELECT id FROM posts WHERE file_id = ?)",
+        (file_id,),
+    )
+    conn.execute("DELETE FROM posts WHERE file_id = ?", (file_id,))
+
+
+def _associate_tickers(conn, post_id: int, title: str, selftext: str) -> None:
+    """Record which known companies a company-news post mentions."""
+    from .reddit_utils import mentions_company, ticker_to_company
+
+    conn.executemany(
+        "INSERT OR IGNORE INTO post_tickers (ticker, post_id) VALUES (?, ?)",
+        [
+            (ticker, post_id)
+            for ticker in ticker_to_company
+            if mentions_company(ticker, title, selftext)
+        ],
+    )
+
+
+def _sync_ticker_associations(conn) -> None:
+    """Recompute all ticker associations when the company list has changed."""
+    from .reddit_utils import clear_company_matchers, ticker_to_company
+
+    version = hashlib.sha256(
+        json.dumps(ticker_to_company, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    row = conn.execute("SELECT value FROM meta WHERE key = 'tickers_version'").fetchone()
+    if row is not None and row[0] == version:
+        return
+
+    clear_company_matchers()
+    conn.execute("DELETE FROM post_tickers")
+    company_posts = conn.execute(
+        "SELECT p.id, p.title, p.selftext FROM posts p JOIN files f ON f.id = p.file_id "
+        "WHERE f.category LIKE '%company%'"
+    ).fetchall()
+    for post_id, title, selftext in company_posts:
+        _associate_tickers(conn, post_id, title, selftext)
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('tickers_version', ?)",
+        (version,),
+    )
+
+
+def refresh_reddit_index(data_path: str, categories: list = None) -> dict:
+    """Ingest new or appended JSONL lines of ``data_path`` into the index.
+
+    Args:
+        data_path: The ``reddit_data`` folder
+        categories: Category sub-folders to refresh (default: all of them)
+
+    Returns:
+        Mapping of category -> number of newly indexed posts
+    """
+    root = os.path.abspath(data_path)
+    if categories is None:
+        categories = [
+            name for name in sorted(os.listdir(root))
+            if os.path.isdir(os.path.join(root, name))
+        ]
+
+    added = {}
+    with _write_lock, _connect() as conn:
+        _sync_ticker_associations(conn)
+        for category in categories:
+            added[category] = 0
+            for name in sorted(os.listdir(os.path.join(root, category))):
+                if name.endswith(".jsonl"):
+                    added[category] += _ingest_file(conn, root, category, name)
+        conn.commit()
+    return added
+
+
+def get_malformed_line_counts(data_path: str) -> dict:
+    """Malformed lines skipped so far, as {(category, file name): count}."""
+    root = os.path.abspath(data_path)
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT category, name, malformed FROM files WHERE root = ? AND malformed > 0",
+            (root,),
+        ).fetchall()
+    return {(category, name): count for category, name, count in rows}
+
+
+def query_posts(category: str, start_date: str, end_date: str, data_path: str, ticker: str = None) -> dict:
+    """Return indexed posts of ``category`` dated within [start_date, end_date].
+
+    With ``ticker``, only the company-news posts associated with it at ingest
+    time (see ``ticker_to_company``) are returned.
+
+    Returns:
+        Mapping of subreddit file name -> list of post dicts in file order
+    """
+    root = os.path.abspath(data_path)
+    refresh_reddit_index(root, [category])
+
+    sql = (
+        "SELECT f.name, p.id, p.date, p.title, p.selftext, p.url, p.ups "
+        "FROM posts p JOIN files f ON f.id = p.file_id "
+    )
+    params = [root, category, start_date, end_date]
+    if ticker is not None:
+        sql += "JOIN post_tickers t ON t.post_id = p.id AND t.ticker = ? "
+        params.insert(0, ticker)
+    sql += "WHERE f.root = ? AND f.category = ? AND p.date BETWEEN ? AND ? ORDER BY p.id"
+
+    with _connect() as conn:
+        rows = conn.execute(sql, params).fetchall()
+
+    posts = {}
+    for name, post_id, date, title, selftext, url, ups in rows:
+        posts.setdefault(name, []).append(
+            {
+                "id": post_id,
+                "title": title,
+                "content": selftext,
+                "url": url,
+                "upvotes": ups,
+                "posted_date": date,
+            }
+        )
+    return posts
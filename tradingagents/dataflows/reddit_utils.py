@@ -6,6 +6,9 @@ from contextlib import contextmanager
 from typing import Annotated
 import os
 import re
+from functools import lru_cache
+
+from .reddit_index import query_posts
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,87 +52,119 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
-    category: Annotated[
-        str, "Category to fetch top post from. Collection of subreddits."
-    ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
-    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
-    data_path: Annotated[
-        str,
-        "Path to the data folder. Default is 'reddit_data'.",
-    ] = "reddit_data",
-):
-    base_path = data_path
+@lru_cache(maxsize=None)
+def _compile_matcher(query: str, company: str) -> re.Pattern:
+    if company is None:
+        # Unknown ticker: match the symbol alone, as a whole word
+        return re.compile(rf"\b{re.escape(query)}\b", re.IGNORECASE)
 
-    all_content = []
+    if "OR" in company:
+        search_terms = company.split(" OR ")
+    else:
+        search_terms = [company]
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
-        raise ValueError(
-            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
-        )
+    search_terms.append(query)
+    return re.compile("|".join(f"(?:{term})" for term in search_terms), re.IGNORECASE)
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
-        # check if data_file is a .jsonl file
-        if not data_file.endswith(".jsonl"):
-            continue
+def company_matcher(query: str) -> re.Pattern:
+    """Compile the company's search terms (and its ticker) into one pattern.
 
-        all_content_curr_subreddit = []
+    Terms are regular expressions, as before; the alternation matches a text
+    exactly when one of the terms would. Tickers missing from
+    ``ticker_to_company`` are matched on the ticker symbol alone. Patterns are
+    cached per (ticker, search terms), so edits to the mapping take effect.
+    """
+    return _compile_matcher(query, ticker_to_company.get(query))
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
 
-                parsed_line = json.loads(line)
+def clear_company_matchers() -> None:
+    """Drop the compiled patterns (e.g. after ``ticker_to_company`` changed)."""
+    _compile_matcher.cache_clear()
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
+def mentions_company(query: str, title: str, content: str) -> bool:
+    """Check that the title or the content mentions the company (or its ticker)."""
+    matcher = company_matcher(query)
+    return bool(matcher.search(title) or matcher.search(content))
 
-                    search_terms.append(query)
 
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
+def filter_posts_mentioning(query: str, posts: list) -> list:
+    """Batch filter: keep the posts whose title or content mentions the company."""
+    search = company_matcher(query).search
+    return [post for post in posts if search(post["title"]) or search(post["content"])]
 
-                    if not found:
-                        continue
 
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
+def fetch_top_in_range(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    """Top posts of every day in [start_date, end_date], read from the Reddit index.
 
-                all_content_curr_subreddit.append(post)
+    Equivalent to calling ``fetch_top_from_category`` once per day and
+    concatenating the results, but the corpus is only queried once.
+    """
+    category_files = os.listdir(os.path.join(data_path, category))
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    if max_limit < len(category_files):
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+    limit_per_subreddit = max_limit // len(category_files)
+
+    # if is company_news, only keep posts whose title or content has the company's name (query) mentioned
+    if "company" in category and query:
+        if query in ticker_to_company:
+            # associations precomputed at ingest time
+            posts_by_file = query_posts(category, start_date, end_date, data_path, ticker=query)
+        else:
+            posts_by_file = {
+                name: filter_posts_mentioning(query, posts)
+                for name, posts in query_posts(category, start_date, end_date, data_path).items()
+            }
+    else:
+        posts_by_file = query_posts(category, start_date, end_date, data_path)
+
+    posts_by_day = {}
+    for data_file in category_files:
+        # group this subreddit's posts by day, keeping file order
+        curr_subreddit_by_day = {}
+        for post in posts_by_file.get(data_file, []):
+            curr_subreddit_by_day.setdefault(post["posted_date"], []).append(post)
+
+        for day, day_posts in curr_subreddit_by_day.items():
+            # sort by upvotes in descending order
+            day_posts.sort(key=lambda x: x["upvotes"], reverse=True)
+            posts_by_day.setdefault(day, []).extend(day_posts[:limit_per_subreddit])
 
+    all_content = []
+    for day in sorted(posts_by_day):
+        for post in posts_by_day[day]:
+            post.pop("id", None)
+            all_content.append(post)
     return all_content
+
+
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_in_range(category, date, date, max_limit, query, data_path)
@@ -0,0 +1,152 @@
+"""
+Ticker-partitioned, point-in-time store of the SimFin fundamentals CSVs.
+
+The bulk ``us-{balance,cashflow,income}-{freq}.csv`` files cover every US
+company. Each file is converted once into one Parquet file per ticker under
+``data_cache_dir/simfin_store/<csv name>/``. Report and publish dates are
+normalized at conversion time and rows are sorted by publish date, so "latest
+report published on or before D" is a binary search on a small frame. The store
+is rebuilt when the source CSV changes.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from functools import lru_cache
+from typing import Optional
+
+import pandas as pd
+
+from .config import get_config
+
+DATE_COLUMNS = ("Report Date", "Publish Date")
+# Bumped when the on-disk layout changes; older stores are rebuilt
+STORE_FORMAT = 2
+
+_locks = {}
+_locks_guard = threading.Lock()
+# store dir -> manifest of the converted CSV
+_manifests = {}
+
+
+def _source_lock(source_path: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(source_path, threading.Lock())
+
+
+def get_store_dir(source_path: str) -> str:
+    """Directory holding the per-ticker Parquet files of ``source_path``."""
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(get_config()["data_cache_dir"], "simfin_store", name)
+
+
+def _ticker_file(ticker: str) -> str:
+    """File name of ``ticker``: a readable prefix plus a hash of the exact ticker.
+
+    The hash keeps tickers that sanitize alike (``BRK.A`` / ``BRK_A``) or
+    differ only in case apart, also on case-insensitive filesystems.
+    """
+    digest = hashlib.sha256(ticker.encode("utf-8")).hexdigest()[:16]
+    return f"{re.sub(r'[^A-Za-z0-9._-]', '_', ticker).lower()}-{digest}.parquet"
+
+
+def _build_store(source_path: str, store_dir: str, stat: os.stat_result) -> dict:
+    """Split the CSV into sorted per-ticker Parquet files; return the manifest."""
+    df = pd.read_csv(source_path, sep=";")
+
+    # Convert date strings to datetime objects and remove any time components
+    for column in DATE_COLUMNS:
+        df[column] = pd.to_datetime(df[column], utc=True).dt.normalize()
+    # Reports without a publish date can never be "published on or before" anything
+    df = df[df["Publish Date"].notna()]
+
+    tmp_dir = f"{store_dir}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    tickers = {}
+    for ticker, frame in df.groupby("Ticker", sort=False):
+        # Stable sort keeps the CSV order between reports published the same day
+        frame = frame.sort_values("Publish Date", kind="mergesort")
+        file_name = _ticker_file(str(ticker))
+        frame.to_parquet(os.path.join(tmp_dir, file_name))
+        tickers[str(ticker)] = file_name
+
+    manifest = {
+        "format": STORE_FORMAT,
+        "source_mtime": stat.st_mtime,
+        "source_size": stat.st_size,
+        "rows": len(df),
+        "tickers": tickers,
+    }
+    with open(os.path.join(tmp_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f)
+
+    shutil.rmtree(store_dir, ignore_errors=True)
+    os.replace(tmp_dir, store_dir)
+    return manifest
+
+
+def _load_manifest(store_dir: str) -> Optional[dict]:
+    try:
+        with open(os.path.join(store_dir, "manifest.json"), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _get_manifest(source_path: str) -> tuple:
+    """Return (store dir, manifest), converting the CSV if it is new or changed."""
+    stat = os.stat(source_path)
+    store_dir = get_store_dir(source_path)
+
+    with _source_lock(source_path):
+        manifest = _manifests.get(store_dir) or _load_manifest(store_dir)
+        if (
+            manifest is None
+            or manifest.get("format") != STORE_FORMAT
+            or (manifest["source_mtime"], manifest["source_size"]) != (stat.st_mtime, stat.st_size)
+        ):
+            os.makedirs(os.path.dirname(store_dir), exist_ok=True)
+            manifest = _build_store(source_path, store_dir, stat)
+        _manifests[store_dir] = manifest
+    return store_dir, manifest
+
+
+@lru_cache(maxsize=1024)
+def _read_ticker_frame(path: str, source_mtime: float) -> pd.DataFrame:
+    return pd.read_parquet(path)
+
+
+def get_ticker_reports(source_path: str, ticker: str) -> pd.DataFrame:
+    """All reports of ``ticker`` in ``source_path``, sorted by publish date.
+
+    The frame is cached and shared between callers; treat it as read-only.
+    """
+    store_dir, manifest = _get_manifest(source_path)
+    file_name = manifest["tickers"].get(ticker)
+    if file_name is None:
+        return pd.DataFrame()
+    return _read_ticker_frame(os.path.join(store_dir, file_name), manifest["source_mtime"])
+
+
+def get_latest_report(source_path: str, ticker: str, as_of: str) -> Optional[pd.Series]:
+    """Latest report of ``ticker`` published on or before ``as_of`` (yyyy-mm-dd).
+
+    Among reports published on that same day, the first one in CSV order is
+    returned. None when nothing was published yet.
+    """
+    reports = get_ticker_reports(source_path, ticker)
+    if reports.empty:
+        return None
+
+    as_of_dt = pd.to_datetime(as_of, utc=True).normalize()
+    publish_dates = reports["Publish Date"]
+    end = publish_dates.searchsorted(as_of_dt, side="right")
+    if end == 0:
+        return None
+    start = publish_dates.searchsorted(publish_dates.iloc[end - 1], side="left")
+    return reports.iloc[start]
@@ -0,0 +1,234 @@
+"""
+Structured telemetry for vendor routing.
+
+Every vendor attempt made by ``route_to_vendor`` becomes one event (method,
+vendor, implementation, duration, result size, outcome, fallback depth). Events
+go to the ``tradingagents.dataflows`` logger and, when ``vendor_telemetry_path``
+is set, to a JSONL file. Durations are also aggregated into per-method latency
+histograms that can be dumped at the end of a run. Time spent queued in a
+client-side rate limiter is reported as "queue_wait" events, and the tool
+calls a run's memo answered from memory as one "tool_memo" event per run.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+from .config import get_config
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, float("inf"))
+
+_lock = threading.Lock()
+_histograms = {}
+_sink = None
+_sink_path = None
+_debug_handler = None
+
+
+def _configure_logger() -> None:
+    """Attach a stderr handler at DEBUG level while ``vendor_debug`` is on."""
+    global _debug_handler
+    debug = get_config().get("vendor_debug", False)
+    if debug and _debug_handler is None:
+        _debug_handler = logging.StreamHandler()
+        _debug_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        logger.addHandler(_debug_handler)
+        logger.setLevel(logging.DEBUG)
+    elif not debug and _debug_handler is not None:
+        logger.removeHandler(_debug_handler)
+        logger.setLevel(logging.NOTSET)
+        _debug_handler = None
+
+
+def _write_sink(event: dict) -> None:
+    global _sink, _sink_path
+    path = get_config().get("vendor_telemetry_path")
+    with _lock:
+        if path != _sink_path:
+            if _sink is not None:
+                _sink.close()
+            _sink = open(path, "a", encoding="utf-8") if path else None
+            _sink_path = path
+        if _sink is not None:
+            _sink.write(json.dumps(event, default=str) + "\n")
+            _sink.flush()
+
+
+def _observe(key: str, duration_ms: float) -> None:
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "buckets": [0] * len(LATENCY_BUCKETS_MS),
+            }
+        histogram["count"] += 1
+        histogram["total_ms"] += duration_ms
+        histogram["max_ms"] = max(histogram["max_ms"], duration_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                histogram["buckets"][i] += 1
+                break
+
+
+def result_size(result) -> int:
+    """Size of a vendor result in characters."""
+    return 0 if result is None else len(str(result))
+
+
+def record_attempt(
+    method: str,
+    vendor: str,
+    outcome: str,
+    duration: float = 0.0,
+    impl: Optional[str] = None,
+    size: int = 0,
+    fallback_depth: int = 0,
+    error: Optional[str] = None,
+) -> None:
+    """Record one vendor attempt.
+
+    Args:
+        method: Routed tool method, e.g. "get_stock_data"
+        vendor: Vendor name
+        outcome: "success", "error", "rate_limited", "cache_miss", "timeout" or "skipped"
+        duration: Wall time of the attempt in seconds
+        impl: Implementation function name
+        size: Result size in characters
+        fallback_depth: Position of the vendor in the fallback order (0 = primary)
+        error: Error message for failed attempts
+    """
+    _configure_logger()
+    event = {
+        "ts": time.time(),
+        "event": "vendor_attempt",
+        "method": method,
+        "vendor": vendor,
+        "impl": impl,
+        "outcome": outcome,
+        "duration_ms": round(duration * 1000, 3),
+        "result_size": size,
+        "fallback_depth": fallback_depth,
+    }
+    if error:
+        event["error"] = error
+
+    if outcome != "skipped":
+        _observe(f"{method}:{vendor}", event["duration_ms"])
+
+    if outcome == "success":
+        logger.debug("%s via %s/%s succeeded in %.1f ms (%d chars, depth %d)", method, vendor, impl, event["duration_ms"], size, fallback_depth)
+    elif outcome == "skipped":
+        logger.debug("%s: skipping vendor %s (circuit breaker open)", method, vendor)
+    else:
+        logger.info("%s via %s/%s %s after %.1f ms: %s", method, vendor, impl, outcome, event["duration_ms"], error)
+    _write_sink(event)
+
+
+def record_call(method: str, duration: float, outcome: str, attempts: int, size: int = 0) -> None:
+    """Record a whole ``route_to_vendor`` call (all attempts included)."""
+    _configure_logger()
+    event = {
+        "ts": time.time(),
+        "event": "route",
+        "method": method,
+        "outcome": outcome,
+        "duration_ms": round(duration * 1000, 3),
+        "attempts": attempts,
+        "result_size": size,
+    }
+    _observe(method, event["duration_ms"])
+    if outcome == "success":
+        logger.debug("%s completed in %.1f ms after %d attempt(s)", method, event["duration_ms"], attempts)
+    else:
+        logger.warning("%s failed on all %d vendor attempt(s)", method, attempts)
+    _write_sink(event)
+
+
+def record_render(method: str, tokens_in: int, tokens_out: int, strategy: str) -> None:
+    """Record one tool output rendering and the (estimated) tokens it saved."""
+    _configure_logger()
+    event = {
+        "ts": time.time(),
+        "event": "tool_output",
+        "method": method,
+        "strategy": strategy,
+        "tokens_in": tokens_in,
+        "tokens_out": tokens_out,
+        "tokens_saved": tokens_in - tokens_out,
+    }
+    if tokens_in != tokens_out:
+        logger.debug("%s output reduced from ~%d to ~%d tokens (%s)", method, tokens_in, tokens_out, strategy)
+    _write_sink(event)
+
+
+def record_queue_wait(vendor: str, function: Optional[str], waited: float) -> None:
+    """Record time a request spent queued in a client-side rate limiter."""
+    _configure_logger()
+    event = {
+        "ts": time.time(),
+        "event": "queue_wait",
+        "vendor": vendor,
+        "function": function,
+        "waited_ms": round(waited * 1000, 3),
+    }
+    if waited >= 1:
+        logger.info(
+            "%s rate limiter: %s waited %.1fs for a request slot (%s_calls_per_minute)",
+            vendor, function, waited, vendor,
+        )
+    else:
+        logger.debug("%s rate limiter: %s waited %.3fs for a request slot", vendor, function, waited)
+    _write_sink(event)
+
+
+def record_tool_memo(stats: dict) -> None:
+    """Record the ``ToolCallMemo.stats()`` of a finished run."""
+    _configure_logger()
+    event = {"ts": time.time(), "event": "tool_memo", **stats}
+    logger.info(
+        "Tool calls: %d made, %d served from the run memo (%.2fs saved) %s",
+        stats["calls"], stats["saved_calls"], stats["saved_seconds"], stats["saved_by_tool"],
+    )
+    _write_sink(event)
+
+
+def get_latency_histograms() -> dict:
+    """Return latency histograms keyed by method (whole call) and method:vendor."""
+    with _lock:
+        return {
+            key: {**histogram, "buckets": list(histogram["buckets"])}
+            for key, histogram in _histograms.items()
+        }
+
+
+def dump_latency_histograms(path: Optional[str] = None) -> str:
+    """Render the latency histograms as a table; also write them as JSON to ``path``."""
+    histograms = get_latency_histograms()
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"buckets_ms": LATENCY_BUCKETS_MS[:-1], "histograms": histograms}, f, indent=2)
+
+    labels = [f"<={int(bound)}ms" for bound in LATENCY_BUCKETS_MS[:-1]] + [f">{int(LATENCY_BUCKETS_MS[-2])}ms"]
+    lines = ["key,count,mean_ms,max_ms," + ",".join(labels)]
+    for key in sorted(histograms):
+        histogram = histograms[key]
+        mean_ms = histogram["total_ms"] / histogram["count"] if histogram["count"] else 0.0
+        lines.append(
+            f"{key},{histogram['count']},{mean_ms:.1f},{histogram['max_ms']:.1f},"
+            + ",".join(str(count) for count in histogram["buckets"])
+        )
+    return "\n".join(lines)
+
+
+def reset_telemetry() -> None:
+    """Drop the collected histograms."""
+    with _lock:
+        _histograms.clear()
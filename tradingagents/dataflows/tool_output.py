@@ -0,0 +1,266 @@
+"""
+Token-budgeted rendering of vendor results for the LLM-facing tools.
+
+Vendors return whole CSV tables, JSON payloads or markdown reports. The
+``@tool`` wrappers pass them through ``render_tool_output`` which keeps each
+result within the token budget of its method (``tool_output_token_budgets``).
+Budgets are opt-in per method; methods without one are passed through as is.
+Results that fit are returned untouched; larger ones are reduced step by step,
+least lossy first, until they fit:
+
+- CSV tables: round floats, drop empty and constant columns, keep the most
+  recent period columns of wide statements, then keep the most recent rows
+  verbatim, down-sample the older ones and summarize what was left out
+- JSON payloads: drop noise fields, shorten long strings and cap long lists
+- anything else: cut at a line boundary and note how much was omitted
+
+Tokens are estimated from the character count. Every call reports the tokens
+saved through ``telemetry.record_render``.
+"""
+
+import io
+import json
+import math
+import threading
+from typing import Optional
+
+import pandas as pd
+
+from .config import get_config
+from .telemetry import record_render
+
+CHARS_PER_TOKEN = 4
+# JSON fields that carry no information for the analysts
+NOISE_FIELDS = ("banner_image", "category_within_source", "source_domain")
+
+_lock = threading.Lock()
+_stats = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text``."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def get_token_budget(method: str) -> Optional[int]:
+    """Token budget of ``method``; None means unlimited."""
+    budgets = get_config().get("tool_output_token_budgets", {})
+    return budgets.get(method, budgets.get("default"))
+
+
+def _split_comment_header(text: str):
+    """Split leading ``#`` comment lines (and blank lines) from the body."""
+    lines = text.split("\n")
+    i = 0
+    while i < len(lines) and (lines[i].startswith("#") or not lines[i].strip()):
+        i += 1
+    return "\n".join(lines[:i]), "\n".join(lines[i:])
+
+
+def _parse_csv(body: str) -> Optional[pd.DataFrame]:
+    first_line = body.split("\n", 1)[0]
+    if "," not in first_line or body.count("\n") < 2:
+        return None
+    try:
+        df = pd.read_csv(io.StringIO(body))
+    except (ValueError, pd.errors.ParserError):
+        return None
+    # An unnamed index column (DataFrame.to_csv) keeps its empty header
+    df.columns = ["" if str(column).startswith("Unnamed: ") else column for column in df.columns]
+    return df if len(df.columns) > 1 else None
+
+
+def _date_like(values) -> bool:
+    parsed = pd.to_datetime(pd.Series(list(values), dtype=object), errors="coerce", format="mixed")
+    return len(parsed) > 0 and parsed.notna().all()
+
+
+def _render_table(header: str, df: pd.DataFrame, notes: list, digits: int) -> str:
+    csv = df.to_csv(index=False, float_format=f"%.{digits}g")
+    note_lines = "".join(f"# {note}\n" for note in notes)
+    header = header.rstrip("\n") + "\n" if header.strip() else ""
+    return f"{header}{note_lines}\n{csv}" if header or note_lines else csv
+
+
+def _summarize_rows(df: pd.DataFrame, label: str) -> str:
+    """One-line summary of rows that were left out of a table."""
+    parts = []
+    for column in df.columns[1:]:
+        values = pd.to_numeric(df[column], errors="coerce").dropna()
+        if len(values):
+            parts.append(f"{column} min {values.min():.6g} max {values.max():.6g} mean {values.mean():.6g}")
+    first, last = df.iloc[0, 0], df.iloc[-1, 0]
+    summary = f"{label} {len(df)} rows ({first} .. {last})"
+    return summary + (": " + "; ".join(parts) if parts else "")
+
+
+def _fit_rows(df: pd.DataFrame, header: str, notes: list, digits: int, budget_chars: int):
+    """Keep the most recent rows verbatim and down-sample the older ones."""
+    first_column = df.iloc[:, 0]
+    dates = pd.to_datetime(first_column, errors="coerce", format="mixed")
+    dated = pd.api.types.is_string_dtype(first_column) and dates.notna().all()
+    # Work in chronological order, most recent last
+    descending = dated and len(df) > 1 and dates.iloc[0] > dates.iloc[-1]
+    ordered = df.iloc[::-1].reset_index(drop=True) if descending else df
+
+    full = _render_table(header, ordered, notes, digits)
+    per_row = max(1, (len(full) - len(_render_table(header, ordered.iloc[:0], notes, digits))) / len(ordered))
+    keep = int((budget_chars - len(_render_table(header, ordered.iloc[:0], notes, digits))) / per_row) - 2
+
+    while keep >= 1:
+        if dated:
+            recent = ordered.iloc[-max(1, keep // 2):]
+            older = ordered.iloc[: len(ordered) - len(recent)]
+            stride = math.ceil(len(older) / max(1, keep - len(recent))) if len(older) else 1
+            sampled = older.iloc[::stride]
+            kept = pd.concat([sampled, recent])
+            omitted = older.drop(sampled.index)
+            row_notes = notes + [
+                f"{len(recent)} most recent rows shown in full, {len(sampled)} older rows sampled every {stride} rows",
+            ]
+        else:
+            kept = ordered.iloc[:keep]
+            omitted = ordered.iloc[keep:]
+            row_notes = notes + [f"first {keep} of {len(ordered)} rows shown"]
+        if len(omitted):
+            row_notes.append(_summarize_rows(omitted, "omitted"))
+        if descending:
+            kept = kept.iloc[::-1]
+        rendered = _render_table(header, kept, row_notes, digits)
+        if len(rendered) <= budget_chars:
+            return rendered
+        keep = int(keep * 0.8) if keep > 1 else 0
+    return None
+
+
+def _shrink_table(text: str, budget_chars: int) -> Optional[str]:
+    header, body = _split_comment_header(text)
+    df = _parse_csv(body)
+    if df is None or df.empty:
+        return None
+    digits = get_config().get("tool_output_significant_digits", 6)
+    notes = []
+
+    # Rounding alone
+    rendered = _render_table(header, df, notes, digits)
+    if len(rendered) <= budget_chars:
+        return rendered
+
+    # Empty and constant columns
+    empty = [column for column in df.columns[1:] if df[column].isna().all()]
+    constant = [
+        column for column in df.columns[1:]
+        if column not in empty and len(df) > 1 and df[column].nunique(dropna=False) == 1
+    ]
+    if empty:
+        notes.append("empty columns dropped: " + ", ".join(map(str, empty)))
+    if constant:
+        notes.append("constant columns: " + ", ".join(f"{column}={df[column].iloc[0]}" for column in constant))
+    df = df.drop(columns=empty + constant)
+    rendered = _render_table(header, df, notes, digits)
+    if len(rendered) <= budget_chars:
+        return rendered
+
+    # Wide statements (one column per period): keep the most recent periods
+    periods = list(df.columns[1:])
+    if len(periods) > 2 and _date_like(periods):
+        newest_first = sorted(periods, key=lambda column: pd.to_datetime(column), reverse=True)
+        for count in range(len(periods) - 1, 1, -1):
+            kept = [column for column in periods if column in newest_first[:count]]
+            rendered = _render_table(
+                header,
+                df[[df.columns[0]] + kept],
+                notes + [f"{count} most recent of {len(periods)} periods shown"],
+                digits,
+            )
+            if len(rendered) <= budget_chars:
+                return rendered
+        df = df[[df.columns[0]] + [column for column in periods if column in newest_first[:2]]]
+        notes.append(f"2 most recent of {len(periods)} periods shown")
+
+    return _fit_rows(df, header, notes, digits, budget_chars)
+
+
+def _cap_json(value, list_cap: int, string_cap: int):
+    if isinstance(value, dict):
+        return {
+            key: _cap_json(item, list_cap, string_cap)
+            for key, item in value.items()
+            if key not in NOISE_FIELDS
+        }
+    if isinstance(value, list):
+        capped = [_cap_json(item, list_cap, string_cap) for item in value[:list_cap]]
+        if len(value) > list_cap:
+            capped.append(f"... {len(value) - list_cap} more items omitted")
+        return capped
+    if isinstance(value, str) and len(value) > string_cap:
+        return value[:string_cap] + "..."
+    if isinstance(value, float):
+        return float(f"{value:.6g}")
+    return value
+
+
+def _shrink_json(text: str, budget_chars: int) -> Optional[str]:
+    stripped = text.lstrip()
+    if not stripped.startswith(("{", "[")):
+        return None
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return None
+
+    for list_cap, string_cap in ((50, 2000), (20, 1000), (10, 500), (5, 300), (3, 200), (1, 100)):
+        rendered = json.dumps(_cap_json(payload, list_cap, string_cap), indent=1)
+        if len(rendered) <= budget_chars:
+            return rendered
+    return None
+
+
+def _truncate_text(text: str, budget_chars: int) -> str:
+    note = "\n\n[... {} of {} characters omitted to fit the tool output budget]"
+    room = max(0, budget_chars - len(note.format(len(text), len(text))))
+    cut = text.rfind("\n", 0, room)
+    head = text[: cut if cut > room // 2 else room]
+    return head + note.format(len(text) - len(head), len(text))
+
+
+def render_tool_output(method: str, result):
+    """Fit a vendor ``result`` into the token budget of ``method``."""
+    budget = get_token_budget(method)
+    if not isinstance(result, str) or budget is None:
+        return result
+
+    tokens_in = estimate_tokens(result)
+    if tokens_in <= budget:
+        rendered, strategy = result, "unchanged"
+    else:
+        budget_chars = budget * CHARS_PER_TOKEN
+        rendered, strategy = _shrink_table(result, budget_chars), "table"
+        if rendered is None:
+            rendered, strategy = _shrink_json(result, budget_chars), "json"
+        if rendered is None:
+            rendered, strategy = _truncate_text(result, budget_chars), "truncate"
+
+    tokens_out = estimate_tokens(rendered)
+    with _lock:
+        stats = _stats.setdefault(method, {"calls": 0, "reduced": 0, "tokens_in": 0, "tokens_out": 0})
+        stats["calls"] += 1
+        stats["reduced"] += strategy != "unchanged"
+        stats["tokens_in"] += tokens_in
+        stats["tokens_out"] += tokens_out
+    record_render(method, tokens_in, tokens_out, strategy)
+    return rendered
+
+
+def get_tool_output_stats() -> dict:
+    """Per-method call counts and estimated tokens in, out and saved."""
+    with _lock:
+        return {
+            method: {**stats, "tokens_saved": stats["tokens_in"] - stats["tokens_out"]}
+            for method, stats in _stats.items()
+        }
+
+
+def reset_tool_output_stats() -> None:
+    with _lock:
+        _stats.clear()
@@ -2,8 +2,11 @@ from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import yfinance as yf
+import pandas as pd
 import os
 from .stockstats_utils import StockstatsUtils
+from .price_store import get_prices, slice_prices
+from .indicator_engine import compute_indicator, compute_indicators
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -14,11 +17,9 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    # Serve the range from the shared price store (end date exclusive)
+    prices = get_prices(symbol, "yfinance", start_date)
+    data = slice_prices(prices, start_date, end_date, inclusive_end=False).set_index("Date")
 
     # Check if data is empty
     if data.empty:
@@ -26,10 +27,6 @@ def get_YFin_data_online(
             f"No data found for symbol '{symbol}' between {start_date} and {end_date}"
         )
 
-    # Remove timezone info from index for cleaner output
-    if data.index.tz is not None:
-        data.index = data.index.tz_localize(None)
-
     # Round numerical values to 2 decimal places for cleaner display
     numeric_columns = ["Open", "High", "Low", "Close", "Adj Close"]
     for col in numeric_columns:
@@ -131,6 +128,14 @@ def get_stock_stats_indicators_window(
     # Handle multiple indicators (comma-separated)
     if "," in indicator:
         indicators = [ind.strip() for ind in indicator.split(",") if ind.strip()]
+        try:
+            # Load prices once and compute every requested indicator together
+            return _get_indicator_table(
+                symbol, indicators, curr_date, look_back_days, best_ind_params
+            )
+        except Exception as e:
+            print(f"Error getting bulk indicator table: {e}")
+
         results = []
         for ind in indicators:
             try:
@@ -149,33 +154,26 @@ def get_stock_stats_indicators_window(
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
-    # Optimized: Get stock data once and calculate indicators for all dates
+    # Optimized: Get stock data once and calculate the indicator for all dates
     try:
         indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
-        # Generate the date range we need
-        current_dt = curr_date_dt
-        date_values = []
-        
-        while current_dt >= before:
-            date_str = current_dt.strftime('%Y-%m-%d')
-            
-            # Look up the indicator value for this date
-            if date_str in indicator_data:
-                indicator_value = indicator_data[date_str]
+
+        # Render only the requested look-back window
+        window = indicator_data.loc[before:curr_date_dt]
+        window_values = dict(zip(window.index.strftime("%Y-%m-%d"), window.tolist()))
+
+        date_lines = []
+        for date_str in pd.date_range(before, curr_date_dt)[::-1].strftime("%Y-%m-%d"):
+            if date_str in window_values:
+                indicator_value = _format_indicator_value(window_values[date_str])
             else:
                 indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
-            date_values.append((date_str, indicator_value))
-            current_dt = current_dt - relativedelta(days=1)
-        
-        # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
-        
+            date_lines.append(f"{date_str}: {indicator_value}\n")
+
+        ind_string = "".join(date_lines)
+
     except Exception as e:
-        print(f"Error getting bulk stockstats data: {e}")
+        print(f"Error getting bulk indicator data: {e}")
         # Fallback to original implementation if bulk method fails
         ind_string = ""
         curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
@@ -196,113 +194,88 @@ def get_stock_stats_indicators_window(
     return result_str
 
 
-def _get_stock_stats_bulk(
+def _format_indicator_value(value: float) -> str:
+    if pd.isna(value):
+        return "N/A"
+    return str(value)
+
+
+def _load_indicator_prices(
     symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to calculate"],
-    curr_date: Annotated[str, "current date for reference"]
-) -> dict:
-    """
-    Optimized bulk calculation of stock stats indicators.
-    Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
-    """
+) -> pd.DataFrame:
+    """Load the price history used for indicators from the configured source."""
     from .config import get_config
-    import pandas as pd
-    from stockstats import wrap
-    import os
-    
+
     config = get_config()
     online = config["data_vendors"]["technical_indicators"] != "local"
-    
+
     if not online:
         # Local data path
         try:
-            data = pd.read_csv(
-                os.path.join(
-                    config.get("data_cache_dir", "data"),
-                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                )
-            )
-            df = wrap(data)
+            return get_prices(symbol, "local")
         except FileNotFoundError:
-            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-    else:
-        # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-        
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-        
-        data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
-        )
-        
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            try:
-                data = yf.download(
-                    symbol,
-                    start=start_date_str,
-                    end=end_date_str,
-                    progress=False,
-                    auto_adjust=True,
-                )
-            except Exception as e:
-                print(f"CRITICAL: yf.download failed for {symbol}: {e}")
-                raise e
-                
-                raise e
-                
-            if data.empty:
-                 print(f"CRITICAL: yf.download returned empty data for {symbol}")
-            
-    
-    # Ensure numeric columns are actually numeric (fix for yfinance v1.0 / bad cache)
-    numeric_cols = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
-            
-    # Flatten MultiIndex columns if present
-    if isinstance(data.columns, pd.MultiIndex):
-        data.columns = data.columns.get_level_values(0)
-    
-    # Cast to numeric
-    for col in numeric_cols:
-        if col in data.columns:
-            # First clean any "Price" or "Ticker" rows if bad cache read
-            # Simply coerce to NaN then drop? Or just coerce.
-            data[col] = pd.to_numeric(data[col], errors='coerce')
-    
-    # Drop rows where Close is NaN (header rows from bad cache)
-    if "Close" in data.columns:
-        data = data.dropna(subset=["Close"])
-
-    df = wrap(data)
-    if "Date" in df.columns:
-        df["Date"] = pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d")
-    
-    # Calculate the indicator for all rows at once
-    df[indicator]  # This triggers stockstats to calculate the indicator
-    
-    # Create a dictionary mapping date strings to indicator values
-    result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
-        # Handle NaN/None values
-        if pd.isna(indicator_value):
-            result_dict[date_str] = "N/A"
-        else:
-            result_dict[date_str] = str(indicator_value)
-    
-    return result_dict
+            raise Exception("Indicator fail: Yahoo Finance data not fetched yet!")
+
+    # Online data, topped up incrementally by the price store
+    data = get_prices(symbol, "yfinance")
+    if data.empty:
+        print(f"CRITICAL: price store returned empty data for {symbol}")
+    return data
+
+
+def _get_stock_stats_bulk(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to calculate"],
+    curr_date: Annotated[str, "current date for reference"]
+) -> pd.Series:
+    """
+    Optimized bulk calculation of technical indicators.
+    Loads the price history once and computes the indicator for all dates
+    with the vectorized indicator engine.
+    Returns a float Series indexed by trading date.
+    """
+    return compute_indicator(_load_indicator_prices(symbol), indicator)
+
+
+def _get_indicator_table(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[list, "technical indicators to calculate"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    look_back_days: Annotated[int, "how many days to look back"],
+    descriptions: Annotated[dict, "indicator name to description"],
+) -> str:
+    """
+    Compute several indicators in one pass and render them as a single
+    window table (one row per trading day, one column per indicator).
+    """
+    requested = list(dict.fromkeys(indicators))
+    supported = [ind for ind in requested if ind in descriptions]
+    errors = [
+        f"Error for {ind}: Indicator {ind} is not supported. Please choose from: {list(descriptions.keys())}"
+        for ind in requested
+        if ind not in descriptions
+    ]
+    if not supported:
+        return "\n\n".join(errors)
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+
+    table = compute_indicators(_load_indicator_prices(symbol), supported)
+    window = table.loc[before:curr_date_dt].iloc[::-1]
+
+    rows = ["Date," + ",".join(supported)]
+    for date_str, values in zip(window.index.strftime("%Y-%m-%d"), window.to_numpy().tolist()):
+        rows.append(date_str + "," + ",".join(_format_indicator_value(v) for v in values))
+
+    sections = [
+        f"## {', '.join(supported)} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+        + "\n".join(rows)
+        + "\n\nDates not listed are not trading days (weekend or holiday)."
+    ]
+    sections.extend(descriptions[ind] for ind in supported)
+    sections.extend(errors)
+    return "\n\n".join(sections)
 
 
 def get_stockstats_indicator(
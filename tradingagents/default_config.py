@@ -21,6 +21,61 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Run the selected analysts concurrently, each on its own message channel
+    "parallel_analysts": False,
+    # Run the bull and bear opening arguments concurrently; rebuttals still alternate
+    "parallel_debate_openings": False,
+    # In-memory LRU of prepared price frames (see dataflows/price_cache.py)
+    "price_cache_max_entries": 64,
+    "price_cache_max_bytes": 256 * 1024 * 1024,
+    # On-disk Alpha Vantage response cache (see dataflows/alpha_vantage_common.py)
+    "alpha_vantage_cache_enabled": True,
+    "alpha_vantage_cache_max_bytes": 128 * 1024 * 1024,
+    "alpha_vantage_cache_ttls": {},  # function -> seconds or "next_close", overrides the defaults
+    # Alpha Vantage client-side request limiter; None = no limit (premium keys).
+    # Free-tier keys should set 5 per minute and 25 per day.
+    "alpha_vantage_calls_per_minute": None,
+    "alpha_vantage_calls_per_day": None,
+    "alpha_vantage_max_queue_wait": 60,  # seconds a call may queue before failing over
+    # Shared HTTP session (see dataflows/http_session.py)
+    "http_timeout": (5, 30),  # connect, read seconds
+    "http_retries": 3,
+    "http_backoff_factor": 0.5,
+    "http_pool_maxsize": 10,
+    # Google News scraper politeness and caching (see dataflows/googlenews_utils.py)
+    "google_news_max_concurrency": 3,  # concurrent requests per host
+    "google_news_requests_per_minute": 30,  # global request budget
+    "google_news_delay": (2, 6),  # random delay range before each request, seconds
+    "google_news_max_articles": 20,  # routed get_news stops scraping once this many are in; None for all pages
+    "google_news_cache_ttl": 3600,  # seconds, for windows that include today
+    "google_news_cache_max_bytes": 32 * 1024 * 1024,
+    # On-disk cache of the LLM-backed vendors (see dataflows/llm_utils.py)
+    "llm_vendor_cache_mode": "read_write",  # "read_write", "cache_only" (deterministic backtests) or "off"
+    "llm_vendor_cache_ttl": 900,  # seconds, for windows that include today; closed windows never expire
+    "llm_vendor_cache_max_bytes": 64 * 1024 * 1024,
+    # Concurrent vendor calls in route_to_vendor
+    "vendor_max_workers": 8,
+    "vendor_call_timeout": 60,  # seconds before a concurrent vendor call is abandoned
+    "vendor_race_methods": [],  # e.g. ["get_stock_data"]: hedge slow vendors with the next fallback
+    "vendor_hedge_delay": 2.0,  # seconds to wait on a raced vendor before launching the next one
+    "circuit_breaker_enabled": True,
+    "circuit_breaker_failure_threshold": 3,  # consecutive connection, timeout, rate-limit or 5xx failures before a vendor is skipped
+    "circuit_breaker_cooldown": 60,  # seconds before a skipped vendor gets a trial call
+    # Vendor routing telemetry (see dataflows/telemetry.py)
+    "vendor_debug": False,  # log every vendor attempt to stderr
+    "vendor_telemetry_path": None,  # JSONL file receiving one event per vendor attempt
+    # Token budgets of the LLM-facing tool outputs (see dataflows/tool_output.py).
+    # Reduction is lossy, so only the bulky news payloads are budgeted; tools
+    # without a budget (and without a "default" entry) are passed through as is.
+    "tool_output_token_budgets": {
+        "get_news": 4000,
+        "get_global_news": 4000,
+        # Example: "get_stock_data": 4000,  # down-samples older price rows
+        # Example: "default": 4000,         # budget for every other tool
+    },
+    "tool_output_significant_digits": 6,
+    # Serve identical tool calls within one propagate() from memory (see agents/utils/tool_memo.py)
+    "tool_memo_enabled": True,
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
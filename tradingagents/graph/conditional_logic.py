@@ -44,7 +44,11 @@ class ConditionalLogic:
         return "Msg Clear Fundamentals"
 
     def should_continue_debate(self, state: AgentState) -> str:
-        """Determine if debate should continue."""
+        """Determine if debate should continue.
+
+        Concurrent openings record the bear's argument as the latest
+        response, so the bull gives the first rebuttal.
+        """
 
         if (
             state["investment_debate_state"]["count"] >= 2 * self.max_debate_rounds
@@ -1,6 +1,10 @@
 # TradingAgents/graph/setup.py
 
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import Dict, Any
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
@@ -10,6 +14,14 @@ from tradingagents.agents.utils.agent_states import AgentState
 
 from .conditional_logic import ConditionalLogic
 
+# State key each analyst writes its report to
+ANALYST_REPORT_KEYS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
 
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
@@ -37,8 +49,95 @@ class GraphSetup:
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
 
+    def _create_isolated_analyst(
+        self, analyst_type, analyst_node, tool_node, first_analyst
+    ):
+        """Wrap an analyst and its tool loop in a subgraph with its own messages.
+
+        The returned node runs the analyst <-> tools loop on a private message
+        channel and writes back only the analyst's report, so several analysts
+        can run side by side. The channel is seeded with what the analyst
+        starts from in sequential mode: the run's input messages for the first
+        selected analyst, the "Continue" placeholder left by ``Msg Clear`` for
+        the others. The parent run's config (recursion limit, callbacks, tags)
+        is passed on to the subgraph.
+        """
+        analyst_name = f"{analyst_type.capitalize()} Analyst"
+        tools_name = f"tools_{analyst_type}"
+        report_key = ANALYST_REPORT_KEYS[analyst_type]
+
+        subgraph = StateGraph(AgentState)
+        subgraph.add_node(analyst_name, analyst_node)
+        subgraph.add_node(tools_name, tool_node)
+        subgraph.add_edge(START, analyst_name)
+        subgraph.add_conditional_edges(
+            analyst_name,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            {
+                tools_name: tools_name,
+                f"Msg Clear {analyst_type.capitalize()}": END,
+            },
+        )
+        subgraph.add_edge(tools_name, analyst_name)
+        analyst_graph = subgraph.compile()
+
+        def isolated_analyst_node(state, config: RunnableConfig):
+            if first_analyst:
+                messages = list(state["messages"])
+            else:
+                messages = [HumanMessage(content="Continue")]
+            result = analyst_graph.invoke(
+                {
+                    "messages": messages,
+                    "company_of_interest": state["company_of_interest"],
+                    "trade_date": state["trade_date"],
+                },
+                config,
+            )
+            return {report_key: result[report_key]}
+
+        return isolated_analyst_node
+
+    def _create_debate_openings(self, bull_node, bear_node):
+        """Run the bull and bear opening arguments concurrently.
+
+        Both researchers open from the same (empty) debate state. Their turns
+        are merged as if the bull spoke first and the bear second, so the
+        debate state has the same shape as after two sequential turns and the
+        rebuttals continue with the bull.
+        """
+
+        def debate_openings_node(state):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                bull_future = pool.submit(copy_context().run, bull_node, state)
+                bear_future = pool.submit(copy_context().run, bear_node, state)
+                bull_state = bull_future.result()["investment_debate_state"]
+                bear_state = bear_future.result()["investment_debate_state"]
+
+            debate_state = state["investment_debate_state"]
+            bull_argument = bull_state["current_response"]
+            bear_argument = bear_state["current_response"]
+            return {
+                "investment_debate_state": {
+                    "history": debate_state.get("history", "")
+                    + "\n"
+                    + bull_argument
+                    + "\n"
+                    + bear_argument,
+                    "bull_history": bull_state["bull_history"],
+                    "bear_history": bear_state["bear_history"],
+                    "current_response": bear_argument,
+                    "count": debate_state["count"] + 2,
+                }
+            }
+
+        return debate_openings_node
+
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts=False,
+        parallel_debate_openings=False,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +147,13 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run the selected analysts concurrently, each
+                on its own message channel, and join before the Bull Researcher.
+                Each analyst starts from the same messages as in sequential
+                mode (see ``_create_isolated_analyst``). Otherwise they run one
+                after the other.
+            parallel_debate_openings (bool): Run the bull and bear opening
+                arguments concurrently; rebuttal rounds still alternate.
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -110,6 +216,17 @@ class GraphSetup:
 
         # Add analyst nodes to the graph
         for analyst_type, node in analyst_nodes.items():
+            if parallel_analysts:
+                workflow.add_node(
+                    f"{analyst_type.capitalize()} Analyst",
+                    self._create_isolated_analyst(
+                        analyst_type,
+                        node,
+                        tool_nodes[analyst_type],
+                        first_analyst=analyst_type == selected_analysts[0],
+                    ),
+                )
+                continue
             workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
             workflow.add_node(
                 f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
@@ -119,6 +236,13 @@ class GraphSetup:
         # Add other nodes
         workflow.add_node("Bull Researcher", bull_researcher_node)
         workflow.add_node("Bear Researcher", bear_researcher_node)
+        if parallel_debate_openings:
+            workflow.add_node(
+                "Debate Openings",
+                self._create_debate_openings(
+                    bull_researcher_node, bear_researcher_node
+                ),
+            )
         workflow.add_node("Research Manager", research_manager_node)
         workflow.add_node("Trader", trader_node)
         workflow.add_node("Risky Analyst", risky_analyst)
@@ -127,32 +251,54 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+        debate_entry = (
+            "Debate Openings" if parallel_debate_openings else "Bull Researcher"
+        )
+        if parallel_analysts:
+            # Fan out to every analyst and wait for all reports
+            analyst_names = [
+                f"{analyst_type.capitalize()} Analyst"
+                for analyst_type in selected_analysts
+            ]
+            for analyst_name in analyst_names:
+                workflow.add_edge(START, analyst_name)
+            workflow.add_edge(analyst_names, debate_entry)
+        else:
+            # Start with the first analyst
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
 
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
+            # Connect analysts in sequence
+            for i, analyst_type in enumerate(selected_analysts):
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
 
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+                # Connect to next analyst or to Bull Researcher if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    workflow.add_edge(current_clear, debate_entry)
 
         # Add remaining edges
+        if parallel_debate_openings:
+            workflow.add_conditional_edges(
+                "Debate Openings",
+                self.conditional_logic.should_continue_debate,
+                {
+                    "Bull Researcher": "Bull Researcher",
+                    "Research Manager": "Research Manager",
+                },
+            )
         workflow.add_conditional_edges(
             "Bull Researcher",
             self.conditional_logic.should_continue_debate,
@@ -0,0 +1,79 @@
+import asyncio
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.llm_utils import LLMCacheMissError
+from tradingagents.default_config import DEFAULT_CONFIG
+
+ARGS = ("2024-06-01", 7, 5)
+CACHE_DIR = tempfile.mkdtemp()
+
+
+def live_vendor(name, calls):
+    def fetch(*args, **kwargs):
+        calls.append(name)
+        return f"{name} news"
+    return fetch
+
+
+def no_data(*args, **kwargs):
+    raise ValueError("No news found")
+
+
+def route_both(method):
+    """Result of the sync and the async router, which must agree."""
+    outcomes = []
+    for route in (
+        lambda: interface.route_to_vendor(method, *ARGS),
+        lambda: asyncio.run(interface.aroute_to_vendor(method, *ARGS)),
+    ):
+        try:
+            outcomes.append(route())
+        except LLMCacheMissError:
+            outcomes.append(LLMCacheMissError)
+    assert outcomes[0] == outcomes[1], outcomes
+    return outcomes[0]
+
+
+def configure(news_vendors, **overrides):
+    config = dict(DEFAULT_CONFIG, data_cache_dir=CACHE_DIR, llm_vendor_cache_mode="cache_only", **overrides)
+    config["data_vendors"] = dict(DEFAULT_CONFIG["data_vendors"], news_data=news_vendors)
+    set_config(config)
+
+
+def test_cache_only_routing():
+    vendors = interface.VENDOR_METHODS["get_global_news"]
+    calls = []
+    vendors["alpha_vantage"] = live_vendor("alpha_vantage", calls)
+    vendors["local"] = live_vendor("local", calls)
+
+    print("Testing a miss of the only configured vendor...")
+    configure("openai")
+    assert route_both("get_global_news") is LLMCacheMissError
+    assert calls == [], f"fell back to live vendors: {calls}"
+
+    print("Testing a miss while racing vendors...")
+    configure("openai", vendor_race_methods=["get_global_news"], vendor_hedge_delay=0.1)
+    assert route_both("get_global_news") is LLMCacheMissError
+    assert calls == [], f"fell back to live vendors: {calls}"
+
+    print("Testing a miss in a multi-vendor batch...")
+    configure("openai,local")
+    result = route_both("get_global_news")
+    # The miss only drops the LLM vendor's share of the batch
+    assert result == "local news\nalpha_vantage news", result
+
+    print("Testing a batch where no other vendor has data...")
+    vendors["alpha_vantage"] = vendors["local"] = no_data
+    assert route_both("get_global_news") is LLMCacheMissError
+    print("\nSUCCESS: Cache-only misses never fall back and keep the rest of a batch.")
+
+
+if __name__ == "__main__":
+    test_cache_only_routing()
@@ -0,0 +1,103 @@
+import asyncio
+import sys
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.googlenews_utils import agetNewsData, getNewsData
+from tradingagents.dataflows.interface import aroute_to_vendor, route_to_vendor
+
+TOTAL_PAGES = 4
+
+
+def render_page(page):
+    """Recorded-style Google News result page with 10 results and a Next link."""
+    results = "".join(
+        f'<div class="SoaBEf"><a href="https://example.com/{page}-{i}">'
+        f'<div class="MBeuO">Title {page}-{i}</div></a>'
+        f'<div class="GI74Re">Snippet {page}-{i}</div>'
+        f'<div class="LfVVr">1 day ago</div>'
+        f'<div class="NUnG9d"><span>Source {i}</span></div></div>'
+        for i in range(10)
+    )
+    next_link = '<a id="pnnext" href="#">Next</a>' if page < TOTAL_PAGES - 1 else ""
+    return f"<html><body>{results}{next_link}</body></html>".encode()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests_served = 0
+
+    def do_GET(self):
+        FixtureHandler.requests_served += 1
+        offset = int(parse_qs(urlparse(self.path).query).get("start", ["0"])[0])
+        page = offset // 10
+        body = render_page(page) if page < TOTAL_PAGES else b"<html><body></body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_google_news_scraper():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    set_config({
+        "data_cache_dir": tempfile.mkdtemp(),
+        "google_news_base_url": f"http://127.0.0.1:{server.server_address[1]}/search",
+        "google_news_delay": (0.2, 0.2),
+    })
+
+    try:
+        print("Testing full scrape...")
+        start = time.time()
+        results = getNewsData("AAPL", "2024-01-01", "2024-01-07")
+        print(f"{len(results)} results in {time.time() - start:.2f}s, {FixtureHandler.requests_served} requests")
+        assert len(results) == TOTAL_PAGES * 10
+        assert results[0]["title"] == "Title 0-0" and results[-1]["title"] == "Title 3-9"
+
+        print("Testing cache hit...")
+        served = FixtureHandler.requests_served
+        assert getNewsData("AAPL", "2024-01-01", "2024-01-07") == results
+        assert FixtureHandler.requests_served == served
+
+        print("Testing early stop at the caller's limit...")
+        served = FixtureHandler.requests_served
+        limited = getNewsData("MSFT", "2024-01-01", "2024-01-07", limit=15)
+        assert len(limited) == 15
+        assert FixtureHandler.requests_served - served == 2, FixtureHandler.requests_served - served
+        print("Testing async scrape...")
+        served = FixtureHandler.requests_served
+        async_results = asyncio.run(agetNewsData("NVDA", "2024-01-01", "2024-01-07"))
+        assert async_results == [dict(r) for r in results]
+        assert FixtureHandler.requests_served - served == TOTAL_PAGES
+
+        print("Testing routed get_news with google_news_max_articles...")
+        set_config({"data_vendors": {"news_data": "google"}, "google_news_max_articles": 15})
+        served = FixtureHandler.requests_served
+        routed = route_to_vendor("get_news", "TSLA", "2024-01-01", "2024-01-07")
+        assert routed.count("### ") == 15, routed.count("### ")
+        assert "from 2024-01-01 to 2024-01-07" in routed
+        assert FixtureHandler.requests_served - served == 2, FixtureHandler.requests_served - served
+        served = FixtureHandler.requests_served
+        async_routed = asyncio.run(aroute_to_vendor("get_news", "AMZN", "2024-01-01", "2024-01-07"))
+        assert async_routed.count("### ") == 15
+        assert FixtureHandler.requests_served - served == 2
+        print("\nSUCCESS: Scraper caches, runs pages concurrently (sync and async) and stops early, also when routed.")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_google_news_scraper()
@@ -0,0 +1,85 @@
+import asyncio
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from tradingagents.dataflows.http_session import aclose_http_session, ahttp_get, http_get, get_http_stats, reset_http_session
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Local HTTP stand-in: keep-alive responses, one 503 before each success on /flaky."""
+
+    protocol_version = "HTTP/1.1"
+    flaky_hits = 0
+
+    def do_GET(self):
+        if self.path.startswith("/flaky"):
+            StandInHandler.flaky_hits += 1
+            if StandInHandler.flaky_hits % 2 == 1:
+                self._reply(503, b"unavailable")
+                return
+        self._reply(200, b"ok")
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_http_session():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    reset_http_session()
+
+    try:
+        print("Testing keep-alive reuse...")
+        for _ in range(10):
+            assert http_get(f"{base_url}/ok").text == "ok"
+        stats = get_http_stats()["127.0.0.1"]
+        print("Stats:", stats)
+        assert stats["opened"] == 1 and stats["reused"] == 9, stats
+
+        print("Testing transport retries on 503...")
+        response = http_get(f"{base_url}/flaky")
+        assert response.status_code == 200, response.status_code
+
+        print("Testing concurrent requests...")
+        threads = [threading.Thread(target=http_get, args=(f"{base_url}/ok",)) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print("Stats:", get_http_stats()["127.0.0.1"])
+
+        print("Testing async keep-alive reuse...")
+        reset_http_session()
+
+        async def fetch_async():
+            try:
+                for _ in range(10):
+                    assert (await ahttp_get(f"{base_url}/ok")).text == "ok"
+                assert (await ahttp_get(f"{base_url}/flaky")).status_code == 200
+            finally:
+                await aclose_http_session()
+
+        asyncio.run(fetch_async())
+        stats = get_http_stats()["127.0.0.1"]
+        print("Stats:", stats)
+        assert stats["requests"] == 12 and stats["opened"] == 1 and stats["reused"] == 11, stats
+        print("\nSUCCESS: Shared session reuses connections and retries transient errors.")
+    finally:
+        server.shutdown()
+        reset_http_session()
+
+
+if __name__ == "__main__":
+    test_http_session()
@@ -0,0 +1,115 @@
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__))))
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.prebuilt import ToolNode
+
+from tradingagents.agents import create_news_analyst, create_social_media_analyst
+from tradingagents.agents.utils.agent_utils import get_news
+from tradingagents.agents.utils.tool_memo import tool_memo_run
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import set_config
+from tradingagents.graph.conditional_logic import ConditionalLogic
+from tradingagents.graph.setup import GraphSetup
+
+TICKER = "SYNTH"
+TRADE_DATE = "2024-06-28"
+NEWS_ARGS = {"ticker": TICKER, "start_date": "2024-06-21", "end_date": TRADE_DATE}
+VENDOR_LATENCY = 0.5  # long enough for both analysts' calls to overlap
+
+
+class NewsChatModel(BaseChatModel):
+    """Deterministic chat model that asks for the same get_news call, then reports."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "news-fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.bind(**kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        results = [m.content for m in messages if isinstance(m, ToolMessage)]
+        if not results:
+            message = AIMessage(
+                content="",
+                tool_calls=[{"name": "get_news", "args": NEWS_ARGS, "id": "call_get_news"}],
+            )
+        else:
+            message = AIMessage(content="Report:\n" + "\n".join(results))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def test_tool_memo():
+    telemetry_path = os.path.join(tempfile.mkdtemp(), "telemetry.jsonl")
+    set_config({
+        "data_vendors": {"news_data": "local"},
+        "vendor_telemetry_path": telemetry_path,
+        "tool_memo_enabled": True,
+    })
+    vendor_calls = []
+    vendor_lock = threading.Lock()
+
+    def counting_vendor(ticker, start_date, end_date):
+        with vendor_lock:
+            vendor_calls.append((ticker, start_date, end_date))
+        time.sleep(VENDOR_LATENCY)
+        return f"{ticker} news from {start_date} to {end_date}"
+
+    interface.VENDOR_METHODS["get_news"]["local"] = counting_vendor
+
+    llm = NewsChatModel()
+    setup = GraphSetup(llm, llm, {}, None, None, None, None, None, ConditionalLogic())
+    analysts = {
+        "social": setup._create_isolated_analyst(
+            "social", create_social_media_analyst(llm), ToolNode([get_news]), True
+        ),
+        "news": setup._create_isolated_analyst(
+            "news", create_news_analyst(llm), ToolNode([get_news]), False
+        ),
+    }
+    state = {
+        "messages": [HumanMessage(content=TICKER)],
+        "company_of_interest": TICKER,
+        "trade_date": TRADE_DATE,
+    }
+
+    print("Running the social and news analysts concurrently in one memo run...")
+    with tool_memo_run() as memo:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = {
+                name: pool.submit(copy_context().run, node, state, {})
+                for name, node in analysts.items()
+            }
+            reports = {name: future.result() for name, future in futures.items()}
+    stats = memo.stats()
+    print("Vendor calls:", vendor_calls)
+    print("Memo stats:", stats)
+
+    assert len(vendor_calls) == 1, vendor_calls
+    assert stats["calls"] == 2 and stats["saved_calls"] == 1, stats
+    assert stats["saved_by_tool"] == {"get_news": 1}, stats
+    expected = f"{TICKER} news from 2024-06-21 to {TRADE_DATE}"
+    assert expected in reports["social"]["sentiment_report"]
+    assert expected in reports["news"]["news_report"]
+
+    with open(telemetry_path, encoding="utf-8") as f:
+        events = [json.loads(line) for line in f]
+    memo_events = [event for event in events if event["event"] == "tool_memo"]
+    assert len(memo_events) == 1 and memo_events[0]["saved_calls"] == 1, memo_events
+    print("\nSUCCESS: Concurrent analysts share one vendor call and the saving is reported.")
+
+
+if __name__ == "__main__":
+    test_tool_memo()